@@ -0,0 +1,82 @@
+"""Add has_result flag and partial index to workflow executions
+
+Revision ID: add_execution_has_result
+Revises: add_execution_keyset_index
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_execution_has_result"
+down_revision: Union[str, None] = "add_execution_keyset_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+executions = sa.table(
+    "workflow_executions",
+    sa.column("id", sa.Integer),
+    sa.column("result", sa.JSON),
+    sa.column("has_result", sa.Boolean),
+)
+
+
+def _normalize_result(value):
+    # Same shapes as services.execution_service.normalize_result
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, list):
+        return {"items": value}
+    return {"value": value}
+
+
+def upgrade() -> None:
+    op.add_column(
+        "workflow_executions",
+        sa.Column("has_result", sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+
+    # Backfill the flag and store older list/scalar results as dicts
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(executions.c.id, executions.c.result)
+            .where(executions.c.id > last_id, executions.c.result.isnot(None))
+            .order_by(executions.c.id)
+            .limit(BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+        for execution_id, result in rows:
+            if result is None:
+                # JSON 'null' stored instead of SQL NULL
+                continue
+            bind.execute(
+                executions.update()
+                .where(executions.c.id == execution_id)
+                .values(result=_normalize_result(result), has_result=bool(result))
+            )
+        last_id = rows[-1][0]
+
+    op.create_index(
+        "ix_workflow_executions_user_has_result",
+        "workflow_executions",
+        ["user_id", "created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("has_result"),
+        sqlite_where=sa.text("has_result = 1"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_workflow_executions_user_has_result", table_name="workflow_executions"
+    )
+    op.drop_column("workflow_executions", "has_result")
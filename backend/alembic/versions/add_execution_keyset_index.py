@@ -0,0 +1,32 @@
+"""Add (user_id, created_at, id) index to workflow executions
+
+Revision ID: add_execution_keyset_index
+Revises: add_execution_status_index
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_execution_keyset_index"
+down_revision: Union[str, None] = "add_execution_status_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_workflow_executions_user_created_at_id",
+        "workflow_executions",
+        ["user_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_workflow_executions_user_created_at_id", table_name="workflow_executions"
+    )
@@ -0,0 +1,32 @@
+"""Add (status, created_at) index to workflow executions
+
+Revision ID: add_execution_status_index
+Revises: add_trigger_metadata
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_execution_status_index"
+down_revision: Union[str, None] = "add_trigger_metadata"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_workflow_executions_status_created_at",
+        "workflow_executions",
+        ["status", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_workflow_executions_status_created_at", table_name="workflow_executions"
+    )
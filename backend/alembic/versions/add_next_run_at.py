@@ -0,0 +1,52 @@
+"""Add indexed next_run_at to workflow configs
+
+Revision ID: add_next_run_at
+Revises: add_google_auth_001
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_next_run_at"
+down_revision: Union[str, None] = "add_google_auth_001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "workflow_configs",
+        sa.Column("next_run_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    # Backfill: active workflows are due one interval after their last run,
+    # workflows that never ran are due immediately
+    op.execute(
+        """
+        UPDATE workflow_configs
+        SET next_run_at = COALESCE(
+            last_run_at + run_interval_minutes * INTERVAL '1 minute',
+            now()
+        )
+        WHERE is_active = true
+        """
+    )
+
+    op.create_index(
+        "ix_workflow_configs_is_active_next_run_at",
+        "workflow_configs",
+        ["is_active", "next_run_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_workflow_configs_is_active_next_run_at", table_name="workflow_configs"
+    )
+    op.drop_column("workflow_configs", "next_run_at")
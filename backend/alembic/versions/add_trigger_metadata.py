@@ -0,0 +1,164 @@
+"""Add compiled trigger metadata columns to workflow configs
+
+Revision ID: add_trigger_metadata
+Revises: add_next_run_at
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+import re
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_trigger_metadata"
+down_revision: Union[str, None] = "add_next_run_at"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+workflow_configs = sa.table(
+    "workflow_configs",
+    sa.column("id", sa.Integer),
+    sa.column("workflow_config_json", sa.JSON),
+    sa.column("trigger_node_type", sa.String),
+    sa.column("trigger_webhook_path", sa.String),
+    sa.column("trigger_input_fields", sa.JSON),
+)
+
+WEBHOOK_NODE_TYPE = "n8n-nodes-base.webhook"
+
+_INPUT_FIELD_PATTERNS = (
+    re.compile(r"\$json(?:\.body)?\.([A-Za-z_]\w*)"),
+    re.compile(r"\$json(?:\.body)?\[[\"']([^\"']+)[\"']\]"),
+)
+
+
+def _webhook_path(node):
+    params = node.get("parameters") or {}
+    return params.get("path") or params.get("webhookId") or None
+
+
+def _collect_strings(value):
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        return [text for item in value.values() for text in _collect_strings(item)]
+    if isinstance(value, list):
+        return [text for item in value for text in _collect_strings(item)]
+    return []
+
+
+def _compile_trigger_metadata(json_data):
+    # Same extraction as utils.workflow_validator.compile_trigger_metadata
+    nodes = (json_data or {}).get("nodes") or []
+    candidates = [node for node in nodes if isinstance(node, dict)]
+    webhooks = [node for node in candidates if node.get("type") == WEBHOOK_NODE_TYPE]
+    trigger = (
+        next((node for node in webhooks if _webhook_path(node)), None)
+        or next(iter(webhooks), None)
+        or next(
+            (
+                node
+                for node in candidates
+                if str(node.get("type", "")).lower().endswith("trigger")
+            ),
+            None,
+        )
+    )
+    if trigger is None:
+        return {
+            "trigger_node_type": None,
+            "trigger_webhook_path": None,
+            "trigger_input_fields": [],
+        }
+
+    webhook_path = None
+    if trigger.get("type") == WEBHOOK_NODE_TYPE:
+        webhook_path = _webhook_path(trigger)
+
+    connections = (json_data.get("connections") or {}).get(trigger.get("name"), {})
+    next_names = {
+        link.get("node")
+        for outputs in connections.values()
+        for output in outputs or []
+        for link in output or []
+        if isinstance(link, dict)
+    }
+    fields = []
+    for node in candidates:
+        if node.get("name") not in next_names:
+            continue
+        for text in _collect_strings(node.get("parameters")):
+            for pattern in _INPUT_FIELD_PATTERNS:
+                for field in pattern.findall(text):
+                    if field not in fields:
+                        fields.append(field)
+
+    return {
+        "trigger_node_type": trigger.get("type"),
+        "trigger_webhook_path": webhook_path,
+        "trigger_input_fields": fields,
+    }
+
+
+def upgrade() -> None:
+    op.add_column(
+        "workflow_configs",
+        sa.Column("trigger_node_type", sa.String(), nullable=True),
+    )
+    op.add_column(
+        "workflow_configs",
+        sa.Column("trigger_webhook_path", sa.String(), nullable=True),
+    )
+    op.add_column(
+        "workflow_configs",
+        sa.Column("trigger_input_fields", sa.JSON(), nullable=True),
+    )
+    op.create_index(
+        op.f("ix_workflow_configs_trigger_node_type"),
+        "workflow_configs",
+        ["trigger_node_type"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_workflow_configs_trigger_webhook_path"),
+        "workflow_configs",
+        ["trigger_webhook_path"],
+        unique=False,
+    )
+
+    # Backfill: compile the trigger metadata of existing workflows once
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(workflow_configs.c.id, workflow_configs.c.workflow_config_json)
+            .where(workflow_configs.c.id > last_id)
+            .order_by(workflow_configs.c.id)
+            .limit(BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+        for workflow_id, workflow_json in rows:
+            bind.execute(
+                workflow_configs.update()
+                .where(workflow_configs.c.id == workflow_id)
+                .values(**_compile_trigger_metadata(workflow_json))
+            )
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_workflow_configs_trigger_webhook_path"), table_name="workflow_configs"
+    )
+    op.drop_index(
+        op.f("ix_workflow_configs_trigger_node_type"), table_name="workflow_configs"
+    )
+    op.drop_column("workflow_configs", "trigger_input_fields")
+    op.drop_column("workflow_configs", "trigger_webhook_path")
+    op.drop_column("workflow_configs", "trigger_node_type")
@@ -1,5 +1,6 @@
 import logging
 import os
+from typing import Optional
 
 import redis
 from api.auth import get_current_user
@@ -60,8 +61,17 @@ async def check_celery_status(current_user: User = Depends(get_current_user)):
         logger = logging.getLogger(__name__)
         logger.error(f"Celery worker check failed: {str(e)}")
 
+    try:
+        from services.circuit_breaker import get_breaker_states
+
+        n8n_circuits = get_breaker_states()["not_closed"]
+    except Exception as e:
+        n8n_circuits = None
+        logging.getLogger(__name__).error(f"Failed to read n8n circuit states: {str(e)}")
+
     return {
         "redis": {"status": redis_status},
+        "n8n": {"circuits_not_closed": n8n_circuits},
         "celery_worker": {
             "status": worker_status,
             "worker_count": worker_count,
@@ -100,3 +110,90 @@ async def get_celery_tasks(current_user: User = Depends(get_current_user)):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve Celery task information",
         )
+
+
+@router.get("/celery/scheduler")
+async def get_scheduler_metrics(current_user: User = Depends(get_current_user)):
+    """
+    Get scheduler tick metrics (duration, overruns, skipped/overlapping ticks)
+    """
+    try:
+        from services.scheduler_metrics import get_tick_metrics
+
+        return {"ticks": get_tick_metrics()}
+    except Exception as e:
+        logger = logging.getLogger(__name__)
+        logger.error(f"Failed to get scheduler metrics: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve scheduler metrics",
+        )
+
+
+@router.get("/celery/n8n/routes")
+async def get_trigger_route_stats(
+    n8n_workflow_id: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get n8n trigger route counters (success/failure and average latency per
+    route), plus the remembered route scores of one workflow if requested
+    """
+    try:
+        from services.trigger_routes import get_route_stats, get_workflow_routes
+
+        response = {"routes": get_route_stats()}
+        if n8n_workflow_id:
+            response["workflow_routes"] = [
+                {"route": route, "score": score}
+                for route, score in get_workflow_routes(n8n_workflow_id)
+            ]
+        return response
+    except Exception as e:
+        logger = logging.getLogger(__name__)
+        logger.error(f"Failed to get trigger route stats: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve trigger route stats",
+        )
+
+
+@router.get("/celery/n8n/breakers")
+async def get_circuit_breakers(current_user: User = Depends(get_current_user)):
+    """
+    Get n8n circuit breaker states (this process and published by workers)
+    """
+    try:
+        from services.circuit_breaker import get_breaker_states
+
+        return get_breaker_states()
+    except Exception as e:
+        logger = logging.getLogger(__name__)
+        logger.error(f"Failed to get circuit breaker states: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve circuit breaker states",
+        )
+
+
+@router.get("/celery/scheduler/histogram")
+async def get_scheduler_histogram(
+    minutes: int = 60,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Get planned scheduled triggers per minute for the next `minutes` minutes
+    """
+    from datetime import datetime, timezone
+
+    from services.scheduler_service import get_trigger_histogram
+
+    minutes = max(1, min(minutes, 24 * 60))
+    histogram = get_trigger_histogram(db, datetime.now(timezone.utc), minutes)
+    return {
+        "minutes": minutes,
+        "total": sum(bucket["triggers"] for bucket in histogram),
+        "peak": max(bucket["triggers"] for bucket in histogram),
+        "histogram": histogram,
+    }
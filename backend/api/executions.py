@@ -1,24 +1,31 @@
 import csv
 import io
-from typing import List
+from datetime import datetime
+from typing import Optional
 
+from app.config import settings
 from app.database import get_db
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
 from fastapi.responses import StreamingResponse
 from models.user import User
 from schemas.execution import (
-    ExecutionDataRow,
+    ExecutionCallback,
+    ExecutionCallbackResponse,
+    ExecutionDataPage,
+    ExecutionEventsToken,
     ExecutionStatusUpdate,
+    WorkflowExecutionBatchCreate,
+    WorkflowExecutionBatchResponse,
     WorkflowExecutionCreate,
+    WorkflowExecutionPage,
     WorkflowExecutionResponse,
 )
 from services.execution_service import ExecutionService
 from sqlalchemy.orm import Session
 from tasks import check_and_trigger_n8n_workflows
-from utils.dependencies import get_current_user
+from utils.dependencies import get_current_user, get_stream_user
 from utils.exceptions import (
     raise_execution_not_found_error,
-    raise_unsupported_format_error,
     raise_workflow_operation_error,
 )
 from utils.logger import execution_logger
@@ -26,67 +33,103 @@ from utils.logger import execution_logger
 router = APIRouter(prefix="/executions", tags=["executions"])
 
 
-@router.get("", response_model=List[WorkflowExecutionResponse])
+@router.get("", response_model=WorkflowExecutionPage)
 async def get_executions(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+    limit: int = Query(
+        settings.EXECUTIONS_PAGE_DEFAULT_SIZE, ge=1, le=settings.EXECUTIONS_PAGE_MAX_SIZE
+    ),
+    cursor: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    workflow_config_id: Optional[int] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Executions of the current user, newest first, one page at a time.
+    Pass the returned next_cursor as ?cursor= to get the following page.
+    """
+    return ExecutionService.get_user_executions_page(
+        db,
+        current_user,
+        limit,
+        cursor=cursor,
+        status=status_filter,
+        workflow_config_id=workflow_config_id,
+        created_from=created_from,
+        created_to=created_to,
+    )
+
+
+@router.get("/events")
+async def stream_execution_events(
+    request: Request,
+    ids: Optional[str] = None,
+    current_user: User = Depends(get_stream_user),
 ):
-    """Get all executions for current user"""
-    return ExecutionService.get_user_executions(db, current_user)
+    """
+    Server-Sent Events ("execution" events) with status changes of the
+    current user's executions, or only of the comma-separated ?ids=.
+    Starts with the current state of the requested executions; replaces
+    polling GET /executions/{id}. Authenticates with the Authorization
+    header or a ?stream_token= from POST /executions/events/token.
+    """
+    return ExecutionService.stream_execution_events(request, current_user, ids)
+
+
+@router.post("/events/token", response_model=ExecutionEventsToken)
+async def create_execution_events_token(
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Short-lived token that only opens the events stream, for clients that
+    cannot send headers (EventSource) and would otherwise put the access
+    token in the URL
+    """
+    return ExecutionService.create_execution_events_token(current_user)
 
 
 @router.get("/export")
 async def export_executions(
     format: str = "csv",
+    row_group_size: Optional[int] = Query(None, ge=1, le=settings.EXPORT_MAX_BATCH_SIZE),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
 ):
     """
     Export executions for current user
-    TODO: Add support for other formats (JSON, Excel, etc.)
+    Formats: csv, ndjson, parquet and arrow;
+    row_group_size sets the rows per DB fetch, chunk and Parquet row group
     """
-    fmt = format.lower()
-    if fmt != "csv":
-        raise_unsupported_format_error("export", ["csv"])
-
-    return ExecutionService.export_executions_csv(db, current_user)
+    return ExecutionService.export_executions(current_user, format, row_group_size)
 
 
-@router.get("/data", response_model=list[ExecutionDataRow])
+@router.get("/data", response_model=ExecutionDataPage)
 async def get_executions_data(
+    limit: int = Query(
+        settings.EXECUTIONS_PAGE_DEFAULT_SIZE, ge=1, le=settings.EXECUTIONS_PAGE_MAX_SIZE
+    ),
+    cursor: Optional[str] = None,
+    workflow_config_id: Optional[int] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    rows: list[ExecutionDataRow] = []
-
-    # Get data from database executions
-    executions = ExecutionService.get_user_executions(db, current_user)
-    for ex in executions:
-        # We only return rows where there is some result JSON
-        if not ex.result:
-            continue
-
-        # Normalise different possible shapes of result:
-        data: dict
-        if isinstance(ex.result, dict):
-            data = ex.result
-        elif isinstance(ex.result, list):
-            data = {"items": ex.result}
-        else:
-            # Fallback: just put raw value under "value" key
-            data = {"value": ex.result}
-
-        rows.append(
-            ExecutionDataRow(
-                execution_id=ex.id,
-                workflow_config_id=ex.workflow_config_id,
-                created_at=ex.created_at,
-                completed_at=ex.completed_at,
-                data=data,
-                source="database",
-            )
-        )
-
-    return rows
+    """
+    Result data of the current user's executions, newest first, one page at
+    a time (executions without a result are skipped in SQL).
+    Pass the returned next_cursor as ?cursor= to get the following page.
+    """
+    return ExecutionService.get_user_execution_data_page(
+        db,
+        current_user,
+        limit,
+        cursor=cursor,
+        workflow_config_id=workflow_config_id,
+        created_from=created_from,
+        created_to=created_to,
+    )
 
 
 @router.get("/{execution_id}", response_model=WorkflowExecutionResponse)
@@ -114,18 +157,52 @@ async def create_execution_endpoint(
         f"user_id={current_user.id}, keywords='{execution_data.keywords}', location='{execution_data.location}'"
     )
     try:
-        execution = ExecutionService.create_execution(db, execution_data, current_user)
+        execution = await ExecutionService.create_execution(db, execution_data, current_user)
         execution_logger.log_operation(
             "execution_creation",
             "successful",
             f"execution_id={execution.id}, user_id={current_user.id}"
         )
         return execution
+    except HTTPException:
+        raise
     except Exception as exc:
         execution_logger.log_error(exc, "execution creation")
         raise_workflow_operation_error("Failed to create execution")
 
 
+@router.post(
+    "/batch",
+    response_model=WorkflowExecutionBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_executions_batch_endpoint(
+    batch_data: WorkflowExecutionBatchCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Create executions for many keyword/location pairs and trigger them"""
+    execution_logger.log_operation(
+        "execution_batch_creation",
+        "started",
+        f"user_id={current_user.id}, pairs={len(batch_data.pairs)}, "
+        f"keywords={len(batch_data.keywords)}, locations={len(batch_data.locations)}"
+    )
+    try:
+        batch = await ExecutionService.create_executions_batch(db, batch_data, current_user)
+        execution_logger.log_operation(
+            "execution_batch_creation",
+            "successful",
+            f"executions={batch['total']}, failed={batch['failed']}, user_id={current_user.id}"
+        )
+        return batch
+    except HTTPException:
+        raise
+    except Exception as exc:
+        execution_logger.log_error(exc, "execution batch creation")
+        raise_workflow_operation_error("Failed to create executions")
+
+
 @router.post("/{execution_id}/cancel", response_model=WorkflowExecutionResponse)
 async def cancel_execution_endpoint(
     execution_id: int,
@@ -133,7 +210,7 @@ async def cancel_execution_endpoint(
     db: Session = Depends(get_db),
 ):
     """Cancel an execution"""
-    execution = ExecutionService.cancel_execution(db, execution_id, current_user)
+    execution = await ExecutionService.cancel_execution(db, execution_id, current_user)
     return execution
 
 
@@ -151,6 +228,23 @@ async def update_execution_status_endpoint(
     return execution
 
 
+@router.post("/{execution_id}/callback", response_model=ExecutionCallbackResponse)
+async def execution_callback_endpoint(
+    execution_id: int,
+    callback: ExecutionCallback,
+    x_execution_token: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Completion callback for n8n workflows (no user session): authenticated by
+    the callback_token sent with the trigger in the X-Execution-Token header
+    (never in the URL, which ends up in access logs)
+    """
+    return ExecutionService.apply_execution_callback(
+        db, execution_id, callback, x_execution_token
+    )
+
+
 @router.post("/trigger-celery-task")
 async def trigger_celery_task_manually(current_user: User = Depends(get_current_user)):
     """Manually trigger Celery task to check and run workflows (for testing)"""
@@ -1,7 +1,9 @@
-from typing import List
+from typing import List, Optional
+
+from app.config import settings
 
 from app.database import get_db
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from models.linkedin_result import LinkedinResult
 from models.user import User
 from schemas.linkedin import LinkedinResultResponse
@@ -27,7 +29,20 @@ async def get_linkedin_results(
     )
 
 
-@router.get("/debug")
+@router.get("/export")
+async def export_linkedin_results(
+    format: str = "csv",
+    row_group_size: Optional[int] = Query(None, ge=1, le=settings.EXPORT_MAX_BATCH_SIZE),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Export LinkedIn results for the current user
+    Formats: csv, ndjson, parquet and arrow
+    """
+    return LinkedinService.export_user_linkedin_results(current_user, format, row_group_size)
+
+
+@router.get("/debug", response_model=List[LinkedinResultResponse])
 async def get_all_linkedin_results_debug(db: Session = Depends(get_db)) -> List[LinkedinResult]:
     """
     Get all LinkedIn results for debugging purposes
@@ -16,6 +16,80 @@ class Settings(BaseSettings):
     N8N_API_URL: Optional[str] = None
     N8N_API_KEY: Optional[str] = None
     N8N_WEBHOOK_URL: str
+    N8N_HTTP_MAX_CONNECTIONS: int = 100  # Shared client pool size (per process)
+    N8N_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20  # Idle connections kept open
+    N8N_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0  # Idle connection lifetime
+    N8N_HTTP2_ENABLED: bool = False  # Negotiate HTTP/2 with n8n over TLS (h2 via httpx[http2])
+    N8N_WORKFLOW_CHECK_ON_TRIGGER: bool = True  # Existence check before manual triggers
+    N8N_WORKFLOW_CACHE_TTL_SECONDS: int = 300  # Cached workflow metadata lifetime
+    N8N_WORKFLOW_CACHE_MISSING_TTL_SECONDS: int = 30  # Lifetime of "not found" entries
+    N8N_WORKFLOW_CACHE_MAX_ENTRIES: int = 1000  # In-memory cache bound (memory backend)
+    N8N_ROUTE_MEMORY_ENABLED: bool = True  # Try the trigger route that last worked first
+    N8N_ROUTE_HALF_LIFE_SECONDS: int = 6 * 3600  # Decay of remembered route outcomes
+    N8N_ROUTE_REPROBE_RATE: float = 0.05  # Share of triggers that use the default order
+    N8N_BREAKER_ENABLED: bool = True  # Per-endpoint circuit breakers
+    N8N_BREAKER_FAILURE_RATE: float = 0.5  # Failure share in the window that opens it
+    N8N_BREAKER_MIN_CALLS: int = 5  # Calls in the window before the rate counts
+    N8N_BREAKER_WINDOW_SECONDS: int = 60  # Rolling window for the failure rate
+    N8N_BREAKER_OPEN_SECONDS: int = 30  # Fail-fast period before a half-open probe
+    N8N_BREAKER_HALF_OPEN_MAX_CALLS: int = 1  # Probe calls let through when half-open
+    N8N_RETRY_ATTEMPTS: int = 3  # Tries for idempotent calls (status, workflow lookup)
+    N8N_RETRY_BASE_DELAY_SECONDS: float = 0.5  # Backoff base (doubles per retry, jittered)
+    N8N_RETRY_MAX_DELAY_SECONDS: float = 5.0  # Backoff cap
+    N8N_RESULT_SINK: str = "none"  # Stream result items to "linkedin_results"/"file"; "none" buffers
+    N8N_RESULT_SINK_BATCH_SIZE: int = 500  # Rows per insert of the linkedin_results sink
+    N8N_RESULT_FILE_DIR: str = "results"  # Directory of the "file" sink (one .jsonl per execution)
+
+    # Public base URL of this API as reachable from n8n (for completion callbacks)
+    EXECUTION_CALLBACK_BASE_URL: Optional[str] = None
+
+    # Execution lists (GET /api/executions)
+    EXECUTIONS_PAGE_DEFAULT_SIZE: int = 50  # Executions per page without ?limit=
+    EXECUTIONS_PAGE_MAX_SIZE: int = 200  # Largest accepted ?limit=
+
+    # Execution status push (GET /api/executions/events, Server-Sent Events)
+    EXECUTION_EVENTS_HEARTBEAT_SECONDS: float = 15.0  # Keepalive comment interval
+    EXECUTION_EVENTS_QUEUE_SIZE: int = 100  # Events buffered per stream (oldest dropped)
+    EXECUTION_EVENTS_MAX_IDS: int = 200  # Execution IDs one stream may watch
+    EXECUTION_EVENTS_RETRY_MS: int = 3000  # Client reconnect delay sent to EventSource
+    EXECUTION_EVENTS_TOKEN_TTL_SECONDS: int = 60  # Lifetime of ?stream_token= (opening only)
+
+    # Exports (GET /api/executions/export, /api/linkedin-results/export)
+    EXPORT_BATCH_SIZE: int = 1000  # Rows fetched from the DB cursor and sent per chunk/row group
+    EXPORT_MAX_BATCH_SIZE: int = 100_000  # Largest accepted ?row_group_size=
+
+    # Batch executions (POST /api/executions/batch)
+    EXECUTION_BATCH_MAX_SIZE: int = 500  # Max keyword/location pairs per request
+    EXECUTION_BATCH_TRIGGER_CONCURRENCY: int = 10  # Parallel n8n triggers per request
+
+    # Reconciliation of pending/running executions against n8n's executions list
+    RECONCILE_INTERVAL_SECONDS: int = 300  # Beat interval of the sweep
+    RECONCILE_WINDOW_HOURS: int = 24  # Only executions created this recently are matched
+    RECONCILE_PAGE_SIZE: int = 250  # n8n executions per listing page
+    RECONCILE_MAX_PAGES: int = 20  # Listing pages per workflow and sweep
+    RECONCILE_LOCK_TTL_SECONDS: int = 600  # Single-flight lease of one sweep
+    EXECUTION_STALE_AFTER_HOURS: int = 24  # Unfinished executions older than this become errors
+
+    # Redis used for cross-process coordination (falls back to CELERY_BROKER_URL)
+    REDIS_URL: Optional[str] = None
+    COORDINATION_BACKEND: str = "redis"  # "redis" or "memory" (single process/tests)
+
+    # Scheduler
+    SCHEDULER_MODE: str = "beat"  # "beat" (15-min ticks) or "timer" (run_timer_scheduler.py)
+    SCHEDULER_TIMER_MAX_SLEEP_SECONDS: float = 1.0  # Timer scheduler wake-up resolution
+    SCHEDULER_JITTER_ENABLED: bool = True  # Spread fire times by a hash of the workflow ID
+    SCHEDULER_FAIR_SCAN_LIMIT: int = 5000  # Due rows considered for fair-share per tick
+    SCHEDULER_USER_RATE_PER_MINUTE: float = 0  # Per-user trigger rate (0 = unlimited)
+    SCHEDULER_USER_BURST: int = 20  # Per-user bucket capacity
+    SCHEDULER_GLOBAL_RATE_PER_MINUTE: float = 0  # Overall trigger rate (0 = unlimited)
+    SCHEDULER_GLOBAL_BURST: int = 500  # Global bucket capacity
+    SCHEDULER_BATCH_SIZE: int = 500  # Max due workflows picked up per tick
+    SCHEDULER_TRIGGER_CONCURRENCY: int = 20  # Parallel n8n triggers per tick
+    SCHEDULER_SHARDED: bool = True  # Dispatch due workflows as Celery subtasks
+    SCHEDULER_CHUNK_SIZE: int = 50  # Workflows per subtask
+    SCHEDULER_CLAIM_LEASE_SECONDS: int = 15 * 60  # Re-dispatch delay for unfinished chunks
+    SCHEDULER_TICK_INTERVAL_SECONDS: int = 15 * 60  # Celery beat interval
+    SCHEDULER_LOCK_TTL_SECONDS: int = 30 * 60  # Lease of the single-flight tick lock
 
     model_config = {
         "env_file": ".env",
@@ -8,6 +8,7 @@ from models.user import User
 from models.workflow import WorkflowConfig
 from models.execution import WorkflowExecution
 from models.linkedin_result import LinkedinResult
+from services.n8n_service import n8n_service
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -118,4 +119,10 @@ async def health():
 @app.on_event("startup")
 async def startup_event():
     logger.info(" Starting N8N Automation API...")
+    await n8n_service.start()
     logger.info(" API ready to work!")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await n8n_service.aclose()
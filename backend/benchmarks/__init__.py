@@ -0,0 +1,4 @@
+"""
+Local benchmarks for the scheduler and the n8n integration.
+They never talk to a real n8n instance; see the module docstrings for usage.
+"""
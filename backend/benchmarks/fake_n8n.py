@@ -0,0 +1,88 @@
+"""
+In-process stand-in for n8n used by the benchmarks.
+Replaces N8NService.trigger_workflow with a coroutine that sleeps for a
+configurable latency and fails at a configurable rate. With a result sink
+the body goes through the same streaming parser as real responses.
+"""
+
+import asyncio
+import json
+import random
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+import httpx
+from services.n8n_service import n8n_service
+from utils.json_stream import stream_json_items
+
+
+class FakeN8NError(Exception):
+    """Simulated n8n failure"""
+
+
+async def _one_chunk(data: bytes):
+    yield data
+
+
+class FakeN8N:
+    """Fake trigger endpoint with latency (+ jitter) and a failure rate"""
+
+    def __init__(
+        self,
+        latency_ms: float = 50.0,
+        jitter_ms: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def trigger_workflow(
+        self,
+        workflow_id: str,
+        data: Dict[str, Any],
+        webhook_path: Optional[str] = None,
+        workflow_json: Optional[Dict[str, Any]] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        check_workflow: Optional[bool] = None,
+        sink=None,
+    ) -> Any:
+        self.calls += 1
+        # Taken before awaiting: concurrent calls must not share an execution ID
+        call_number = self.calls
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            delay_ms = self.latency_ms + self.random.uniform(0, self.jitter_ms)
+            await asyncio.sleep(max(delay_ms, 0) / 1000.0)
+            if self.random.random() < self.failure_rate:
+                self.failures += 1
+                raise FakeN8NError(f"Simulated n8n failure for workflow {workflow_id}")
+            body = {
+                "executionId": f"fake-{call_number}",
+                "items": [{"execution_id": data.get("execution_id")}],
+            }
+            if sink is None:
+                return body
+            return await stream_json_items(_one_chunk(json.dumps(body).encode()), sink)
+        finally:
+            self.in_flight -= 1
+
+    @contextmanager
+    def installed(self):
+        """Route n8n_service.trigger_workflow to this fake while active"""
+        original = n8n_service.trigger_workflow
+        n8n_service.trigger_workflow = self.trigger_workflow
+        try:
+            yield self
+        finally:
+            n8n_service.trigger_workflow = original
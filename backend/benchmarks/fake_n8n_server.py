@@ -0,0 +1,348 @@
+"""
+Fake n8n server (ASGI) for offline load tests.
+
+Implements the parts of n8n that N8NService talks to:
+    GET/POST /api/v1/workflows, GET/PUT/DELETE /api/v1/workflows/{id}
+    POST /api/v1/workflows/{id}/activate, POST /api/v1/workflows/{id}/execute
+    GET /api/v1/executions, GET /api/v1/executions/{id}
+    POST /api/v1/executions/{id}/stop
+    POST /webhook/{path}
+State lives in memory. Every request waits latency_ms (+ jitter) and fails
+with error_status at error_rate. Triggers either acknowledge the start
+("ack": the execution finishes execution_seconds later and shows up in the
+executions listing) or return result_items items of item_bytes each
+("result", streamed so large bodies cost the server no memory).
+
+The behaviour can be changed at runtime: GET/PATCH /__fake/config,
+GET /__fake/stats, POST /__fake/reset.
+
+Usage (from backend/):
+    python -m benchmarks.fake_n8n_server --port 5679 --latency-ms 100 --error-rate 0.05
+then point N8N_API_URL at http://127.0.0.1:5679 and N8N_WEBHOOK_URL at
+http://127.0.0.1:5679/webhook.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+WEBHOOK_NODE_TYPE = "n8n-nodes-base.webhook"
+
+
+@dataclass
+class FakeN8NConfig:
+    latency_ms: float = 20.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0  # Share of requests answered with error_status
+    error_status: int = 503
+    failing_routes: List[str] = field(default_factory=list)  # "webhook"/"execute": always 404
+    respond: str = "ack"  # "ack" or "result"
+    result_items: int = 10  # Items per "result" response
+    item_bytes: int = 200  # Approximate size of one item
+    execution_seconds: float = 0.0  # Time until an acknowledged execution finishes
+    execution_error_rate: float = 0.0  # Share of executions that end with "error"
+    seed: Optional[int] = None
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class FakeN8NState:
+    """Workflows, executions and request counters of one fake instance"""
+
+    def __init__(self, config: FakeN8NConfig):
+        self.config = config
+        self.reset()
+
+    def reset(self) -> None:
+        self.random = random.Random(self.config.seed)
+        self.workflows: Dict[str, Dict[str, Any]] = {}
+        self.executions: Dict[int, Dict[str, Any]] = {}
+        self.execution_ids = itertools.count(1)
+        self.workflow_ids = itertools.count(1)
+        self.requests: Counter = Counter()
+        self.errors: Counter = Counter()
+
+    async def simulate(self, route: str) -> None:
+        """Count the request, wait the configured latency, maybe fail"""
+        self.requests[route] += 1
+        config = self.config
+        delay_ms = config.latency_ms + self.random.uniform(0, config.jitter_ms)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000.0)
+        if route in config.failing_routes:
+            self.errors[route] += 1
+            raise HTTPException(status_code=404, detail=f"{route} route disabled")
+        if self.random.random() < config.error_rate:
+            self.errors[route] += 1
+            raise HTTPException(status_code=config.error_status, detail="Simulated n8n error")
+
+    def get_workflow(self, workflow_id: str) -> Dict[str, Any]:
+        """Stored workflow, or a synthetic webhook workflow for unknown IDs"""
+        workflow = self.workflows.get(workflow_id)
+        if workflow is None:
+            workflow = {
+                "id": workflow_id,
+                "name": f"Fake workflow {workflow_id}",
+                "active": True,
+                "nodes": [
+                    {
+                        "name": "Webhook",
+                        "type": WEBHOOK_NODE_TYPE,
+                        "parameters": {"path": workflow_id},
+                    }
+                ],
+                "connections": {},
+            }
+        return workflow
+
+    def workflow_for_path(self, path: str) -> str:
+        """Workflow whose webhook node listens on `path` (synthetic ones use their ID)"""
+        for workflow_id, workflow in self.workflows.items():
+            for node in workflow.get("nodes") or []:
+                if (
+                    node.get("type") == WEBHOOK_NODE_TYPE
+                    and (node.get("parameters") or {}).get("path", "").strip("/") == path
+                ):
+                    return workflow_id
+        return path
+
+    def start_execution(self, workflow_id: str) -> Dict[str, Any]:
+        now = time.time()
+        failed = self.random.random() < self.config.execution_error_rate
+        execution = {
+            "id": next(self.execution_ids),
+            "workflowId": workflow_id,
+            "startedAt": now,
+            "stoppedAt": now + self.config.execution_seconds,
+            "final_status": "error" if failed else "success",
+        }
+        self.executions[execution["id"]] = execution
+        return execution
+
+    def describe(self, execution: Dict[str, Any]) -> Dict[str, Any]:
+        finished = time.time() >= execution["stoppedAt"]
+        status = execution["final_status"] if finished else "running"
+        return {
+            "id": str(execution["id"]),
+            "workflowId": execution["workflowId"],
+            "status": status,
+            "finished": finished and status == "success",
+            "mode": "webhook",
+            "startedAt": _iso(execution["startedAt"]),
+            "stoppedAt": _iso(execution["stoppedAt"]) if finished else None,
+        }
+
+    def trigger_response(self, execution: Dict[str, Any]):
+        if self.config.respond != "result":
+            return {"executionId": str(execution["id"])}
+        return StreamingResponse(
+            self._result_chunks(execution), media_type="application/json"
+        )
+
+    def _result_chunks(self, execution: Dict[str, Any]) -> Iterator[bytes]:
+        filler = "x" * max(self.config.item_bytes - 120, 0)
+        yield f'{{"executionId": "{execution["id"]}", "data": ['.encode()
+        for number in range(self.config.result_items):
+            item = {
+                "Title": f"Fake vacancy {number}",
+                "Vacancy": f"https://www.linkedin.com/jobs/view/{execution['id']}{number}",
+                "Description": filler,
+            }
+            yield (", " if number else "").encode() + json.dumps(item).encode()
+        yield b"]}"
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": dict(self.requests),
+            "errors": dict(self.errors),
+            "workflows": len(self.workflows),
+            "executions": len(self.executions),
+        }
+
+
+def create_fake_n8n_app(config: Optional[FakeN8NConfig] = None) -> FastAPI:
+    state = FakeN8NState(config or FakeN8NConfig())
+    app = FastAPI(title="Fake n8n")
+    app.state.fake = state
+
+    @app.get("/api/v1/workflows")
+    async def list_workflows():
+        await state.simulate("workflows")
+        return {"data": list(state.workflows.values()), "nextCursor": None}
+
+    @app.post("/api/v1/workflows")
+    async def create_workflow(request: Request):
+        await state.simulate("workflows")
+        workflow = await request.json()
+        workflow_id = f"fake-{next(state.workflow_ids)}"
+        state.workflows[workflow_id] = {**workflow, "id": workflow_id, "active": False}
+        return state.workflows[workflow_id]
+
+    @app.get("/api/v1/workflows/{workflow_id}")
+    async def get_workflow(workflow_id: str):
+        await state.simulate("workflows")
+        return state.get_workflow(workflow_id)
+
+    @app.put("/api/v1/workflows/{workflow_id}")
+    async def update_workflow(workflow_id: str, request: Request):
+        await state.simulate("workflows")
+        workflow = {**state.get_workflow(workflow_id), **(await request.json())}
+        state.workflows[workflow_id] = {**workflow, "id": workflow_id}
+        return state.workflows[workflow_id]
+
+    @app.delete("/api/v1/workflows/{workflow_id}")
+    async def delete_workflow(workflow_id: str):
+        await state.simulate("workflows")
+        if state.workflows.pop(workflow_id, None) is None:
+            raise HTTPException(status_code=404, detail="Workflow not found")
+        return {"id": workflow_id}
+
+    @app.post("/api/v1/workflows/{workflow_id}/activate")
+    async def activate_workflow(workflow_id: str, request: Request):
+        await state.simulate("workflows")
+        body = await request.json() if await request.body() else {}
+        workflow = state.get_workflow(workflow_id)
+        state.workflows[workflow_id] = {**workflow, "active": body.get("active", True)}
+        return state.workflows[workflow_id]
+
+    @app.post("/api/v1/workflows/{workflow_id}/execute")
+    async def execute_workflow(workflow_id: str):
+        await state.simulate("execute")
+        return state.trigger_response(state.start_execution(workflow_id))
+
+    @app.post("/webhook/{path:path}")
+    async def webhook(path: str):
+        await state.simulate("webhook")
+        return state.trigger_response(state.start_execution(state.workflow_for_path(path)))
+
+    @app.get("/api/v1/executions")
+    async def list_executions(
+        workflowId: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ):
+        await state.simulate("executions")
+        # Newest first; the cursor is the last execution ID already returned
+        before = int(cursor) if cursor else None
+        page: List[Dict[str, Any]] = []
+        for execution_id in sorted(state.executions, reverse=True):
+            if before is not None and execution_id >= before:
+                continue
+            execution = state.executions[execution_id]
+            if workflowId and execution["workflowId"] != workflowId:
+                continue
+            described = state.describe(execution)
+            if status and described["status"] != status:
+                continue
+            page.append(described)
+            if len(page) > limit:
+                break
+        next_cursor = page[limit - 1]["id"] if len(page) > limit else None
+        return {"data": page[:limit], "nextCursor": next_cursor}
+
+    @app.get("/api/v1/executions/{execution_id}")
+    async def get_execution(execution_id: int):
+        await state.simulate("executions")
+        execution = state.executions.get(execution_id)
+        if execution is None:
+            raise HTTPException(status_code=404, detail="Execution not found")
+        return state.describe(execution)
+
+    @app.post("/api/v1/executions/{execution_id}/stop")
+    async def stop_execution(execution_id: int):
+        await state.simulate("executions")
+        execution = state.executions.get(execution_id)
+        if execution is None:
+            raise HTTPException(status_code=404, detail="Execution not found")
+        execution["stoppedAt"] = min(execution["stoppedAt"], time.time())
+        execution["final_status"] = "canceled"
+        return state.describe(execution)
+
+    @app.get("/__fake/config")
+    async def get_config():
+        return asdict(state.config)
+
+    @app.patch("/__fake/config")
+    async def update_config(request: Request):
+        known = {config_field.name for config_field in fields(FakeN8NConfig)}
+        for name, value in (await request.json()).items():
+            if name not in known:
+                raise HTTPException(status_code=400, detail=f"Unknown setting '{name}'")
+            setattr(state.config, name, value)
+        return asdict(state.config)
+
+    @app.get("/__fake/stats")
+    async def get_stats():
+        return state.stats()
+
+    @app.post("/__fake/reset")
+    async def reset():
+        state.reset()
+        return state.stats()
+
+    return app
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    """Fake n8n options, shared with the load driver"""
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument(
+        "--failing-route",
+        action="append",
+        choices=("webhook", "execute"),
+        default=[],
+        help="Trigger route that always answers 404 (exercises the fallback)",
+    )
+    parser.add_argument("--respond", choices=("ack", "result"), default="ack")
+    parser.add_argument("--result-items", type=int, default=10)
+    parser.add_argument("--item-bytes", type=int, default=200)
+    parser.add_argument("--execution-seconds", type=float, default=0.0)
+    parser.add_argument("--execution-error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+
+
+def config_from_args(args: argparse.Namespace) -> FakeN8NConfig:
+    return FakeN8NConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        failing_routes=list(args.failing_route),
+        respond=args.respond,
+        result_items=args.result_items,
+        item_bytes=args.item_bytes,
+        execution_seconds=args.execution_seconds,
+        execution_error_rate=args.execution_error_rate,
+        seed=args.seed,
+    )
+
+
+def main(argv=None) -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run a fake n8n server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5679)
+    add_config_arguments(parser)
+    args = parser.parse_args(argv)
+    uvicorn.run(create_fake_n8n_app(config_from_args(args)), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
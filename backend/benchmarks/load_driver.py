@@ -0,0 +1,475 @@
+"""
+End-to-end load test of the n8n integration against the fake n8n server.
+
+Starts benchmarks.fake_n8n_server on a local port, points N8N_API_URL and
+N8N_WEBHOOK_URL at it and drives the real code paths over HTTP:
+    api        POST /api/executions (one trigger per request)
+    batch      POST /api/executions/batch
+    scheduler  tasks.check_and_trigger_n8n_workflows (Celery, run eagerly)
+    status     N8NService.get_execution_status for the executions created
+    reconcile  tasks.reconcile_pending_executions
+Reports per scenario the throughput and p50/p95/p99 latencies, both of the
+operation itself and of the n8n calls it made (by endpoint). Use a
+throwaway database - the tables are created, filled and dropped again.
+
+Usage (from backend/):
+    python -m benchmarks.load_driver --requests 500 --concurrency 50 --latency-ms 100
+    python -m benchmarks.load_driver --scenario api --failing-route webhook --json
+    python -m benchmarks.load_driver --respond result --result-items 5000 --error-rate 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.fake_n8n_server import (
+    add_config_arguments,
+    config_from_args,
+    create_fake_n8n_app,
+)
+
+SCENARIOS = ("api", "batch", "scheduler", "status", "reconcile")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load-test the n8n integration")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=SCENARIOS,
+        help="Scenario to run (repeatable, default: all in the order above)",
+    )
+    parser.add_argument(
+        "--database-url",
+        help="Dedicated SQLite/Postgres database (default: temporary SQLite file)",
+    )
+    parser.add_argument("--requests", type=int, default=200, help="API requests (api scenario)")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--workflows", type=int, default=50)
+    parser.add_argument("--batch-requests", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=20, help="Pairs per batch request")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--verbose", action="store_true")
+    add_config_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def configure_environment(args: argparse.Namespace) -> None:
+    """
+    Settings and the engine are created at import time, so the environment
+    has to be in place before any app module is imported
+    """
+    args.port = free_port()
+    args.temp_dir = None
+    if not args.database_url:
+        args.temp_dir = tempfile.mkdtemp(prefix="load_driver_")
+        args.database_url = "sqlite:///" + os.path.join(args.temp_dir, "load.db")
+    fake_url = f"http://127.0.0.1:{args.port}"
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["N8N_API_URL"] = fake_url
+    os.environ["N8N_WEBHOOK_URL"] = f"{fake_url}/webhook"
+    os.environ["N8N_API_KEY"] = "load-test"
+    os.environ["COORDINATION_BACKEND"] = "memory"
+    os.environ["SCHEDULER_MODE"] = "beat"
+    os.environ["SCHEDULER_BATCH_SIZE"] = str(args.workflows)
+    os.environ["SCHEDULER_FAIR_SCAN_LIMIT"] = str(args.workflows)
+    os.environ["EXECUTION_BATCH_MAX_SIZE"] = str(max(args.batch_size, 1))
+    os.environ.setdefault("SECRET_KEY", "load-test")
+    os.environ.setdefault("ALGORITHM", "HS256")
+
+
+class FakeN8NServer:
+    """Fake n8n served by uvicorn in a background thread"""
+
+    def __init__(self, app, port: int):
+        import uvicorn
+
+        self.server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+        )
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def __enter__(self) -> "FakeN8NServer":
+        self.thread.start()
+        deadline = time.monotonic() + 10
+        while not self.server.started:
+            if time.monotonic() > deadline or not self.thread.is_alive():
+                raise RuntimeError("Fake n8n server did not start")
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.server.should_exit = True
+        self.thread.join(timeout=10)
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of already sorted values"""
+    if not values:
+        return None
+    rank = max(int(round(q / 100.0 * len(values) + 0.5)) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+
+def summarize(samples: List[Tuple[float, bool]]) -> Dict[str, Any]:
+    latencies = sorted(seconds * 1000 for seconds, _ in samples)
+    return {
+        "count": len(samples),
+        "errors": sum(1 for _, ok in samples if not ok),
+        **{
+            f"p{q}_ms": round(value, 1) if value is not None else None
+            for q, value in ((q, percentile(latencies, q)) for q in (50, 95, 99))
+        },
+    }
+
+
+class N8NCallLog:
+    """Latency of every n8n request, recorded through httpx event hooks"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[Tuple[float, bool]]] = defaultdict(list)
+
+    @staticmethod
+    def kind(path: str) -> str:
+        if path.startswith("/webhook/"):
+            return "webhook"
+        if path.endswith("/execute"):
+            return "execute"
+        if path.startswith("/api/v1/executions"):
+            return "executions"
+        return "workflows"
+
+    async def on_request(self, request) -> None:
+        request.extensions["load_driver_started"] = time.perf_counter()
+
+    async def on_response(self, response) -> None:
+        started = response.request.extensions.get("load_driver_started")
+        if started is not None:
+            self.samples[self.kind(response.request.url.path)].append(
+                (time.perf_counter() - started, response.status_code < 400)
+            )
+
+    def install(self, n8n_service) -> None:
+        """Hook every client the n8n service builds (one per event loop)"""
+        build_client = n8n_service._build_client
+
+        def build_instrumented_client():
+            client = build_client()
+            client.event_hooks["request"].append(self.on_request)
+            client.event_hooks["response"].append(self.on_response)
+            return client
+
+        n8n_service._build_client = build_instrumented_client
+
+    def take(self) -> Dict[str, Any]:
+        """Summary of the calls since the last take()"""
+        summary = {kind: summarize(samples) for kind, samples in sorted(self.samples.items())}
+        self.samples.clear()
+        return summary
+
+
+async def run_concurrently(
+    count: int, concurrency: int, operation: Callable[[int], Awaitable[bool]]
+) -> List[Tuple[float, bool]]:
+    """Run operation(0..count-1) with at most `concurrency` in flight"""
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def timed(number: int) -> Tuple[float, bool]:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                ok = await operation(number)
+            except Exception as e:
+                logging.getLogger(__name__).debug(f"Operation {number} failed: {str(e)}")
+                ok = False
+            return time.perf_counter() - started, ok
+
+    return await asyncio.gather(*(timed(number) for number in range(count)))
+
+
+def scenario_report(
+    name: str, samples: List[Tuple[float, bool]], wall_seconds: float, calls: N8NCallLog
+) -> Dict[str, Any]:
+    n8n_calls = calls.take()
+    total_calls = sum(stats["count"] for stats in n8n_calls.values())
+    return {
+        "scenario": name,
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_per_second": (
+            round(len(samples) / wall_seconds, 1) if wall_seconds else None
+        ),
+        "n8n_calls_per_second": (
+            round(total_calls / wall_seconds, 1) if wall_seconds else None
+        ),
+        "operations": summarize(samples),
+        "n8n_calls": n8n_calls,
+    }
+
+
+def seed_database(db, workflows: int) -> Tuple[int, List[int]]:
+    """One user with `workflows` active webhook workflows (path = n8n ID)"""
+    from models.user import User
+    from models.workflow import WorkflowConfig
+
+    user = User(email="load-driver@example.com", password_hash="x")
+    db.add(user)
+    db.flush()
+    configs = [
+        WorkflowConfig(
+            user_id=user.id,
+            workflow_name=f"Load workflow {i}",
+            n8n_workflow_id=f"load-{i}",
+            webhook_path=f"load-{i}",
+            is_active=True,
+            run_interval_minutes=15,
+        )
+        for i in range(workflows)
+    ]
+    db.add_all(configs)
+    db.commit()
+    return user.id, [config.id for config in configs]
+
+
+async def run_api_scenarios(
+    args: argparse.Namespace, user_id: int, workflow_ids: List[int], calls: N8NCallLog
+) -> List[Dict[str, Any]]:
+    import httpx
+    from api import executions
+    from fastapi import FastAPI
+    from services.n8n_service import n8n_service
+    from utils.security import create_access_token
+
+    # The executions router mounted the way app.main mounts it, without the
+    # app's startup work (default workflow import)
+    app = FastAPI()
+    app.include_router(executions.router, prefix="/api")
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user_id)})}"}
+
+    reports = []
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://api", timeout=120
+    ) as client:
+        if "api" in args.scenario:
+
+            async def create_execution(number: int) -> bool:
+                response = await client.post(
+                    "/api/executions",
+                    headers=headers,
+                    json={
+                        "workflow_config_id": workflow_ids[number % len(workflow_ids)],
+                        "keywords": f"keyword {number}",
+                        "location": "Berlin",
+                    },
+                )
+                return response.status_code < 400
+
+            started = time.perf_counter()
+            samples = await run_concurrently(args.requests, args.concurrency, create_execution)
+            reports.append(
+                scenario_report("api", samples, time.perf_counter() - started, calls)
+            )
+
+        if "batch" in args.scenario:
+
+            async def create_batch(number: int) -> bool:
+                response = await client.post(
+                    "/api/executions/batch",
+                    headers=headers,
+                    json={
+                        "workflow_config_id": workflow_ids[number % len(workflow_ids)],
+                        "pairs": [
+                            {"keywords": f"batch {number} keyword {i}", "location": "Berlin"}
+                            for i in range(args.batch_size)
+                        ],
+                    },
+                )
+                return response.status_code < 400
+
+            started = time.perf_counter()
+            samples = await run_concurrently(
+                args.batch_requests, max(args.concurrency // max(args.batch_size, 1), 1), create_batch
+            )
+            report = scenario_report("batch", samples, time.perf_counter() - started, calls)
+            report["executions_per_second"] = (
+                round(len(samples) * args.batch_size / report["wall_seconds"], 1)
+                if report["wall_seconds"]
+                else None
+            )
+            reports.append(report)
+
+    await n8n_service.aclose()
+    return reports
+
+
+async def run_status_scenario(
+    args: argparse.Namespace, n8n_execution_ids: List[str], calls: N8NCallLog
+) -> Dict[str, Any]:
+    from services.n8n_service import n8n_service
+
+    async def get_status(number: int) -> bool:
+        status = await n8n_service.get_execution_status(n8n_execution_ids[number])
+        return status is not None
+
+    started = time.perf_counter()
+    samples = await run_concurrently(len(n8n_execution_ids), args.concurrency, get_status)
+    await n8n_service.aclose()
+    return scenario_report("status", samples, time.perf_counter() - started, calls)
+
+
+def run_celery_scenario(name: str, task, calls: N8NCallLog) -> Dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        result = task.run()
+        ok = result.get("status") in ("completed", "dispatched")
+    except Exception:
+        result, ok = {"status": "error"}, False
+    wall_seconds = time.perf_counter() - started
+    report = scenario_report(name, [(wall_seconds, ok)], wall_seconds, calls)
+    report["task_result"] = {
+        key: value for key, value in result.items() if key not in ("results", "summary_task_id")
+    }
+    return report
+
+
+def run_load_test(args: argparse.Namespace) -> Dict[str, Any]:
+    args.scenario = [name for name in SCENARIOS if name in (args.scenario or SCENARIOS)]
+    configure_environment(args)
+
+    from app.database import Base, SessionLocal, engine
+    from benchmarks.scheduler_benchmark import make_all_due
+    from celery_app import celery_app
+    from models.execution import WorkflowExecution
+    from models.user import User
+    from services.n8n_service import n8n_service
+    from sqlalchemy import inspect
+
+    import tasks
+
+    logging.getLogger().setLevel(logging.DEBUG if args.verbose else logging.WARNING)
+    if not args.verbose:
+        # Simulated n8n failures are expected; keep the report readable
+        for name in ("tasks", "services", "api", "utils", "automation_app"):
+            logging.getLogger(name).setLevel(logging.CRITICAL)
+
+    celery_app.conf.task_always_eager = True
+    celery_app.conf.broker_url = "memory://"
+    celery_app.conf.result_backend = "cache+memory://"
+
+    if inspect(engine).has_table(User.__tablename__):
+        # The tables are dropped afterwards: never touch a real database
+        raise SystemExit(
+            "Refusing to run: the database already has a users table. "
+            "Point --database-url at a dedicated, empty database."
+        )
+
+    fake_app = create_fake_n8n_app(config_from_args(args))
+    calls = N8NCallLog()
+    calls.install(n8n_service)
+
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    reports: List[Dict[str, Any]] = []
+    try:
+        user_id, workflow_ids = seed_database(db, args.workflows)
+        with FakeN8NServer(fake_app, args.port):
+            if {"api", "batch"} & set(args.scenario):
+                reports += asyncio.run(run_api_scenarios(args, user_id, workflow_ids, calls))
+
+            if "scheduler" in args.scenario:
+                make_all_due(db, datetime.now(timezone.utc))
+                reports.append(
+                    run_celery_scenario("scheduler", tasks.check_and_trigger_n8n_workflows, calls)
+                )
+
+            if "status" in args.scenario:
+                n8n_execution_ids = [
+                    n8n_id
+                    for (n8n_id,) in db.query(WorkflowExecution.n8n_execution_id).filter(
+                        WorkflowExecution.n8n_execution_id.isnot(None)
+                    )
+                ]
+                if n8n_execution_ids:
+                    reports.append(
+                        asyncio.run(run_status_scenario(args, n8n_execution_ids, calls))
+                    )
+
+            if "reconcile" in args.scenario:
+                reports.append(
+                    run_celery_scenario("reconcile", tasks.reconcile_pending_executions, calls)
+                )
+            fake_stats = fake_app.state.fake.stats()
+    finally:
+        db.close()
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+        if args.temp_dir:
+            shutil.rmtree(args.temp_dir, ignore_errors=True)
+
+    return {
+        "database": engine.url.render_as_string(hide_password=True),
+        "fake_n8n": asdict(config_from_args(args)),
+        "scenarios": reports,
+        "fake_n8n_stats": fake_stats,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    fake = report["fake_n8n"]
+    print(
+        f"Database: {report['database']} | fake n8n: latency {fake['latency_ms']}ms, "
+        f"error rate {fake['error_rate']}, respond {fake['respond']}"
+    )
+    header = (
+        f"{'scenario / n8n call':<24} {'count':>7} {'errors':>7} {'ops/s':>9} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for scenario in report["scenarios"]:
+        operations = scenario["operations"]
+        print(
+            f"{scenario['scenario']:<24} {operations['count']:>7} {operations['errors']:>7} "
+            f"{str(scenario['throughput_per_second']):>9} {str(operations['p50_ms']):>9} "
+            f"{str(operations['p95_ms']):>9} {str(operations['p99_ms']):>9}"
+        )
+        print(f"{'  n8n calls/s':<24} {'':>7} {'':>7} {str(scenario['n8n_calls_per_second']):>9}")
+        for kind, stats in scenario["n8n_calls"].items():
+            print(
+                f"{'  n8n ' + kind:<24} {stats['count']:>7} {stats['errors']:>7} {'':>9} "
+                f"{str(stats['p50_ms']):>9} {str(stats['p95_ms']):>9} {str(stats['p99_ms']):>9}"
+            )
+        if "task_result" in scenario:
+            print(f"{'':<24} {scenario['task_result']}")
+    print(f"Fake n8n: {report['fake_n8n_stats']}")
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    report = run_load_test(args)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
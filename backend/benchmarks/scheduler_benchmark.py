@@ -0,0 +1,344 @@
+"""
+Scheduler benchmark: runs check_and_trigger_n8n_workflows against synthetic
+users and workflows with n8n replaced by an in-process fake.
+
+Reports per tick: wall time, DB query count, triggers per second and peak
+Python memory. Use a throwaway database - the tables are created, filled and
+dropped again.
+
+Usage (from backend/):
+    python -m benchmarks.scheduler_benchmark --workflows 10000 --users 500
+    python -m benchmarks.scheduler_benchmark --database-url postgresql://... \\
+        --workflows 100000 --latency-ms 200 --failure-rate 0.02 --json
+    python -m benchmarks.scheduler_benchmark --max-tick-seconds 30 --max-queries 200
+
+Exits with status 1 when a --max-* threshold is exceeded, when fewer due
+workflows got an execution than were due, or when executions failed for
+another reason than a simulated n8n failure, so it can guard against
+scheduler regressions in CI.
+"""
+
+import argparse
+import json
+import logging
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the scheduler tick")
+    parser.add_argument(
+        "--database-url",
+        help="Dedicated SQLite/Postgres database (default: temporary SQLite file)",
+    )
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--workflows", type=int, default=1000)
+    parser.add_argument("--ticks", type=int, default=3)
+    parser.add_argument(
+        "--mode",
+        choices=("sharded", "inline"),
+        default="sharded",
+        help="SCHEDULER_SHARDED on (chord of chunk subtasks, run eagerly) or off",
+    )
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help="SCHEDULER_BATCH_SIZE (default: all workflows in one tick)",
+    )
+    parser.add_argument("--chunk-size", type=int)
+    parser.add_argument("--concurrency", type=int)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--no-tracemalloc",
+        action="store_true",
+        help="Skip peak memory tracing (it slows the tick down noticeably)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--max-tick-seconds", type=float)
+    parser.add_argument("--max-queries", type=int)
+    parser.add_argument("--verbose", action="store_true")
+    return parser.parse_args(argv)
+
+
+def configure_environment(args: argparse.Namespace) -> None:
+    """
+    Settings and the engine are created at import time, so the environment
+    has to be in place before any app module is imported
+    """
+    args.temp_dir = None
+    if not args.database_url:
+        args.temp_dir = tempfile.mkdtemp(prefix="scheduler_benchmark_")
+        args.database_url = "sqlite:///" + os.path.join(args.temp_dir, "benchmark.db")
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["COORDINATION_BACKEND"] = "memory"
+    os.environ["SCHEDULER_MODE"] = "beat"
+    os.environ["SCHEDULER_SHARDED"] = "true" if args.mode == "sharded" else "false"
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    os.environ.setdefault("ALGORITHM", "HS256")
+    os.environ.setdefault("N8N_WEBHOOK_URL", "http://fake-n8n")
+    os.environ["SCHEDULER_BATCH_SIZE"] = str(args.batch_size or args.workflows)
+    os.environ["SCHEDULER_FAIR_SCAN_LIMIT"] = str(
+        max(args.batch_size or args.workflows, args.workflows)
+    )
+    if args.chunk_size:
+        os.environ["SCHEDULER_CHUNK_SIZE"] = str(args.chunk_size)
+    if args.concurrency:
+        os.environ["SCHEDULER_TRIGGER_CONCURRENCY"] = str(args.concurrency)
+
+
+def seed_database(db, users: int, workflows: int) -> None:
+    """Insert synthetic users and active workflows (webhook-triggered)"""
+    from models.user import User
+    from models.workflow import WorkflowConfig
+    from sqlalchemy import insert
+
+    batch = 5000
+    for start in range(0, users, batch):
+        db.execute(
+            insert(User),
+            [
+                {"email": f"bench-user-{i}@example.com", "password_hash": "x"}
+                for i in range(start, min(start + batch, users))
+            ],
+        )
+    user_ids = [user_id for (user_id,) in db.query(User.id).order_by(User.id)]
+
+    for start in range(0, workflows, batch):
+        db.execute(
+            insert(WorkflowConfig),
+            [
+                {
+                    "user_id": user_ids[i % len(user_ids)],
+                    "workflow_name": f"Benchmark workflow {i}",
+                    "n8n_workflow_id": f"bench-{i}",
+                    "webhook_path": f"bench/{i}",
+                    "is_active": True,
+                    "run_interval_minutes": 15,
+                }
+                for i in range(start, min(start + batch, workflows))
+            ],
+        )
+    db.commit()
+
+
+def make_all_due(db, now: datetime) -> None:
+    from models.workflow import WorkflowConfig
+
+    db.query(WorkflowConfig).update(
+        {WorkflowConfig.next_run_at: now - timedelta(minutes=1)},
+        synchronize_session=False,
+    )
+    db.commit()
+
+
+def execution_outcomes(db, after_id: int) -> Dict[str, int]:
+    """Executions created after `after_id`, counted by status"""
+    from models.execution import WorkflowExecution
+    from sqlalchemy import func
+
+    rows = (
+        db.query(WorkflowExecution.status, func.count(WorkflowExecution.id))
+        .filter(WorkflowExecution.id > after_id)
+        .group_by(WorkflowExecution.status)
+        .all()
+    )
+    return dict(rows)
+
+
+def run_tick(
+    task, fake, db, query_counter: List[int], trace_memory: bool
+) -> Dict[str, Any]:
+    from models.execution import WorkflowExecution
+    from sqlalchemy import func
+
+    last_id = db.query(func.max(WorkflowExecution.id)).scalar() or 0
+    fake.reset()
+    query_counter[0] = 0
+    if trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        result = task.run()
+    finally:
+        wall_seconds = time.perf_counter() - started
+        peak_bytes = tracemalloc.get_traced_memory()[1] if trace_memory else None
+        if trace_memory:
+            tracemalloc.stop()
+
+    db_queries = query_counter[0]
+
+    # Outcomes come from the execution rows: errors other than the fake's
+    # simulated failures (e.g. a broken trigger path) must not look like success
+    outcomes = execution_outcomes(db, last_id)
+    failures = outcomes.get("error", 0)
+    triggered = sum(outcomes.values()) - failures
+    return {
+        "status": result.get("status"),
+        "error": result.get("error"),
+        "due": result.get("count", 0),
+        "executions": sum(outcomes.values()),
+        "triggers": fake.calls,
+        "triggered": triggered,
+        "failures": failures,
+        "simulated_failures": fake.failures,
+        "wall_seconds": round(wall_seconds, 3),
+        "db_queries": db_queries,
+        "triggers_per_second": round(triggered / wall_seconds, 1) if wall_seconds else None,
+        "max_in_flight": fake.max_in_flight,
+        "peak_memory_mb": round(peak_bytes / 2**20, 2) if peak_bytes is not None else None,
+    }
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    configure_environment(args)
+
+    from app.database import Base, SessionLocal, engine
+    from benchmarks.fake_n8n import FakeN8N
+    from celery_app import celery_app
+    from models.user import User
+    from sqlalchemy import event, inspect
+
+    import tasks
+
+    logging.getLogger().setLevel(logging.DEBUG if args.verbose else logging.WARNING)
+    if not args.verbose:
+        # Simulated failures are expected; keep the report readable
+        logging.getLogger("tasks").setLevel(logging.CRITICAL)
+
+    # Chunk subtasks and the chord callback run in-process
+    celery_app.conf.task_always_eager = True
+    celery_app.conf.broker_url = "memory://"
+    celery_app.conf.result_backend = "cache+memory://"
+
+    if inspect(engine).has_table(User.__tablename__):
+        # The tables are dropped afterwards: never touch a real database
+        raise SystemExit(
+            "Refusing to run: the database already has a users table. "
+            "Point --database-url at a dedicated, empty database."
+        )
+
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    try:
+        seed_started = time.perf_counter()
+        seed_database(db, args.users, args.workflows)
+        seed_seconds = time.perf_counter() - seed_started
+
+        query_counter = [0]
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def count_query(*_):
+            query_counter[0] += 1
+
+        fake = FakeN8N(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            failure_rate=args.failure_rate,
+            seed=args.seed,
+        )
+        ticks = []
+        with fake.installed():
+            for _ in range(args.ticks):
+                make_all_due(db, datetime.now(timezone.utc))
+                ticks.append(
+                    run_tick(
+                        tasks.check_and_trigger_n8n_workflows,
+                        fake,
+                        db,
+                        query_counter,
+                        trace_memory=not args.no_tracemalloc,
+                    )
+                )
+        event.remove(engine, "before_cursor_execute", count_query)
+    finally:
+        db.close()
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+        if args.temp_dir:
+            shutil.rmtree(args.temp_dir, ignore_errors=True)
+
+    return {
+        "database": engine.url.render_as_string(hide_password=True),
+        "mode": args.mode,
+        "users": args.users,
+        "workflows": args.workflows,
+        "latency_ms": args.latency_ms,
+        "failure_rate": args.failure_rate,
+        "seed_seconds": round(seed_seconds, 3),
+        "max_rss_mb": round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1
+        ),
+        "ticks": ticks,
+    }
+
+
+def check_thresholds(report: Dict[str, Any], args: argparse.Namespace) -> List[str]:
+    problems = []
+    for number, tick in enumerate(report["ticks"], start=1):
+        if tick["status"] == "error":
+            problems.append(f"tick {number}: failed: {tick['error']}")
+        if tick["triggered"] + tick["simulated_failures"] < tick["due"]:
+            problems.append(
+                f"tick {number}: {tick['triggered']} of {tick['due']} due workflows "
+                f"triggered ({tick['simulated_failures']} simulated failures)"
+            )
+        if tick["failures"] > tick["simulated_failures"]:
+            problems.append(
+                f"tick {number}: {tick['failures'] - tick['simulated_failures']} "
+                f"executions failed without a simulated n8n failure"
+            )
+        if args.max_tick_seconds is not None and tick["wall_seconds"] > args.max_tick_seconds:
+            problems.append(
+                f"tick {number}: {tick['wall_seconds']}s > {args.max_tick_seconds}s"
+            )
+        if args.max_queries is not None and tick["db_queries"] > args.max_queries:
+            problems.append(
+                f"tick {number}: {tick['db_queries']} queries > {args.max_queries}"
+            )
+    return problems
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"Database: {report['database']} | mode: {report['mode']} | "
+        f"{report['users']} users, {report['workflows']} workflows | "
+        f"n8n latency {report['latency_ms']}ms, failure rate {report['failure_rate']}"
+    )
+    print(f"Seeded in {report['seed_seconds']}s, max RSS {report['max_rss_mb']} MB")
+    header = f"{'tick':>4} {'due':>8} {'failed':>7} {'wall s':>9} {'queries':>8} {'trig/s':>9} {'peak MB':>8}"
+    print(header)
+    print("-" * len(header))
+    for number, tick in enumerate(report["ticks"], start=1):
+        print(
+            f"{number:>4} {tick['due']:>8} {tick['failures']:>7} "
+            f"{tick['wall_seconds']:>9} {tick['db_queries']:>8} "
+            f"{str(tick['triggers_per_second']):>9} {str(tick['peak_memory_mb']):>8}"
+        )
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    report = run_benchmark(args)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    problems = check_thresholds(report, args)
+    for problem in problems:
+        print(f"Threshold exceeded: {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 import os
 
+from app.config import settings
 from celery import Celery
 
 # Get broker URL from environment or use default
@@ -18,11 +19,15 @@ celery_app.conf.update(
     imports=["tasks"],
 )
 
-# Beat schedule - run every 15 minutes
+# Beat schedule - run every SCHEDULER_TICK_INTERVAL_SECONDS (15 minutes by default)
 celery_app.conf.beat_schedule = {
     "check-and-trigger-n8n-every-15-min": {
         "task": "tasks.check_and_trigger_n8n_workflows",
-        "schedule": 15 * 60.0,  # 15 minutes in seconds
+        "schedule": float(settings.SCHEDULER_TICK_INTERVAL_SECONDS),
+    },
+    "reconcile-pending-executions": {
+        "task": "tasks.reconcile_pending_executions",
+        "schedule": float(settings.RECONCILE_INTERVAL_SECONDS),
     },
 }
 
@@ -1,11 +1,40 @@
 from app.database import Base
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    false,
+    text,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 
 class WorkflowExecution(Base):
     __tablename__ = "workflow_executions"
+    __table_args__ = (
+        # Reconciliation sweep: unfinished executions within a time window
+        Index("ix_workflow_executions_status_created_at", "status", "created_at"),
+        # Keyset pagination of a user's history (GET /api/executions)
+        Index(
+            "ix_workflow_executions_user_created_at_id", "user_id", "created_at", "id"
+        ),
+        # Execution data view (GET /api/executions/data): only rows with a result
+        Index(
+            "ix_workflow_executions_user_has_result",
+            "user_id",
+            "created_at",
+            "id",
+            postgresql_where=text("has_result"),
+            sqlite_where=text("has_result = 1"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(
@@ -23,7 +52,9 @@ class WorkflowExecution(Base):
     status = Column(
         String, nullable=False, default="pending"
     )  # pending/running/success/error
-    result = Column(JSON, nullable=True)
+    result = Column(JSON, nullable=True)  # Always a dict (see normalize_result)
+    # Non-empty result stored; set together with result on every write
+    has_result = Column(Boolean, nullable=False, default=False, server_default=false())
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -7,6 +7,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -33,6 +34,13 @@ class WorkflowConfig(Base):
         Integer, default=15, nullable=False
     )  # How often to run (in minutes)
     last_run_at = Column(DateTime(timezone=True), nullable=True)  # Last execution time
+    next_run_at = Column(
+        DateTime(timezone=True), nullable=True
+    )  # When the scheduler should trigger next (NULL while inactive)
+    # Compiled from workflow_config_json on import, so triggering never loads it
+    trigger_node_type = Column(String, nullable=True, index=True)
+    trigger_webhook_path = Column(String, nullable=True, index=True)
+    trigger_input_fields = Column(JSON, nullable=True)  # e.g. ["keywords", "location"]
     description = Column(Text, nullable=True)
     source_file = Column(String, nullable=True)  # e.g., "automation.json"
     created_at = Column(
@@ -42,6 +50,7 @@ class WorkflowConfig(Base):
     # Table constraints
     __table_args__ = (
         UniqueConstraint("user_id", "n8n_workflow_id", name="unique_user_n8n_workflow"),
+        Index("ix_workflow_configs_is_active_next_run_at", "is_active", "next_run_at"),
     )
 
     # Relationships
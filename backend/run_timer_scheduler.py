@@ -0,0 +1,23 @@
+"""
+Long-running timer scheduler (SCHEDULER_MODE=timer).
+Fires each workflow within seconds of its next_run_at instead of on 15-minute beat ticks.
+Usage: SCHEDULER_MODE=timer python run_timer_scheduler.py
+"""
+
+from services.timer_scheduler import TimerScheduler
+from utils.logger import setup_logging
+
+logger = setup_logging()
+
+
+def main():
+    scheduler = TimerScheduler()
+    logger.info("Starting timer scheduler...")
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        logger.info("Timer scheduler stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -18,7 +18,45 @@ class WorkflowExecutionCreate(WorkflowExecutionBase):
     pass
 
 
-class WorkflowExecutionResponse(BaseModel):
+class KeywordLocationPair(BaseModel):
+    keywords: str
+    location: str
+
+
+class WorkflowExecutionBatchCreate(BaseModel):
+    """
+    Many executions of one workflow config: explicit `pairs`, and/or the
+    cartesian product of `keywords` x `locations`
+    """
+
+    workflow_config_id: Optional[int] = None
+    pairs: List[KeywordLocationPair] = []
+    keywords: List[str] = []
+    locations: List[str] = []
+
+
+class WorkflowExecutionBatchItem(BaseModel):
+    id: int
+    keywords: str
+    location: str
+    n8n_execution_id: Optional[str] = None
+    status: str
+
+    class Config:
+        from_attributes = True
+
+
+class WorkflowExecutionBatchResponse(BaseModel):
+    workflow_config_id: int
+    execution_ids: List[int]
+    total: int
+    failed: int
+    executions: List[WorkflowExecutionBatchItem]
+
+
+class WorkflowExecutionSummary(BaseModel):
+    """Execution without its result JSON (list views)"""
+
     id: int
     user_id: int
     workflow_config_id: int  # Always present in response
@@ -26,7 +64,6 @@ class WorkflowExecutionResponse(BaseModel):
     location: str
     n8n_execution_id: Optional[str] = None
     status: str  # pending/running/success/error
-    result: Optional[dict] = None
     created_at: datetime
     completed_at: Optional[datetime] = None
 
@@ -34,12 +71,35 @@ class WorkflowExecutionResponse(BaseModel):
         from_attributes = True
 
 
+class WorkflowExecutionResponse(WorkflowExecutionSummary):
+    result: Optional[dict] = None
+
+
+class WorkflowExecutionPage(BaseModel):
+    items: List[WorkflowExecutionSummary]
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page
+
+
 class ExecutionStatusUpdate(BaseModel):
     status: str
     result: Optional[dict] = None
     n8n_execution_id: Optional[str] = None
 
 
+class ExecutionCallback(BaseModel):
+    """Completion report POSTed by n8n to /executions/{id}/callback"""
+
+    status: str  # running/success/error
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    n8n_execution_id: Optional[str] = None
+
+
+class ExecutionCallbackResponse(BaseModel):
+    execution_id: int
+    applied: bool  # False if the execution had already finished
+
+
 class ExecutionDataRow(BaseModel):
     """
     Simplified view of data that was saved for a particular execution
@@ -55,3 +115,13 @@ class ExecutionDataRow(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class ExecutionDataPage(BaseModel):
+    items: List[ExecutionDataRow]
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page
+
+
+class ExecutionEventsToken(BaseModel):
+    stream_token: str  # Pass as ?stream_token= to GET /executions/events
+    expires_in: int  # Seconds left to open the stream with it
@@ -28,6 +28,10 @@ class WorkflowConfigResponse(WorkflowConfigBase):
     is_active: bool = True
     run_interval_minutes: int = 15
     last_run_at: Optional[datetime] = None
+    next_run_at: Optional[datetime] = None
+    trigger_node_type: Optional[str] = None
+    trigger_webhook_path: Optional[str] = None
+    trigger_input_fields: Optional[List[str]] = None
     description: Optional[str] = None
     source_file: Optional[str] = None
     created_at: datetime
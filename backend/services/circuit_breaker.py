@@ -0,0 +1,197 @@
+"""
+Circuit breakers and retry backoff for n8n endpoints
+
+One breaker per endpoint ("webhook", "execute", "executions", "workflows")
+in each process. A breaker opens when at least N8N_BREAKER_MIN_CALLS calls
+were made within N8N_BREAKER_WINDOW_SECONDS and N8N_BREAKER_FAILURE_RATE of
+them failed (transport errors and 5xx; 4xx answers count as healthy; on the
+trigger endpoints "webhook" and "execute" a plain 500 is one workflow's own
+error and only 502/503/504 count). While
+open, calls fail immediately with CircuitOpenError. After
+N8N_BREAKER_OPEN_SECONDS it goes half-open and lets
+N8N_BREAKER_HALF_OPEN_MAX_CALLS probe calls through: a success closes it, a
+failure opens it again.
+
+State changes are published to Redis so the status endpoint shows the
+breakers of every API/worker process. Breakers are checked on the event
+loop, so the publishing itself is done by one background thread, in order.
+"""
+
+import json
+import logging
+import os
+import random
+import socket
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import httpx
+from app.config import settings
+from utils.coordination import get_redis_client, use_redis
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+STATES_KEY = "n8n:circuit_breakers"
+PROCESS_NAME = f"{socket.gethostname()}:{os.getpid()}"
+
+_memory_states: Dict[str, str] = {}
+_publisher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="circuit-states")
+
+
+class CircuitOpenError(httpx.HTTPError):
+    """The endpoint's circuit is open: the request was not sent"""
+
+    def __init__(self, endpoint: str, retry_in: float):
+        super().__init__(
+            f"n8n endpoint '{endpoint}' circuit is open, retry in {retry_in:.0f}s"
+        )
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker (closed / open / half-open)"""
+
+    def __init__(self, endpoint: str, clock: Callable[[], float] = time.monotonic):
+        self.endpoint = endpoint
+        self.clock = clock
+        self.state = CLOSED
+        self.opened_at: Optional[float] = None
+        self.half_open_calls = 0
+        self._calls: Deque[Tuple[float, bool]] = deque()
+        self._guard = threading.Lock()
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless a call may go through now"""
+        if not settings.N8N_BREAKER_ENABLED:
+            return
+        with self._guard:
+            now = self.clock()
+            if self.state == OPEN:
+                retry_in = self.opened_at + settings.N8N_BREAKER_OPEN_SECONDS - now
+                if retry_in > 0:
+                    raise CircuitOpenError(self.endpoint, retry_in)
+                self._transition(HALF_OPEN)
+            if self.state == HALF_OPEN:
+                if self.half_open_calls >= settings.N8N_BREAKER_HALF_OPEN_MAX_CALLS:
+                    raise CircuitOpenError(self.endpoint, settings.N8N_BREAKER_OPEN_SECONDS)
+                self.half_open_calls += 1
+
+    def record(self, success: bool) -> None:
+        if not settings.N8N_BREAKER_ENABLED:
+            return
+        with self._guard:
+            now = self.clock()
+            if self.state == HALF_OPEN:
+                self._transition(CLOSED if success else OPEN)
+                return
+
+            self._calls.append((now, success))
+            window_start = now - settings.N8N_BREAKER_WINDOW_SECONDS
+            while self._calls and self._calls[0][0] < window_start:
+                self._calls.popleft()
+            if (
+                self.state == CLOSED
+                and len(self._calls) >= settings.N8N_BREAKER_MIN_CALLS
+                and self.failure_rate() >= settings.N8N_BREAKER_FAILURE_RATE
+            ):
+                self._transition(OPEN)
+
+    def failure_rate(self) -> float:
+        if not self._calls:
+            return 0.0
+        return sum(1 for _, success in self._calls if not success) / len(self._calls)
+
+    def snapshot(self) -> Dict[str, Any]:
+        retry_in = None
+        if self.state == OPEN:
+            retry_in = max(
+                self.opened_at + settings.N8N_BREAKER_OPEN_SECONDS - self.clock(), 0.0
+            )
+        return {
+            "state": self.state,
+            "calls_in_window": len(self._calls),
+            "failure_rate": round(self.failure_rate(), 3),
+            "retry_in_seconds": round(retry_in, 1) if retry_in is not None else None,
+        }
+
+    def _transition(self, state: str) -> None:
+        previous, self.state = self.state, state
+        self.half_open_calls = 0
+        if state == OPEN:
+            self.opened_at = self.clock()
+        if state == CLOSED:
+            self._calls.clear()
+        log = logger.warning if state == OPEN else logger.info
+        log(f"n8n circuit '{self.endpoint}': {previous} -> {state}")
+        _publish_state(self.endpoint, self.snapshot())
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_guard = threading.Lock()
+
+
+def get_breaker(endpoint: str) -> CircuitBreaker:
+    with _breakers_guard:
+        breaker = _breakers.get(endpoint)
+        if breaker is None:
+            breaker = _breakers[endpoint] = CircuitBreaker(endpoint)
+        return breaker
+
+
+def _publish_state(endpoint: str, snapshot: Dict[str, Any]) -> None:
+    field = f"{PROCESS_NAME}:{endpoint}"
+    value = json.dumps({**snapshot, "updated_at": time.time()})
+    if use_redis():
+        # Called under the breaker's lock from _send: never wait for Redis here
+        _publisher.submit(_write_state, endpoint, field, value)
+    else:
+        _memory_states[field] = value
+
+
+def _write_state(endpoint: str, field: str, value: str) -> None:
+    try:
+        get_redis_client().hset(STATES_KEY, field, value)
+    except Exception as e:
+        logger.warning(f"Failed to publish circuit state of '{endpoint}': {str(e)}")
+
+
+def get_breaker_states() -> Dict[str, Any]:
+    """
+    Breakers of this process plus the last published state changes of all
+    processes ("host:pid:endpoint")
+    """
+    local = {endpoint: breaker.snapshot() for endpoint, breaker in list(_breakers.items())}
+    if use_redis():
+        raw = get_redis_client().hgetall(STATES_KEY)
+    else:
+        raw = dict(_memory_states)
+    published = {field: json.loads(value) for field, value in raw.items()}
+    open_endpoints = sorted(
+        {
+            field.rsplit(":", 1)[1]
+            for field, state in published.items()
+            if state.get("state") != CLOSED
+        }
+        | {endpoint for endpoint, state in local.items() if state["state"] != CLOSED}
+    )
+    return {
+        "process": PROCESS_NAME,
+        "local": local,
+        "published": published,
+        "not_closed": open_endpoints,
+    }
+
+
+def backoff_delays(attempts: int) -> List[float]:
+    """Full-jitter exponential backoff delays between `attempts` tries"""
+    base = settings.N8N_RETRY_BASE_DELAY_SECONDS
+    cap = settings.N8N_RETRY_MAX_DELAY_SECONDS
+    return [random.uniform(0, min(cap, base * 2**attempt)) for attempt in range(attempts - 1)]
@@ -0,0 +1,234 @@
+"""
+Push channel for execution status changes (GET /api/executions/events)
+
+Every place that writes an execution's status publishes a small event
+after its commit. With COORDINATION_BACKEND=redis events go through a Redis
+pub/sub channel, so changes made by Celery workers or another API replica
+reach every process; each API process runs one listener thread that hands
+them to its in-process broker. With the memory backend the broker is fed
+directly. The broker fans events out to the Server-Sent Events streams of
+the execution's owner. Publishing is best-effort: the database stays
+authoritative and a stream starts with the current state of the executions
+it watches, so a reconnecting client catches up.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Set
+
+from app.config import settings
+from app.database import SessionLocal
+from models.execution import WorkflowExecution
+from sqlalchemy.orm import Session, load_only
+from utils.coordination import get_redis_client, use_redis
+
+logger = logging.getLogger(__name__)
+
+EXECUTION_EVENTS_CHANNEL = "executions:status_changes"
+
+_EVENT_COLUMNS = (
+    WorkflowExecution.id,
+    WorkflowExecution.user_id,
+    WorkflowExecution.status,
+    WorkflowExecution.n8n_execution_id,
+    WorkflowExecution.completed_at,
+)
+
+
+def execution_event(execution: WorkflowExecution) -> Dict[str, Any]:
+    """Event payload for an execution's current status"""
+    return {
+        "id": execution.id,
+        "user_id": execution.user_id,
+        "status": execution.status,
+        "n8n_execution_id": execution.n8n_execution_id,
+        "completed_at": (
+            execution.completed_at.isoformat() if execution.completed_at else None
+        ),
+    }
+
+
+def publish_execution_events(events: Sequence[Dict[str, Any]]) -> None:
+    """Publish status events (one Redis round trip); failures are only logged"""
+    if not events:
+        return
+    try:
+        if use_redis():
+            pipeline = get_redis_client().pipeline(transaction=False)
+            for event in events:
+                pipeline.publish(EXECUTION_EVENTS_CHANNEL, json.dumps(event))
+            pipeline.execute()
+        else:
+            for event in events:
+                broker.dispatch(event)
+    except Exception as e:
+        logger.warning(f"Failed to publish {len(events)} execution event(s): {str(e)}")
+
+
+def publish_execution_changes(db: Session, execution_ids: Iterable[int]) -> None:
+    """Publish the stored status of executions changed by bulk UPDATEs"""
+    execution_ids = list(execution_ids)
+    if not execution_ids:
+        return
+    executions = load_executions(db, execution_ids)
+    publish_execution_events([execution_event(execution) for execution in executions])
+
+
+def load_executions(
+    db: Session, execution_ids: Sequence[int], user_id: Optional[int] = None
+) -> List[WorkflowExecution]:
+    query = (
+        db.query(WorkflowExecution)
+        .options(load_only(*_EVENT_COLUMNS))
+        .filter(WorkflowExecution.id.in_(execution_ids))
+    )
+    if user_id is not None:
+        query = query.filter(WorkflowExecution.user_id == user_id)
+    return query.all()
+
+
+class ExecutionSubscription:
+    """Events for one stream: a user's executions (optionally only some IDs)"""
+
+    def __init__(
+        self,
+        user_id: int,
+        execution_ids: Optional[Set[int]],
+        loop: asyncio.AbstractEventLoop,
+        max_queued: int,
+    ):
+        self.user_id = user_id
+        self.execution_ids = execution_ids
+        self._loop = loop
+        self._queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=max(max_queued, 1))
+
+    def wants(self, event: Dict[str, Any]) -> bool:
+        return self.execution_ids is None or event.get("id") in self.execution_ids
+
+    def offer(self, event: Dict[str, Any]) -> None:
+        """Queue an event from any thread"""
+        self._loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event: Dict[str, Any]) -> None:
+        if self._queue.full():
+            # A stalled client loses its oldest events, not the newest status
+            self._queue.get_nowait()
+        self._queue.put_nowait(event)
+
+    async def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Next event, or None if none arrived within `timeout` seconds"""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class ExecutionEventBroker:
+    """In-process fan-out of execution events to the owner's subscriptions"""
+
+    def __init__(self):
+        self._subscriptions: Dict[int, Set[ExecutionSubscription]] = {}
+        self._guard = threading.Lock()
+        self._listener: Optional[threading.Thread] = None
+
+    def subscribe(
+        self, user_id: int, execution_ids: Optional[Set[int]] = None
+    ) -> ExecutionSubscription:
+        """Subscribe the running event loop to a user's execution events"""
+        subscription = ExecutionSubscription(
+            user_id,
+            execution_ids,
+            asyncio.get_running_loop(),
+            settings.EXECUTION_EVENTS_QUEUE_SIZE,
+        )
+        with self._guard:
+            self._subscriptions.setdefault(user_id, set()).add(subscription)
+        if use_redis():
+            self._ensure_listener()
+        return subscription
+
+    def unsubscribe(self, subscription: ExecutionSubscription) -> None:
+        with self._guard:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.user_id]
+
+    def subscriber_count(self) -> int:
+        with self._guard:
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def dispatch(self, event: Dict[str, Any]) -> None:
+        """Hand an event to the matching subscriptions of its user"""
+        with self._guard:
+            subscriptions = list(self._subscriptions.get(event.get("user_id"), ()))
+        for subscription in subscriptions:
+            if subscription.wants(event):
+                subscription.offer(event)
+
+    def _ensure_listener(self) -> None:
+        with self._guard:
+            if self._listener is not None and self._listener.is_alive():
+                return
+            self._listener = threading.Thread(
+                target=self._listen, name="execution-events", daemon=True
+            )
+            self._listener.start()
+
+    def _listen(self) -> None:
+        """Relay the Redis channel to this process's subscriptions (one connection)"""
+        while True:
+            pubsub = None
+            try:
+                pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(EXECUTION_EVENTS_CHANNEL)
+                for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.dispatch(json.loads(message["data"]))
+            except Exception as e:
+                logger.warning(f"Execution events listener failed, reconnecting: {str(e)}")
+                time.sleep(1)
+            finally:
+                if pubsub is not None:
+                    pubsub.close()
+
+
+broker = ExecutionEventBroker()
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    return f"event: execution\ndata: {json.dumps(event)}\n\n"
+
+
+async def stream_execution_events(
+    request, user_id: int, execution_ids: Optional[Set[int]] = None
+) -> AsyncIterator[str]:
+    """
+    Server-Sent Events for a user's executions: the current state of the
+    requested executions first, then every change, with comment lines as
+    keepalive every EXECUTION_EVENTS_HEARTBEAT_SECONDS
+    """
+    # Subscribe before reading the snapshot: a change in between is sent twice, never lost
+    subscription = broker.subscribe(user_id, execution_ids)
+    try:
+        yield f"retry: {settings.EXECUTION_EVENTS_RETRY_MS}\n\n"
+        if execution_ids:
+            db = SessionLocal()
+            try:
+                executions = load_executions(db, sorted(execution_ids), user_id)
+                snapshot = [execution_event(execution) for execution in executions]
+            finally:
+                db.close()
+            for event in snapshot:
+                yield format_sse(event)
+
+        while not await request.is_disconnected():
+            event = await subscription.get(settings.EXECUTION_EVENTS_HEARTBEAT_SECONDS)
+            yield format_sse(event) if event is not None else ": keepalive\n\n"
+    finally:
+        broker.unsubscribe(subscription)
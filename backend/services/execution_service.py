@@ -1,30 +1,591 @@
-import io
-import csv
-from typing import List
+import asyncio
+import base64
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import httpx
 from fastapi import HTTPException, status
 from fastapi.responses import StreamingResponse
 
 from models.execution import WorkflowExecution
 from models.user import User
-from schemas.execution import ExecutionStatusUpdate, WorkflowExecutionCreate
-from services.execution_service import (
-    cancel_execution,
-    create_execution,
-    get_execution_by_id,
-    get_executions_by_user,
-    update_execution_status,
+from models.workflow import WorkflowConfig
+from app.config import settings
+from schemas.execution import (
+    ExecutionCallback,
+    ExecutionStatusUpdate,
+    WorkflowExecutionBatchCreate,
+    WorkflowExecutionCreate,
+)
+from schemas.workflow import SavedPresetCreate
+from services.execution_events import (
+    execution_event,
+    publish_execution_changes,
+    publish_execution_events,
+    stream_execution_events,
+)
+from services.n8n_service import n8n_service
+from services.export_service import export_response
+from services.result_sinks import result_sink_for
+from services.workflow_service import (
+    create_default_workflow_for_user,
+    create_saved_preset,
+    get_default_workflow_for_user,
+    get_workflow_config_by_id,
+)
+from sqlalchemy import select, tuple_, update
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy.orm.attributes import set_committed_value
+from utils.exceptions import (
+    raise_authorization_error,
+    raise_execution_not_found_error,
+    raise_validation_error,
+    raise_workflow_not_found_error,
 )
-from sqlalchemy.orm import Session
-from utils.exceptions import raise_execution_not_found_error
+from utils.security import (
+    create_execution_callback_token,
+    create_execution_events_token,
+    verify_execution_callback_token,
+)
+
+logger = logging.getLogger(__name__)
+
+FINAL_STATUSES = ("success", "error")
+CALLBACK_STATUSES = ("running",) + FINAL_STATUSES
+
+# Keys n8n returns when a run was only started (e.g. "Respond immediately" webhooks)
+_STARTED_RESPONSE_KEYS = {"executionId", "id", "message", "status"}
+
+
+# Columns of list views: everything but the (possibly large) result JSON
+EXECUTION_SUMMARY_COLUMNS = (
+    WorkflowExecution.id,
+    WorkflowExecution.user_id,
+    WorkflowExecution.workflow_config_id,
+    WorkflowExecution.keywords,
+    WorkflowExecution.location,
+    WorkflowExecution.n8n_execution_id,
+    WorkflowExecution.status,
+    WorkflowExecution.created_at,
+    WorkflowExecution.completed_at,
+)
+
+
+def encode_execution_cursor(execution: WorkflowExecution) -> str:
+    """Opaque keyset cursor pointing at an execution (its id)"""
+    return base64.urlsafe_b64encode(str(execution.id).encode()).decode().rstrip("=")
+
+
+def decode_execution_cursor(cursor: str) -> int:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        return int(raw)
+    except ValueError:
+        raise_validation_error("Invalid executions cursor")
+
+
+def get_executions_page(
+    db: Session,
+    user_id: int,
+    limit: int,
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    workflow_config_id: Optional[int] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    with_result: bool = False,
+) -> Tuple[List[WorkflowExecution], Optional[str]]:
+    """
+    One page of a user's executions (summary columns only), newest first,
+    and the cursor of the next page (None on the last page)
+
+    Keyset pagination on (created_at, id): a page continues strictly after
+    the cursor row, so it is a range scan of the (user_id, created_at, id)
+    index however deep it goes. The cursor only carries the id; the row's
+    created_at is read back as stored, since a timestamp rebuilt in Python
+    need not compare equal to it (SQLite keeps CURRENT_TIMESTAMP without
+    fractional seconds). created_from is inclusive, created_to
+    exclusive. with_result limits the page to executions with a result and
+    loads it too; the partial has_result index serves that case.
+    """
+    columns = EXECUTION_SUMMARY_COLUMNS
+    query = db.query(WorkflowExecution).filter(WorkflowExecution.user_id == user_id)
+    if with_result:
+        columns += (WorkflowExecution.result,)
+        query = query.filter(WorkflowExecution.has_result)
+    query = query.options(load_only(*columns))
+    if status:
+        query = query.filter(WorkflowExecution.status == status)
+    if workflow_config_id is not None:
+        query = query.filter(WorkflowExecution.workflow_config_id == workflow_config_id)
+    if created_from is not None:
+        query = query.filter(WorkflowExecution.created_at >= created_from)
+    if created_to is not None:
+        query = query.filter(WorkflowExecution.created_at < created_to)
+    if cursor:
+        cursor_id = decode_execution_cursor(cursor)
+        cursor_created_at = (
+            select(WorkflowExecution.created_at)
+            .where(WorkflowExecution.id == cursor_id)
+            .scalar_subquery()
+        )
+        query = query.filter(
+            tuple_(WorkflowExecution.created_at, WorkflowExecution.id)
+            < tuple_(cursor_created_at, cursor_id)
+        )
+
+    executions = (
+        query.order_by(WorkflowExecution.created_at.desc(), WorkflowExecution.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+    if len(executions) <= limit:
+        return executions, None
+    executions = executions[:limit]
+    return executions, encode_execution_cursor(executions[-1])
+
+
+def get_execution_by_id(
+    db: Session, execution_id: int, user_id: int
+) -> Optional[WorkflowExecution]:
+    """Get execution by ID (only if belongs to user)"""
+    return (
+        db.query(WorkflowExecution)
+        .filter(
+            WorkflowExecution.id == execution_id,
+            WorkflowExecution.user_id == user_id,
+        )
+        .first()
+    )
+
+
+def resolve_workflow_config(
+    db: Session, user: User, workflow_config_id: Optional[int]
+) -> WorkflowConfig:
+    """Get the requested workflow config, or the user's default one"""
+    if workflow_config_id is None:
+        workflow = get_default_workflow_for_user(db, user.id)
+        if not workflow:
+            workflow = create_default_workflow_for_user(db, user)
+        return workflow
+
+    workflow = get_workflow_config_by_id(db, workflow_config_id, user.id)
+    if not workflow:
+        raise_workflow_not_found_error(workflow_config_id)
+    return workflow
+
+
+def new_pending_execution(
+    user_id: int, workflow: WorkflowConfig, keywords: str, location: str
+) -> WorkflowExecution:
+    """Build (without adding to the session) a pending execution for a workflow"""
+    return WorkflowExecution(
+        user_id=user_id,
+        workflow_config_id=workflow.id,
+        keywords=keywords,
+        location=location,
+        status="pending",
+    )
+
+
+def create_pending_execution(
+    db: Session,
+    user: User,
+    workflow: WorkflowConfig,
+    execution_data: WorkflowExecutionCreate,
+) -> WorkflowExecution:
+    """Store a pending execution row (and the optional preset) before triggering n8n"""
+    execution = new_pending_execution(
+        user.id, workflow, execution_data.keywords, execution_data.location
+    )
+    db.add(execution)
+    db.commit()
+    db.refresh(execution)
+
+    if execution_data.save_as_preset:
+        create_saved_preset(
+            db,
+            user,
+            SavedPresetCreate(
+                preset_name=execution_data.preset_name
+                or f"{execution_data.keywords} - {execution_data.location}",
+                keywords=execution_data.keywords,
+                location=execution_data.location,
+                workflow_config_id=workflow.id,
+            ),
+        )
+
+    return execution
+
+
+def needs_workflow_json(workflow: WorkflowConfig) -> bool:
+    """
+    Only workflows whose trigger metadata was never compiled (and that have
+    no explicit webhook path) still need the full JSON to be triggered
+    """
+    return not workflow.webhook_path and workflow.trigger_node_type is None
+
+
+def build_trigger_payload(execution: WorkflowExecution) -> Dict[str, Any]:
+    """
+    Build the data sent to n8n for an execution
+
+    Includes a per-execution callback token (and URL, if
+    EXECUTION_CALLBACK_BASE_URL is set) so the workflow can report its
+    result to POST /api/executions/{id}/callback.
+    """
+    payload = {
+        "execution_id": execution.id,
+        "keywords": execution.keywords,
+        "location": execution.location,
+        "callback_token": create_execution_callback_token(execution.id),
+    }
+    if settings.EXECUTION_CALLBACK_BASE_URL:
+        payload["callback_url"] = (
+            f"{settings.EXECUTION_CALLBACK_BASE_URL.rstrip('/')}"
+            f"/api/executions/{execution.id}/callback"
+        )
+    return payload
+
+
+async def trigger_execution(
+    execution: WorkflowExecution,
+    workflow: WorkflowConfig,
+    client: Optional[httpx.AsyncClient] = None,
+    check_workflow: Optional[bool] = None,
+) -> Any:
+    """Trigger n8n for a stored execution and return the raw n8n response"""
+    return await n8n_service.trigger_workflow(
+        workflow.n8n_workflow_id,
+        build_trigger_payload(execution),
+        webhook_path=workflow.webhook_path or workflow.trigger_webhook_path,
+        workflow_json=(
+            workflow.workflow_config_json if needs_workflow_json(workflow) else None
+        ),
+        client=client,
+        check_workflow=check_workflow,
+        sink=result_sink_for(execution.id),
+    )
+
+
+async def trigger_executions_concurrently(
+    jobs: Sequence[Tuple[WorkflowConfig, WorkflowExecution]],
+    concurrency: int,
+    check_workflow: Optional[bool] = None,
+) -> List[Any]:
+    """
+    Trigger n8n for all (workflow, execution) pairs on one event loop
+
+    At most `concurrency` triggers are in flight at once; they go through
+    the n8n service's shared connection pool. Returns n8n responses (or
+    raised exceptions) in job order.
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def run_one(workflow: WorkflowConfig, execution: WorkflowExecution):
+        async with semaphore:
+            return await trigger_execution(
+                execution, workflow, check_workflow=check_workflow
+            )
+
+    return await asyncio.gather(
+        *(run_one(workflow, execution) for workflow, execution in jobs),
+        return_exceptions=True,
+    )
+
+
+def _extract_n8n_execution_id(response: Any) -> Optional[str]:
+    if not isinstance(response, dict):
+        return None
+    execution_id = response.get("executionId") or response.get("id")
+    data = response.get("data")
+    if execution_id is None and isinstance(data, dict):
+        execution_id = data.get("executionId") or data.get("id")
+    return str(execution_id) if execution_id is not None else None
+
+
+def normalize_result(value: Any) -> Dict[str, Any]:
+    """Store any n8n result shape as a dict"""
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, list):
+        return {"items": value}
+    return {"value": value}
+
+
+def result_values(value: Any) -> Dict[str, Any]:
+    """
+    Column values storing a result: the normalized dict and the has_result
+    flag the execution data view filters on (empty results do not count)
+    """
+    return {"result": normalize_result(value), "has_result": bool(value)}
+
+
+def set_execution_result(execution: WorkflowExecution, value: Any) -> None:
+    for key, column_value in result_values(value).items():
+        setattr(execution, key, column_value)
+
+
+def apply_trigger_response(execution: WorkflowExecution, response: Any) -> None:
+    """Update execution from the n8n trigger response"""
+    n8n_execution_id = _extract_n8n_execution_id(response)
+    if n8n_execution_id:
+        execution.n8n_execution_id = n8n_execution_id
+
+    if not response or (
+        isinstance(response, dict) and set(response) <= _STARTED_RESPONSE_KEYS
+    ):
+        # n8n only acknowledged the start, the result arrives later
+        execution.status = "running"
+        return
+
+    set_execution_result(execution, response)
+    execution.status = "success"
+    execution.completed_at = datetime.now(timezone.utc)
+
+
+def mark_execution_failed(execution: WorkflowExecution, error: Exception) -> None:
+    """Mark execution as failed because n8n could not be triggered"""
+    execution.status = "error"
+    set_execution_result(execution, {"error": str(error)})
+    execution.completed_at = datetime.now(timezone.utc)
+
+
+# Columns apply_trigger_response / mark_execution_failed write
+_OUTCOME_COLUMNS = ("status", "result", "has_result", "n8n_execution_id", "completed_at")
+
+
+def save_execution_outcomes(db: Session, executions: Sequence[WorkflowExecution]) -> None:
+    """
+    Write trigger outcomes of many executions as one bulk UPDATE by primary
+    key instead of one UPDATE per dirty row on flush
+    """
+    rows = []
+    for execution in executions:
+        values = {column: getattr(execution, column) for column in _OUTCOME_COLUMNS}
+        for column, value in values.items():
+            # Already written below: keep the flush from updating the row again
+            set_committed_value(execution, column, value)
+        rows.append({"id": execution.id, **values})
+    if rows:
+        db.execute(update(WorkflowExecution), rows)
+
+
+async def create_execution(
+    db: Session, user: User, execution_data: WorkflowExecutionCreate
+) -> WorkflowExecution:
+    """Create a new execution and trigger the n8n workflow for it"""
+    workflow = resolve_workflow_config(db, user, execution_data.workflow_config_id)
+    execution = create_pending_execution(db, user, workflow, execution_data)
+
+    try:
+        response = await trigger_execution(execution, workflow)
+    except Exception as e:
+        logger.exception(f"Failed to trigger n8n for execution {execution.id}")
+        mark_execution_failed(execution, e)
+        event = execution_event(execution)
+        db.commit()
+        publish_execution_events([event])
+        raise
+
+    apply_trigger_response(execution, response)
+    event = execution_event(execution)
+    db.commit()
+    publish_execution_events([event])
+    db.refresh(execution)
+    return execution
+
+
+def expand_batch_pairs(batch_data: WorkflowExecutionBatchCreate) -> List[Tuple[str, str]]:
+    """Explicit pairs followed by keywords x locations, duplicates dropped"""
+    pairs = [(pair.keywords, pair.location) for pair in batch_data.pairs]
+    pairs += [
+        (keywords, location)
+        for keywords in batch_data.keywords
+        for location in batch_data.locations
+    ]
+    return list(dict.fromkeys(pairs))
+
+
+async def create_executions_batch(
+    db: Session, user: User, batch_data: WorkflowExecutionBatchCreate
+) -> Tuple[WorkflowConfig, List[WorkflowExecution]]:
+    """
+    Create one execution per keyword/location pair and trigger them
+
+    Pending rows are inserted in one transaction, triggered concurrently
+    (EXECUTION_BATCH_TRIGGER_CONCURRENCY at a time) and the outcomes saved
+    with one more commit. Failed triggers are stored as "error" executions.
+    The commits do not expire the rows (the session's expire_on_commit is
+    off meanwhile): reading them back would cost one SELECT per execution.
+    """
+    pairs = expand_batch_pairs(batch_data)
+    if not pairs:
+        raise_validation_error(
+            "Provide 'pairs' or both 'keywords' and 'locations' for a batch"
+        )
+    if len(pairs) > settings.EXECUTION_BATCH_MAX_SIZE:
+        raise_validation_error(
+            f"Batch has {len(pairs)} keyword/location pairs, "
+            f"the limit is {settings.EXECUTION_BATCH_MAX_SIZE}"
+        )
+
+    workflow = resolve_workflow_config(db, user, batch_data.workflow_config_id)
+    executions = [
+        new_pending_execution(user.id, workflow, keywords, location)
+        for keywords, location in pairs
+    ]
+    expire_on_commit, db.expire_on_commit = db.expire_on_commit, False
+    try:
+        db.add_all(executions)
+        db.commit()
+
+        responses = await trigger_executions_concurrently(
+            [(workflow, execution) for execution in executions],
+            settings.EXECUTION_BATCH_TRIGGER_CONCURRENCY,
+        )
+        for execution, response in zip(executions, responses):
+            if isinstance(response, Exception):
+                logger.error(
+                    f"Failed to trigger n8n for execution {execution.id}: {str(response)}"
+                )
+                mark_execution_failed(execution, response)
+            else:
+                apply_trigger_response(execution, response)
+        save_execution_outcomes(db, executions)
+        db.commit()
+    finally:
+        db.expire_on_commit = expire_on_commit
+    publish_execution_events([execution_event(execution) for execution in executions])
+    return workflow, executions
+
+
+async def cancel_execution(
+    db: Session, execution_id: int, user_id: int
+) -> Optional[WorkflowExecution]:
+    """Cancel an execution (stops it in n8n if it is still running there)"""
+    execution = get_execution_by_id(db, execution_id, user_id)
+    if not execution:
+        return None
+
+    if execution.status in FINAL_STATUSES:
+        return execution
+
+    if execution.n8n_execution_id:
+        stopped = await n8n_service.cancel_execution(execution.n8n_execution_id)
+        if not stopped:
+            logger.warning(
+                f"n8n did not confirm stop for execution {execution.n8n_execution_id}"
+            )
+
+    execution.status = "error"
+    set_execution_result(execution, {"error": "Cancelled by user"})
+    execution.completed_at = datetime.now(timezone.utc)
+    event = execution_event(execution)
+    db.commit()
+    publish_execution_events([event])
+    db.refresh(execution)
+    return execution
+
+
+def apply_execution_callback(
+    db: Session, execution_id: int, callback: ExecutionCallback
+) -> Optional[bool]:
+    """
+    Store a completion report from n8n with one conditional UPDATE
+
+    Returns True if applied, False if the execution had already finished
+    (e.g. cancelled by the user) and None if it does not exist.
+    """
+    if callback.status not in CALLBACK_STATUSES:
+        raise_validation_error(
+            f"Invalid status '{callback.status}', expected one of {', '.join(CALLBACK_STATUSES)}"
+        )
+
+    values: Dict[str, Any] = {"status": callback.status}
+    if callback.error is not None:
+        values.update(result_values({"error": callback.error}))
+    elif callback.result is not None:
+        values.update(result_values(callback.result))
+    if callback.n8n_execution_id is not None:
+        values["n8n_execution_id"] = callback.n8n_execution_id
+    if callback.status in FINAL_STATUSES:
+        values["completed_at"] = datetime.now(timezone.utc)
+
+    updated = (
+        db.query(WorkflowExecution)
+        .filter(
+            WorkflowExecution.id == execution_id,
+            WorkflowExecution.status.notin_(FINAL_STATUSES),
+        )
+        .update(values, synchronize_session=False)
+    )
+    db.commit()
+    if updated:
+        publish_execution_changes(db, [execution_id])
+        return True
+
+    exists = db.query(WorkflowExecution.id).filter(WorkflowExecution.id == execution_id).first()
+    return False if exists else None
+
+
+def update_execution_status(
+    db: Session, execution_id: int, user_id: int, status_update: ExecutionStatusUpdate
+) -> Optional[WorkflowExecution]:
+    """Update execution status (and result) reported by n8n"""
+    execution = get_execution_by_id(db, execution_id, user_id)
+    if not execution:
+        return None
+
+    execution.status = status_update.status
+    if status_update.result is not None:
+        set_execution_result(execution, status_update.result)
+    if status_update.n8n_execution_id is not None:
+        execution.n8n_execution_id = status_update.n8n_execution_id
+    if status_update.status in FINAL_STATUSES and execution.completed_at is None:
+        execution.completed_at = datetime.now(timezone.utc)
+
+    event = execution_event(execution)
+    db.commit()
+    publish_execution_events([event])
+    db.refresh(execution)
+    return execution
 
 
 class ExecutionService:
     """Service class for execution operations"""
 
     @staticmethod
-    def get_user_executions(db: Session, user: User) -> List[WorkflowExecution]:
-        """Get all executions for a user"""
-        return get_executions_by_user(db, user.id)
+    def get_user_executions_page(
+        db: Session, user: User, limit: int, cursor: Optional[str] = None, **filters
+    ) -> Dict[str, Any]:
+        """Page of the user's executions plus the next page's cursor"""
+        executions, next_cursor = get_executions_page(
+            db, user.id, limit, cursor=cursor, **filters
+        )
+        return {"items": executions, "next_cursor": next_cursor}
+
+    @staticmethod
+    def get_user_execution_data_page(
+        db: Session, user: User, limit: int, cursor: Optional[str] = None, **filters
+    ) -> Dict[str, Any]:
+        """Page of the user's executions that have a result, as data rows"""
+        executions, next_cursor = get_executions_page(
+            db, user.id, limit, cursor=cursor, with_result=True, **filters
+        )
+        items = [
+            {
+                "execution_id": ex.id,
+                "workflow_config_id": ex.workflow_config_id,
+                "created_at": ex.created_at,
+                "completed_at": ex.completed_at,
+                "data": ex.result,
+                "source": "database",
+            }
+            for ex in executions
+        ]
+        return {"items": items, "next_cursor": next_cursor}
 
     @staticmethod
     def get_execution_by_id(db: Session, execution_id: int, user: User) -> WorkflowExecution:
@@ -35,80 +596,91 @@ class ExecutionService:
         return execution
 
     @staticmethod
-    def export_executions_csv(db: Session, user: User) -> StreamingResponse:
-        """Export executions as CSV for user"""
-        executions = ExecutionService.get_user_executions(db, user)
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow([
-            "id",
-            "workflow_config_id",
-            "status",
-            "keywords",
-            "location",
-            "n8n_execution_id",
-            "created_at",
-            "completed_at",
-        ])
-
-        for execution in executions:
-            writer.writerow([
-                execution.id,
-                execution.workflow_config_id,
-                execution.status,
-                execution.keywords,
-                execution.location,
-                execution.n8n_execution_id or "",
-                execution.created_at.isoformat() if execution.created_at else "",
-                execution.completed_at.isoformat() if execution.completed_at else "",
-            ])
-
-        output.seek(0)
-        headers = {"Content-Disposition": 'attachment; filename="executions.csv"'}
+    def stream_execution_events(
+        request, user: User, execution_ids: Optional[str] = None
+    ) -> StreamingResponse:
+        """
+        Server-Sent Events with status changes of the user's executions
+        (all of them, or the comma-separated execution_ids)
+        """
+        watched = None
+        if execution_ids:
+            try:
+                watched = {int(value) for value in execution_ids.split(",") if value.strip()}
+            except ValueError:
+                raise_validation_error("ids must be a comma-separated list of execution IDs")
+            if len(watched) > settings.EXECUTION_EVENTS_MAX_IDS:
+                raise_validation_error(
+                    f"A stream can watch at most {settings.EXECUTION_EVENTS_MAX_IDS} executions"
+                )
         return StreamingResponse(
-            output,
-            media_type="text/csv",
-            headers=headers,
+            stream_execution_events(request, user.id, watched),
+            media_type="text/event-stream",
+            # No proxy buffering or caching of the stream
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
         )
 
     @staticmethod
-    def get_execution_data(db: Session, user: User) -> List[dict]:
-        """Get execution data rows for user"""
-        executions = get_executions_by_user(db, user.id)
-        return [
-            {
-                "id": ex.id,
-                "workflow_config_id": ex.workflow_config_id,
-                "status": ex.status,
-                "keywords": ex.keywords,
-                "location": ex.location,
-                "n8n_execution_id": ex.n8n_execution_id,
-                "created_at": ex.created_at.isoformat() if ex.created_at else None,
-                "completed_at": ex.completed_at.isoformat() if ex.completed_at else None,
-            }
-            for ex in executions
-        ]
+    def create_execution_events_token(user: User) -> Dict[str, Any]:
+        """Stream-only token for GET /executions/events?stream_token="""
+        return {
+            "stream_token": create_execution_events_token(user.id),
+            "expires_in": settings.EXECUTION_EVENTS_TOKEN_TTL_SECONDS,
+        }
+
+    @staticmethod
+    def export_executions(
+        user: User, fmt: str = "csv", row_group_size: Optional[int] = None
+    ) -> StreamingResponse:
+        """
+        Export executions for user as CSV, NDJSON, Parquet or Arrow, streamed
+        from a server-side cursor (services.export_service)
+        """
+        return export_response("executions", fmt, user.id, row_group_size)
 
     @staticmethod
-    def create_execution(db: Session, execution_data: dict, user: User) -> WorkflowExecution:
+    async def create_execution(db: Session, execution_data: WorkflowExecutionCreate, user: User) -> WorkflowExecution:
         """Create a new execution"""
-        create_data = WorkflowExecutionCreate(**execution_data)
-        return create_execution(db, user, create_data)
+        return await create_execution(db, user, execution_data)
 
     @staticmethod
-    def cancel_execution(db: Session, execution_id: int, user: User) -> bool:
+    async def create_executions_batch(
+        db: Session, batch_data: WorkflowExecutionBatchCreate, user: User
+    ) -> Dict[str, Any]:
+        """Create and trigger a batch of executions"""
+        workflow, executions = await create_executions_batch(db, user, batch_data)
+        return {
+            "workflow_config_id": workflow.id,
+            "execution_ids": [execution.id for execution in executions],
+            "total": len(executions),
+            "failed": sum(1 for execution in executions if execution.status == "error"),
+            "executions": executions,
+        }
+
+    @staticmethod
+    async def cancel_execution(db: Session, execution_id: int, user: User) -> WorkflowExecution:
         """Cancel an execution"""
-        success = cancel_execution(db, execution_id, user.id)
-        if not success:
+        execution = await cancel_execution(db, execution_id, user.id)
+        if not execution:
+            raise_execution_not_found_error(execution_id)
+        return execution
+
+    @staticmethod
+    def apply_execution_callback(
+        db: Session, execution_id: int, callback: ExecutionCallback, token: Optional[str]
+    ) -> Dict[str, Any]:
+        """Apply an n8n completion callback after checking its token"""
+        if not verify_execution_callback_token(execution_id, token):
+            raise_authorization_error("Invalid execution callback token")
+        applied = apply_execution_callback(db, execution_id, callback)
+        if applied is None:
             raise_execution_not_found_error(execution_id)
-        return success
+        return {"execution_id": execution_id, "applied": applied}
 
     @staticmethod
-    def update_execution_status(db: Session, execution_id: int, status_update: dict, user: User) -> WorkflowExecution:
+    def update_execution_status(db: Session, execution_id: int, status_update: ExecutionStatusUpdate, user: User) -> WorkflowExecution:
         """Update execution status"""
-        update_data = ExecutionStatusUpdate(**status_update)
-        execution = update_execution_status(db, execution_id, user.id, update_data)
+        execution = update_execution_status(db, execution_id, user.id, status_update)
         if not execution:
             raise_execution_not_found_error(execution_id)
         return execution
\ No newline at end of file
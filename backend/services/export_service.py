@@ -0,0 +1,270 @@
+"""
+Streaming exports of a user's executions and LinkedIn results
+
+Rows come from a server-side cursor (yield_per / stream_results) in batches
+of EXPORT_BATCH_SIZE (or the requested row group size) and are encoded and
+sent batch by batch, so memory stays flat and the first bytes go out before
+the query is exhausted, however long the history is. The generators open
+their own session: they run while the response is being sent, after the
+endpoint has returned.
+
+Formats:
+    csv      one chunk per batch (executions without the result JSON)
+    ndjson   one JSON object per line, result JSON kept as is
+    parquet  one row group per batch
+    arrow    Arrow IPC stream, one record batch per batch
+In the columnar formats the result JSON is a JSON-encoded string column.
+"""
+
+import csv
+import io
+import json
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from app.config import settings
+from app.database import SessionLocal
+from fastapi.responses import StreamingResponse
+from models.execution import WorkflowExecution
+from models.linkedin_result import LinkedinResult
+from sqlalchemy import JSON, DateTime, Integer
+from utils.exceptions import raise_unsupported_format_error
+
+logger = logging.getLogger(__name__)
+
+EXECUTION_EXPORT_COLUMNS = (
+    WorkflowExecution.id,
+    WorkflowExecution.workflow_config_id,
+    WorkflowExecution.status,
+    WorkflowExecution.keywords,
+    WorkflowExecution.location,
+    WorkflowExecution.n8n_execution_id,
+    WorkflowExecution.created_at,
+    WorkflowExecution.completed_at,
+)
+
+LINKEDIN_EXPORT_COLUMNS = (
+    LinkedinResult.id,
+    LinkedinResult.workflow_execution_id,
+    LinkedinResult.vacancy_link,
+    LinkedinResult.title,
+)
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+FILE_EXTENSIONS = {"csv": "csv", "ndjson": "ndjson", "parquet": "parquet", "arrow": "arrows"}
+COLUMNAR_FORMATS = ("parquet", "arrow")
+EXPORT_FORMATS = ("csv", "ndjson", *COLUMNAR_FORMATS)
+
+
+def execution_rows_query(db, user_id: int, columns=EXECUTION_EXPORT_COLUMNS):
+    return (
+        db.query(*columns)
+        .filter(WorkflowExecution.user_id == user_id)
+        .order_by(WorkflowExecution.created_at.desc(), WorkflowExecution.id.desc())
+    )
+
+
+def linkedin_rows_query(db, user_id: int, columns=LINKEDIN_EXPORT_COLUMNS):
+    return (
+        db.query(*columns)
+        .join(WorkflowExecution)
+        .filter(WorkflowExecution.user_id == user_id)
+        .order_by(LinkedinResult.id.desc())
+    )
+
+
+# dataset -> (query builder, CSV columns, NDJSON/columnar columns)
+DATASETS: Dict[str, tuple] = {
+    "executions": (
+        execution_rows_query,
+        EXECUTION_EXPORT_COLUMNS,
+        EXECUTION_EXPORT_COLUMNS + (WorkflowExecution.result,),
+    ),
+    "linkedin_results": (
+        linkedin_rows_query,
+        LINKEDIN_EXPORT_COLUMNS,
+        LINKEDIN_EXPORT_COLUMNS,
+    ),
+}
+
+
+def iter_row_batches(
+    query, batch_size: Optional[int] = None
+) -> Iterator[List[Sequence[Any]]]:
+    """Rows of `query` in lists of batch_size, read through a server-side cursor"""
+    batch_size = max(batch_size or settings.EXPORT_BATCH_SIZE, 1)
+    batch: List[Sequence[Any]] = []
+    for row in query.yield_per(batch_size):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _iter_batches(
+    build_query: Callable, user_id: int, columns, batch_size: Optional[int]
+) -> Iterator[List[Sequence[Any]]]:
+    db = SessionLocal()
+    try:
+        yield from iter_row_batches(build_query(db, user_id, columns), batch_size)
+    finally:
+        db.close()
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def stream_csv(
+    build_query: Callable, user_id: int, columns, batch_size: Optional[int] = None
+) -> Iterator[str]:
+    """CSV, one chunk per batch of rows"""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow([column.key for column in columns])
+    # The header goes out before the query runs
+    yield output.getvalue()
+
+    for batch in _iter_batches(build_query, user_id, columns, batch_size):
+        output.seek(0)
+        output.truncate()
+        writer.writerows([_csv_value(value) for value in row] for row in batch)
+        yield output.getvalue()
+
+
+def stream_ndjson(
+    build_query: Callable, user_id: int, columns, batch_size: Optional[int] = None
+) -> Iterator[str]:
+    """Newline-delimited JSON, one chunk per batch of rows"""
+    keys = [column.key for column in columns]
+    for batch in _iter_batches(build_query, user_id, columns, batch_size):
+        yield "".join(
+            json.dumps(dict(zip(keys, row)), default=_json_default, ensure_ascii=False)
+            + "\n"
+            for row in batch
+        )
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that collects what pyarrow writes until drained"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _arrow_schema(columns):
+    # pyarrow is imported on first use: only columnar exports need it
+    import pyarrow as pa
+
+    def arrow_type(column):
+        if isinstance(column.type, Integer):
+            return pa.int64()
+        if isinstance(column.type, DateTime):
+            return pa.timestamp("us", tz="UTC")
+        return pa.string()
+
+    return pa.schema([pa.field(column.key, arrow_type(column)) for column in columns])
+
+
+def stream_columnar(
+    fmt: str,
+    build_query: Callable,
+    user_id: int,
+    columns,
+    batch_size: Optional[int] = None,
+) -> Iterator[bytes]:
+    """Parquet (one row group per batch) or Arrow IPC stream (one record batch per batch)"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _arrow_schema(columns)
+    json_columns = [
+        index for index, column in enumerate(columns) if isinstance(column.type, JSON)
+    ]
+    sink = _ChunkSink()
+    if fmt == "parquet":
+        writer = pq.ParquetWriter(sink, schema, compression="snappy")
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+    try:
+        # Arrow IPC starts with the schema: send it right away
+        yield sink.drain()
+        for batch in _iter_batches(build_query, user_id, columns, batch_size):
+            values = [list(column) for column in zip(*batch)]
+            for index in json_columns:
+                values[index] = [
+                    json.dumps(value, ensure_ascii=False) if value is not None else None
+                    for value in values[index]
+                ]
+            record_batch = pa.RecordBatch.from_arrays(values, schema=schema)
+            if fmt == "parquet":
+                writer.write_batch(record_batch, row_group_size=len(batch))
+            else:
+                writer.write_batch(record_batch)
+            yield sink.drain()
+    finally:
+        writer.close()
+    # Parquet footer / end-of-stream marker
+    yield sink.drain()
+
+
+def export_response(
+    dataset: str, fmt: str, user_id: int, batch_size: Optional[int] = None
+) -> StreamingResponse:
+    """Streaming download of one of the DATASETS in format `fmt`"""
+    fmt = fmt.lower()
+    if fmt not in EXPORT_FORMATS:
+        raise_unsupported_format_error("export", list(EXPORT_FORMATS))
+
+    build_query, csv_columns, columns = DATASETS[dataset]
+    if fmt == "csv":
+        body = stream_csv(build_query, user_id, csv_columns, batch_size)
+    elif fmt == "ndjson":
+        body = stream_ndjson(build_query, user_id, columns, batch_size)
+    else:
+        body = stream_columnar(fmt, build_query, user_id, columns, batch_size)
+
+    filename = f"{dataset}.{FILE_EXTENSIONS[fmt]}"
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
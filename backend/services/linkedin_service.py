@@ -1,9 +1,12 @@
-from typing import List
+from typing import List, Optional
+
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from models.execution import WorkflowExecution
 from models.linkedin_result import LinkedinResult
 from models.user import User
+from services.export_service import export_response
 
 
 class LinkedinService:
@@ -31,3 +34,12 @@ class LinkedinService:
         Get all LinkedIn results (debug endpoint)
         """
         return db.query(LinkedinResult).order_by(LinkedinResult.id.desc()).all()
+
+    @staticmethod
+    def export_user_linkedin_results(
+        user: User, fmt: str = "csv", row_group_size: Optional[int] = None
+    ) -> StreamingResponse:
+        """
+        Export LinkedIn results for a user, streamed from a server-side cursor
+        """
+        return export_response("linkedin_results", fmt, user.id, row_group_size)
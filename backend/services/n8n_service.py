@@ -1,11 +1,63 @@
+import asyncio
 import logging
-from typing import Any, Dict, Optional, Tuple
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
 import httpx
 from app.config import settings
+from services.circuit_breaker import CircuitOpenError, backoff_delays, get_breaker
+from services.trigger_routes import EXECUTE, WEBHOOK, order_routes, record_route_result
+from services.workflow_cache import (
+    cache_workflow,
+    get_cached_workflow,
+    invalidate_workflow,
+    summarize_workflow,
+)
+from utils.coordination import run_coordination_call
+from utils.json_stream import JsonStreamError, stream_json_items
+from utils.workflow_validator import compile_trigger_metadata
 
 logger = logging.getLogger(__name__)
 
+# Answers worth retrying for idempotent requests
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# A 500 from a trigger route is the error of that one workflow (scored per
+# workflow by services.trigger_routes); only these say n8n itself is unhealthy
+TRIGGER_BREAKER_FAILURE_CODES = (502, 503, 504)
+
+# Trigger payload fields that are credentials (never logged)
+SECRET_PAYLOAD_KEYS = ("callback_token",)
+
+
+def _mask_payload(data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Trigger payload for logging, with credentials masked"""
+    if not data:
+        return data
+    return {
+        key: "***" if key in SECRET_PAYLOAD_KEYS else value
+        for key, value in data.items()
+    }
+
+
+class _TrackedSink:
+    """Result sink wrapper that counts items and remembers if it was closed"""
+
+    def __init__(self, sink):
+        self.sink = sink
+        self.items = 0
+        self.closed = False
+
+    def add(self, item: Any) -> None:
+        self.items += 1
+        self.sink.add(item)
+
+    def close(self) -> Dict[str, Any]:
+        self.closed = True
+        return self.sink.close()
+
 
 class N8NService:
     def __init__(self):
@@ -17,19 +69,132 @@ class N8NService:
         }
         if self.api_key:
             self.headers["X-N8N-API-KEY"] = self.api_key
+        # One pooled client per event loop (see get_client)
+        self._clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._clients_guard = threading.Lock()
+
+    def _build_client(self) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=settings.N8N_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.N8N_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.N8N_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        )
+        return httpx.AsyncClient(limits=limits, http2=settings.N8N_HTTP2_ENABLED)
+
+    def get_client(self) -> httpx.AsyncClient:
+        """
+        Long-lived pooled client for the running event loop
+
+        Pooled connections belong to the loop that opened them, so a client
+        is created lazily per loop (FastAPI's loop, or the Celery worker
+        process loop from utils.async_runner) and reused for every call.
+        """
+        loop = asyncio.get_running_loop()
+        with self._clients_guard:
+            for stale in [other for other in self._clients if other.is_closed()]:
+                # Closed without aclose(): its connections cannot be closed anymore
+                logger.warning("n8n HTTP client of a closed event loop dropped")
+                del self._clients[stale]
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                client = self._clients[loop] = self._build_client()
+            return client
+
+    async def start(self) -> None:
+        """Open the shared client on the current loop (app/worker startup)"""
+        self.get_client()
+        logger.info(
+            f"n8n HTTP client ready (max_connections={settings.N8N_HTTP_MAX_CONNECTIONS}, "
+            f"keep-alive={settings.N8N_HTTP_MAX_KEEPALIVE_CONNECTIONS})"
+        )
+
+    async def aclose(self) -> None:
+        """
+        Close the shared clients (app/worker shutdown): this loop's here, those
+        of other loops on their own loop
+        """
+        current = asyncio.get_running_loop()
+        with self._clients_guard:
+            clients = list(self._clients.items())
+            self._clients.clear()
+        for loop, client in clients:
+            if client.is_closed or loop.is_closed():
+                continue
+            if loop is current:
+                await client.aclose()
+            elif loop.is_running():
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+                )
+            else:
+                # Runs as soon as that loop runs again
+                loop.call_soon_threadsafe(loop.create_task, client.aclose())
+
+    @asynccontextmanager
+    async def _use_client(
+        self, client: Optional[httpx.AsyncClient] = None
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        """Use the caller's client or the shared pooled one (never closed here)"""
+        yield client if client is not None else self.get_client()
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        method: str,
+        url: str,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Send one request through the endpoint's circuit breaker. With
+        stream=True only the headers are read; the caller closes the response.
+        """
+        breaker = get_breaker(endpoint)
+        breaker.before_call()
+        healthy = False
+        try:
+            request = client.build_request(method, url, headers=self.headers, **kwargs)
+            response = await client.send(request, stream=stream)
+            if endpoint in (WEBHOOK, EXECUTE):
+                healthy = response.status_code not in TRIGGER_BREAKER_FAILURE_CODES
+            else:
+                healthy = response.status_code < 500
+            return response
+        finally:
+            # Also runs for errors and cancellation, so a half-open probe always resolves
+            breaker.record(healthy)
+
+    async def _send_with_retries(
+        self, client: httpx.AsyncClient, endpoint: str, method: str, url: str, **kwargs
+    ) -> httpx.Response:
+        """
+        _send for idempotent requests: transport errors, 429 and 5xx are
+        retried N8N_RETRY_ATTEMPTS times in total with jittered exponential
+        backoff. An open circuit is never retried.
+        """
+        delays = backoff_delays(max(settings.N8N_RETRY_ATTEMPTS, 1))
+        for attempt in range(len(delays) + 1):
+            try:
+                response = await self._send(client, endpoint, method, url, **kwargs)
+            except CircuitOpenError:
+                raise
+            except httpx.TransportError:
+                if attempt == len(delays):
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt == len(delays):
+                    return response
+            logger.info(
+                f"Retrying n8n {method} {url} in {delays[attempt]:.2f}s "
+                f"(attempt {attempt + 2}/{len(delays) + 1})"
+            )
+            await asyncio.sleep(delays[attempt])
 
     def _extract_webhook_path_from_json(
         self, workflow_json: Dict[str, Any]
     ) -> Optional[str]:
-        nodes = workflow_json.get("nodes", [])
-        for node in nodes:
-            if node.get("type") == "n8n-nodes-base.webhook":
-                params = node.get("parameters", {})
-                # Try to get path from webhook node
-                path = params.get("path") or params.get("webhookId")
-                if path:
-                    return path
-        return None
+        return compile_trigger_metadata(workflow_json)["trigger_webhook_path"]
 
     async def trigger_workflow(
         self,
@@ -37,7 +202,30 @@ class N8NService:
         data: Dict[str, Any],
         webhook_path: Optional[str] = None,
         workflow_json: Optional[Dict[str, Any]] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        check_workflow: Optional[bool] = None,
+        sink=None,
     ) -> Dict[str, Any]:
+        """
+        Trigger a workflow through the webhook or the execute API
+
+        Default order is webhook first when a webhook path is known, execute
+        API first otherwise; the route that last worked for this workflow
+        (services.trigger_routes) is tried first, so a trigger normally costs
+        one request. The existence check before it is served from the
+        workflow cache; pass check_workflow=False to skip it entirely
+        (default: N8N_WORKFLOW_CHECK_ON_TRIGGER).
+
+        With a `sink` (services.result_sinks) the response body is parsed
+        incrementally and its result items go to the sink as they arrive;
+        the returned dict then holds the envelope and the sink summary
+        instead of the items. A malformed body counts as a route failure;
+        once items reached the sink no other route is tried (it would store
+        them again), and the sink is closed however the trigger ends.
+        """
+        if check_workflow is None:
+            check_workflow = settings.N8N_WORKFLOW_CHECK_ON_TRIGGER
+
         # Try to extract webhook path from workflow JSON if not provided
         if not webhook_path and workflow_json:
             webhook_path = self._extract_webhook_path_from_json(workflow_json)
@@ -53,161 +241,197 @@ class N8NService:
             # Ensure proper URL construction (handle trailing/leading slashes)
             webhook_url = webhook_url.rstrip("/") + "/" + webhook_suffix.lstrip("/")
 
-        async with httpx.AsyncClient() as client:
-            # First, try to verify workflow exists
-            workflow_check = await self.get_workflow(workflow_id)
-            if workflow_check is None:
-                logger.warning(
-                    f"Workflow {workflow_id} not found via API check, but will try execute/webhook anyway. "
-                    f"This might be normal if Public API is disabled."
+        urls = {WEBHOOK: webhook_url, EXECUTE: execute_url}
+        default_order = (WEBHOOK, EXECUTE) if webhook_path else (EXECUTE, WEBHOOK)
+        routes = await run_coordination_call(order_routes, workflow_id, default_order)
+
+        tracked = _TrackedSink(sink) if sink is not None else None
+        try:
+            async with self._use_client(client) as client:
+                # First, try to verify workflow exists
+                workflow_check = (
+                    await self.get_workflow_metadata(workflow_id, client=client)
+                    if check_workflow
+                    else {"exists": True}
                 )
-            # 1) If webhook_path provided, try webhook first (for cloud without Public API)
-            if webhook_path:
-                logger.info(
-                    "Attempting n8n webhook trigger. webhook_path=%s url=%s data=%s",
-                    webhook_path,
-                    webhook_url,
-                    data,
-                )
-                try:
-                    response = await client.post(
-                        webhook_url, json=data, headers=self.headers, timeout=30.0
-                    )
-                    response.raise_for_status()
-                    body = response.json()
-                    logger.info(
-                        "n8n webhook PRIMARY SUCCESS. url=%s status=%s body=%s",
-                        webhook_url,
-                        response.status_code,
-                        body,
-                    )
-                    return body
-                except httpx.HTTPError as e:
-                    status_code = (
-                        getattr(e.response, "status_code", None)
-                        if hasattr(e, "response")
-                        else None
-                    )
-                    error_text = (
-                        getattr(e.response, "text", None)
-                        if hasattr(e, "response")
-                        else None
-                    )
+                if workflow_check is None or not workflow_check["exists"]:
                     logger.warning(
-                        "n8n webhook PRIMARY FAILED. url=%s status=%s error=%s data=%s",
-                        webhook_url,
-                        status_code,
-                        error_text or str(e),
-                        data,
+                        f"Workflow {workflow_id} not found via API check, but will try execute/webhook anyway. "
+                        f"This might be normal if Public API is disabled."
                     )
-                    # fall through to execute attempt
 
-            # 2) Try execute API
-            try:
-                response = await client.post(
-                    execute_url, json=data, headers=self.headers, timeout=30.0
-                )
-                response.raise_for_status()
-                body = response.json()
-                logger.info(
-                    "n8n execute success. url=%s status=%s body=%s",
-                    execute_url,
-                    response.status_code,
-                    body,
-                )
-                return body
-            except httpx.HTTPError as e:
-                logger.exception(
-                    "n8n execute API failed. url=%s status=%s text=%s data=%s",
-                    execute_url,
-                    (
-                        getattr(e.response, "status_code", None)
-                        if hasattr(e, "response")
-                        else None
-                    ),
-                    (
-                        getattr(e.response, "text", None)
-                        if hasattr(e, "response")
-                        else None
-                    ),
-                    data,
-                )
-                # 3) Fallback to webhook (even if webhook_path was None, use workflow_id)
-                try:
-                    response = await client.post(
-                        webhook_url, json=data, headers=self.headers, timeout=30.0
+                errors: Dict[str, Exception] = {}
+                log_data = _mask_payload(data)
+                for attempt, route in enumerate(routes):
+                    url = urls[route]
+                    logger.info(
+                        "Attempting n8n %s trigger (%s). url=%s data=%s",
+                        route,
+                        "primary" if attempt == 0 else "fallback",
+                        url,
+                        log_data,
                     )
-                    response.raise_for_status()
-                    body = response.json()
+                    started = time.perf_counter()
+                    try:
+                        response = await self._send(
+                            client,
+                            route,
+                            "POST",
+                            url,
+                            stream=tracked is not None,
+                            json=data,
+                            timeout=30.0,
+                        )
+                        try:
+                            if tracked is not None and response.is_error:
+                                # Error bodies are small and used in the log below
+                                await response.aread()
+                            response.raise_for_status()
+                            body = (
+                                await stream_json_items(response.aiter_bytes(), tracked)
+                                if tracked is not None
+                                else response.json()
+                            )
+                        finally:
+                            await response.aclose()
+                    except CircuitOpenError as e:
+                        # Not the route's fault: keep its score, just skip it
+                        errors[route] = e
+                        logger.warning(f"n8n {route} trigger skipped: {str(e)}")
+                        continue
+                    except (httpx.HTTPError, JsonStreamError) as e:
+                        await run_coordination_call(
+                            record_route_result,
+                            workflow_id,
+                            route,
+                            False,
+                            time.perf_counter() - started,
+                        )
+                        errors[route] = e
+                        logger.warning(
+                            "n8n %s trigger FAILED. url=%s status=%s error=%s data=%s",
+                            route,
+                            url,
+                            self._error_status(e),
+                            self._error_text(e) or str(e),
+                            log_data,
+                        )
+                        if tracked is not None and tracked.items:
+                            # Part of the result is stored already: another route
+                            # would store it a second time
+                            error_msg = (
+                                f"Failed to trigger n8n workflow {workflow_id}: {route} response "
+                                f"broke off after {tracked.items} result item(s): {str(e)}"
+                            )
+                            logger.error(error_msg)
+                            raise Exception(error_msg) from e
+                        continue
+
+                    await run_coordination_call(
+                        record_route_result,
+                        workflow_id,
+                        route,
+                        True,
+                        time.perf_counter() - started,
+                    )
+                    # Result bodies can be huge: only their size goes to INFO
                     logger.info(
-                        "n8n webhook FALLBACK SUCCESS. url=%s status=%s body=%s",
-                        webhook_url,
+                        "n8n %s trigger SUCCESS. url=%s status=%s bytes=%s",
+                        route,
+                        url,
                         response.status_code,
-                        body,
+                        response.num_bytes_downloaded,
                     )
+                    if sink is None:
+                        logger.debug("n8n %s trigger body=%s", route, body)
                     return body
-                except httpx.HTTPError as webhook_err:
-                    status_code = (
-                        getattr(webhook_err.response, "status_code", None)
-                        if hasattr(webhook_err, "response")
-                        else None
-                    )
-                    error_text = (
-                        getattr(webhook_err.response, "text", None)
-                        if hasattr(webhook_err, "response")
-                        else None
-                    )
-
-                    logger.exception(
-                        "n8n webhook fallback failed. url=%s status=%s text=%s data=%s",
-                        webhook_url,
-                        status_code,
-                        error_text,
-                        data,
-                    )
-
-                    # Provide detailed error message
-                    execute_status = (
-                        getattr(e.response, "status_code", None)
-                        if hasattr(e, "response")
-                        else None
-                    )
-                    if execute_status == 404 and status_code == 404:
-                        error_msg = (
-                            f"Failed to trigger workflow {workflow_id}: "
-                            f"Both API execute and webhook returned 404. "
-                            f"This usually means: 1) Webhook node doesn't exist in workflow, "
-                            f"2) Webhook path '{webhook_suffix}' is incorrect, or "
-                            f"3) Public API is disabled. "
-                            f"Please add a Webhook node to the workflow with correct path, "
-                            f"or enable Public API (N8N_PUBLIC_API_DISABLED=false)."
-                        )
-                    else:
-                        error_msg = (
-                            f"Failed to trigger n8n workflow {workflow_id}: "
-                            f"Execute API failed with {execute_status}, "
-                            f"webhook fallback failed with {status_code}. "
-                            f"Original error: {str(e)}"
-                        )
-                    raise Exception(error_msg)
+        finally:
+            # Failed attempts never reach stream_json_items' close()
+            if tracked is not None and not tracked.closed:
+                tracked.close()
+
+        # Provide detailed error message
+        execute_status = self._error_status(errors.get(EXECUTE))
+        webhook_status = self._error_status(errors.get(WEBHOOK))
+        if execute_status == 404 and webhook_status == 404:
+            error_msg = (
+                f"Failed to trigger workflow {workflow_id}: "
+                f"Both API execute and webhook returned 404. "
+                f"This usually means: 1) Webhook node doesn't exist in workflow, "
+                f"2) Webhook path '{webhook_suffix}' is incorrect, or "
+                f"3) Public API is disabled. "
+                f"Please add a Webhook node to the workflow with correct path, "
+                f"or enable Public API (N8N_PUBLIC_API_DISABLED=false)."
+            )
+        else:
+            error_msg = (
+                f"Failed to trigger n8n workflow {workflow_id}: "
+                f"Execute API failed with {execute_status}, "
+                f"webhook failed with {webhook_status}. "
+                f"Original error: {str(errors.get(EXECUTE) or errors.get(WEBHOOK))}"
+            )
+        logger.error(error_msg)
+        raise Exception(error_msg)
+
+    @staticmethod
+    def _error_status(error: Optional[Exception]) -> Optional[int]:
+        response = getattr(error, "response", None) if error is not None else None
+        return getattr(response, "status_code", None)
+
+    @staticmethod
+    def _error_text(error: Optional[Exception]) -> Optional[str]:
+        response = getattr(error, "response", None) if error is not None else None
+        return getattr(response, "text", None)
 
     async def get_execution_status(self, execution_id: str) -> Optional[Dict[str, Any]]:
         url = f"{self.base_url}/api/v1/executions/{execution_id}"
 
-        async with httpx.AsyncClient() as client:
+        async with self._use_client() as client:
             try:
-                response = await client.get(url, headers=self.headers, timeout=10.0)
+                response = await self._send_with_retries(
+                    client, "executions", "GET", url, timeout=10.0
+                )
                 response.raise_for_status()
                 return response.json()
             except httpx.HTTPError:
                 return None
 
+    async def list_executions(
+        self,
+        workflow_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 250,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        One page of n8n's executions listing, newest first, without run data:
+        {"data": [{"id", "status", "startedAt", "stoppedAt", ...}], "nextCursor"}.
+        Raises httpx.HTTPError if n8n cannot be asked.
+        """
+        url = f"{self.base_url}/api/v1/executions"
+        params: Dict[str, Any] = {"limit": limit, "includeData": "false"}
+        if workflow_id:
+            params["workflowId"] = workflow_id
+        if status:
+            params["status"] = status
+        if cursor:
+            params["cursor"] = cursor
+
+        async with self._use_client() as client:
+            response = await self._send_with_retries(
+                client, "executions", "GET", url, params=params, timeout=30.0
+            )
+            response.raise_for_status()
+            return response.json()
+
     async def cancel_execution(self, execution_id: str) -> bool:
         url = f"{self.base_url}/api/v1/executions/{execution_id}/stop"
 
-        async with httpx.AsyncClient() as client:
+        async with self._use_client() as client:
             try:
-                response = await client.post(url, headers=self.headers, timeout=10.0)
+                response = await self._send(
+                    client, "executions", "POST", url, timeout=10.0
+                )
                 response.raise_for_status()
                 return True
             except httpx.HTTPError:
@@ -218,13 +442,17 @@ class N8NService:
     ) -> Dict[str, Any]:
         url = f"{self.base_url}/api/v1/workflows"
 
-        async with httpx.AsyncClient() as client:
+        async with self._use_client() as client:
             try:
-                response = await client.post(
-                    url, json=workflow_json, headers=self.headers, timeout=30.0
+                response = await self._send(
+                    client, "workflows", "POST", url, json=workflow_json, timeout=30.0
                 )
                 response.raise_for_status()
-                return response.json()
+                created = response.json()
+                if isinstance(created, dict) and created.get("id") is not None:
+                    # Replace a cached "not found" for this ID
+                    await run_coordination_call(invalidate_workflow, str(created["id"]))
+                return created
             except httpx.HTTPStatusError as e:
                 error_detail = "Unknown error"
                 try:
@@ -240,15 +468,17 @@ class N8NService:
     ) -> Dict[str, Any]:
         url = f"{self.base_url}/api/v1/workflows/{workflow_id}"
 
-        async with httpx.AsyncClient() as client:
+        async with self._use_client() as client:
             try:
-                response = await client.put(
-                    url, json=workflow_json, headers=self.headers, timeout=30.0
+                response = await self._send(
+                    client, "workflows", "PUT", url, json=workflow_json, timeout=30.0
                 )
                 response.raise_for_status()
+                await run_coordination_call(invalidate_workflow, workflow_id)
                 return response.json()
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 404:
+                    await run_coordination_call(invalidate_workflow, workflow_id)
                     raise Exception(f"Workflow {workflow_id} not found in n8n")
                 error_detail = "Unknown error"
                 try:
@@ -259,25 +489,57 @@ class N8NService:
             except httpx.HTTPError as e:
                 raise Exception(f"Failed to update workflow in n8n: {str(e)}")
 
-    async def get_workflow(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+    async def _fetch_workflow(
+        self, workflow_id: str, client: Optional[httpx.AsyncClient] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """GET the workflow and refresh its cache entry: (body, metadata)"""
         url = f"{self.base_url}/api/v1/workflows/{workflow_id}"
 
-        async with httpx.AsyncClient() as client:
+        async with self._use_client(client) as client:
             try:
-                response = await client.get(url, headers=self.headers, timeout=10.0)
+                response = await self._send_with_retries(
+                    client, "workflows", "GET", url, timeout=10.0
+                )
                 if response.status_code == 404:
-                    return None
+                    metadata = summarize_workflow(workflow_id, None)
+                    await run_coordination_call(cache_workflow, workflow_id, metadata)
+                    return None, metadata
                 response.raise_for_status()
-                return response.json()
+                workflow = response.json()
+                metadata = summarize_workflow(workflow_id, workflow)
+                await run_coordination_call(cache_workflow, workflow_id, metadata)
+                return workflow, metadata
             except httpx.HTTPError:
-                return None
+                return None, None
+
+    async def get_workflow(
+        self, workflow_id: str, client: Optional[httpx.AsyncClient] = None
+    ) -> Optional[Dict[str, Any]]:
+        workflow, _ = await self._fetch_workflow(workflow_id, client=client)
+        return workflow
+
+    async def get_workflow_metadata(
+        self, workflow_id: str, client: Optional[httpx.AsyncClient] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Cached existence/metadata of a workflow ({"exists": bool, "name", ...});
+        None if n8n could not be asked (errors are not cached)
+        """
+        metadata = await run_coordination_call(get_cached_workflow, workflow_id)
+        if metadata is not None:
+            return metadata
+        _, metadata = await self._fetch_workflow(workflow_id, client=client)
+        return metadata
 
     async def delete_workflow(self, workflow_id: str) -> bool:
         url = f"{self.base_url}/api/v1/workflows/{workflow_id}"
 
-        async with httpx.AsyncClient() as client:
+        async with self._use_client() as client:
             try:
-                response = await client.delete(url, headers=self.headers, timeout=10.0)
+                response = await self._send(
+                    client, "workflows", "DELETE", url, timeout=10.0
+                )
+                await run_coordination_call(invalidate_workflow, workflow_id)
                 if response.status_code == 404:
                     return False
                 response.raise_for_status()
@@ -288,11 +550,12 @@ class N8NService:
     async def activate_workflow(self, workflow_id: str, active: bool) -> bool:
         url = f"{self.base_url}/api/v1/workflows/{workflow_id}/activate"
 
-        async with httpx.AsyncClient() as client:
+        async with self._use_client() as client:
             try:
-                response = await client.post(
-                    url, json={"active": active}, headers=self.headers, timeout=10.0
+                response = await self._send(
+                    client, "workflows", "POST", url, json={"active": active}, timeout=10.0
                 )
+                await run_coordination_call(invalidate_workflow, workflow_id)
                 if response.status_code == 404:
                     return False
                 response.raise_for_status()
@@ -0,0 +1,216 @@
+"""
+Bulk reconciliation of unfinished executions against n8n
+
+Instead of asking n8n about each pending/running execution, page through
+n8n's executions listing per workflow (newest first, without run data) back
+to the reconciliation window and match the entries against our
+n8n_execution_id values. All finished matches are written in one
+transaction; executions that never reported back within
+EXECUTION_STALE_AFTER_HOURS are closed as errors in the same transaction.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.config import settings
+from models.execution import WorkflowExecution
+from models.workflow import WorkflowConfig
+from services.execution_events import publish_execution_changes
+from services.execution_service import result_values
+from services.n8n_service import n8n_service
+from sqlalchemy import bindparam, or_, update
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+UNFINISHED_STATUSES = ("pending", "running")
+
+# n8n execution status -> our status (others mean it is still going)
+N8N_FINAL_STATUSES = {
+    "success": "success",
+    "error": "error",
+    "crashed": "error",
+    "canceled": "error",
+}
+
+
+def _parse_n8n_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def get_unfinished_executions(
+    db: Session, since: datetime
+) -> List[Tuple[int, str, str]]:
+    """(execution id, n8n_execution_id, n8n_workflow_id) of unfinished runs since `since`"""
+    return (
+        db.query(
+            WorkflowExecution.id,
+            WorkflowExecution.n8n_execution_id,
+            WorkflowConfig.n8n_workflow_id,
+        )
+        .join(WorkflowConfig, WorkflowConfig.id == WorkflowExecution.workflow_config_id)
+        .filter(
+            WorkflowExecution.status.in_(UNFINISHED_STATUSES),
+            WorkflowExecution.n8n_execution_id.isnot(None),
+            WorkflowExecution.created_at >= since,
+        )
+        .all()
+    )
+
+
+async def fetch_n8n_outcomes(
+    n8n_workflow_id: str, wanted: Set[str], since: datetime
+) -> Tuple[Dict[str, Dict[str, Any]], int]:
+    """
+    Page through a workflow's n8n executions until every wanted ID was
+    seen, the listing is older than `since` or RECONCILE_MAX_PAGES is hit.
+    Returns the matching entries and the number of requests made.
+    """
+    found: Dict[str, Dict[str, Any]] = {}
+    cursor = None
+    pages = 0
+    while pages < settings.RECONCILE_MAX_PAGES:
+        page = await n8n_service.list_executions(
+            workflow_id=n8n_workflow_id,
+            limit=settings.RECONCILE_PAGE_SIZE,
+            cursor=cursor,
+        )
+        pages += 1
+        entries = page.get("data") or []
+        for entry in entries:
+            execution_id = str(entry.get("id"))
+            if execution_id in wanted:
+                found[execution_id] = entry
+
+        oldest = _parse_n8n_time(entries[-1].get("startedAt")) if entries else None
+        cursor = page.get("nextCursor")
+        if len(found) == len(wanted) or not cursor or (oldest and oldest < since):
+            break
+    return found, pages
+
+
+def build_updates(
+    rows: List[Tuple[int, str, str]],
+    outcomes: Dict[str, Dict[str, Any]],
+    now: datetime,
+) -> List[Dict[str, Any]]:
+    """Parameter sets for the bulk UPDATE of finished executions"""
+    updates = []
+    for execution_id, n8n_execution_id, _ in rows:
+        entry = outcomes.get(n8n_execution_id)
+        status = N8N_FINAL_STATUSES.get((entry or {}).get("status"))
+        if status is None:
+            continue
+        values: Dict[str, Any] = {
+            "id": execution_id,
+            "status": status,
+            "completed_at": _parse_n8n_time(entry.get("stoppedAt")) or now,
+        }
+        if status == "error":
+            values.update(result_values({"error": f"n8n execution {entry.get('status')}"}))
+        updates.append(values)
+    return updates
+
+
+def apply_reconciliation(
+    db: Session, updates: List[Dict[str, Any]], stale_before: datetime, now: datetime
+) -> Tuple[int, int]:
+    """
+    Write finished executions and close stale ones in one transaction;
+    returns (rows updated, rows closed as stale)
+
+    The finished executions go out as a Core executemany UPDATE, whose
+    rowcount only counts rows that were still unfinished (the ORM bulk
+    UPDATE by primary key reports none).
+    """
+    executions = WorkflowExecution.__table__
+    updated = 0
+    # Successes keep whatever result the trigger/callback stored
+    for keys in (
+        {"id", "status", "completed_at"},
+        {"id", "status", "completed_at", "result", "has_result"},
+    ):
+        batch = [
+            {"execution_id": values["id"], **{key: values[key] for key in keys - {"id"}}}
+            for values in updates
+            if set(values) == keys
+        ]
+        if batch:
+            result = db.execute(
+                update(executions).where(
+                    executions.c.id == bindparam("execution_id"),
+                    # executemany cannot expand IN (...): spell the guard out
+                    or_(*(executions.c.status == status for status in UNFINISHED_STATUSES)),
+                ),
+                batch,
+            )
+            updated += result.rowcount
+
+    stale = (
+        db.query(WorkflowExecution)
+        .filter(
+            WorkflowExecution.status.in_(UNFINISHED_STATUSES),
+            WorkflowExecution.created_at < stale_before,
+        )
+        .update(
+            {
+                "status": "error",
+                **result_values({"error": "No completion reported by n8n"}),
+                "completed_at": now,
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return updated, stale
+
+
+async def reconcile_executions(db: Session, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """One reconciliation sweep; returns counts for logging/monitoring"""
+    now = now or datetime.now(timezone.utc)
+    since = now - timedelta(hours=settings.RECONCILE_WINDOW_HOURS)
+    rows = get_unfinished_executions(db, since)
+
+    by_workflow: Dict[str, Set[str]] = defaultdict(set)
+    for _, n8n_execution_id, n8n_workflow_id in rows:
+        by_workflow[n8n_workflow_id].add(n8n_execution_id)
+
+    outcomes: Dict[str, Dict[str, Any]] = {}
+    requests = 0
+    failed_workflows = 0
+    for n8n_workflow_id, wanted in by_workflow.items():
+        try:
+            found, pages = await fetch_n8n_outcomes(n8n_workflow_id, wanted, since)
+        except Exception as e:
+            failed_workflows += 1
+            logger.warning(
+                f"Could not list n8n executions of workflow {n8n_workflow_id}: {str(e)}"
+            )
+            continue
+        outcomes.update(found)
+        requests += pages
+
+    updates = build_updates(rows, outcomes, now)
+    stale_before = now - timedelta(hours=settings.EXECUTION_STALE_AFTER_HOURS)
+    updated, stale = apply_reconciliation(db, updates, stale_before, now)
+    # Open status streams follow matched executions (stale ones are too old to be watched)
+    publish_execution_changes(db, [values["id"] for values in updates])
+
+    summary = {
+        "unfinished": len(rows),
+        "workflows": len(by_workflow),
+        "n8n_requests": requests,
+        "failed_workflows": failed_workflows,
+        "updated": updated,
+        "stale": stale,
+    }
+    logger.info(f"Execution reconciliation: {summary}")
+    return summary
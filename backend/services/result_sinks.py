@@ -0,0 +1,129 @@
+"""
+Destinations for n8n result items streamed by utils.json_stream
+
+A sink gets add(item) for every item as it is parsed and close() once at
+the end; close() returns a small summary that is stored as part of the
+execution result instead of the items themselves. N8N_RESULT_SINK picks the
+sink used for triggered executions ("none" keeps buffering the whole body).
+"""
+
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from app.config import settings
+from app.database import SessionLocal
+from models.linkedin_result import LinkedinResult
+from sqlalchemy import insert
+
+logger = logging.getLogger(__name__)
+
+# Item keys the LinkedIn scraping workflow uses for a vacancy
+_LINK_KEYS = ("vacancy_link", "Vacancy", "link", "url")
+_TITLE_KEYS = ("title", "Title")
+
+
+def _first_value(item: Dict[str, Any], keys) -> Optional[str]:
+    for key in keys:
+        value = item.get(key)
+        if value:
+            return str(value)
+    return None
+
+
+class LinkedinResultSink:
+    """Batch-insert vacancy items into linkedin_results"""
+
+    name = "linkedin_results"
+
+    def __init__(
+        self,
+        execution_id: int,
+        batch_size: Optional[int] = None,
+        session_factory: Callable = SessionLocal,
+    ):
+        self.execution_id = execution_id
+        self.batch_size = max(batch_size or settings.N8N_RESULT_SINK_BATCH_SIZE, 1)
+        self.session_factory = session_factory
+        self.stored = 0
+        self.skipped = 0
+        self._rows: List[Dict[str, Any]] = []
+
+    def add(self, item: Any) -> None:
+        # n8n wraps items as {"json": {...}} in some response modes
+        if isinstance(item, dict) and isinstance(item.get("json"), dict):
+            item = item["json"]
+        link = _first_value(item, _LINK_KEYS) if isinstance(item, dict) else None
+        if not link:
+            self.skipped += 1
+            return
+        self._rows.append(
+            {
+                "workflow_execution_id": self.execution_id,
+                "vacancy_link": link,
+                "title": _first_value(item, _TITLE_KEYS) or "",
+            }
+        )
+        if len(self._rows) >= self.batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+        # Own short session: rows are committed batch by batch, and the
+        # trigger's session (shared by concurrent triggers) is left alone
+        db = self.session_factory()
+        try:
+            db.execute(insert(LinkedinResult), self._rows)
+            db.commit()
+        finally:
+            db.close()
+        self.stored += len(self._rows)
+        self._rows = []
+
+    def close(self) -> Dict[str, Any]:
+        self._flush()
+        if self.skipped:
+            logger.warning(
+                f"Execution {self.execution_id}: {self.skipped} result item(s) "
+                f"without a vacancy link were not stored"
+            )
+        return {"sink": self.name, "items_stored": self.stored, "items_skipped": self.skipped}
+
+
+class JsonLinesFileSink:
+    """Append items to a JSON Lines file, one item per line"""
+
+    name = "file"
+
+    def __init__(self, path: str):
+        self.path = path
+        self.written = 0
+        self._file = None
+
+    def add(self, item: Any) -> None:
+        if self._file is None:
+            # Opened on the first item: failed triggers leave no empty files
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "w", encoding="utf-8")
+        self._file.write(json.dumps(item, ensure_ascii=False))
+        self._file.write("\n")
+        self.written += 1
+
+    def close(self) -> Dict[str, Any]:
+        if self._file is not None:
+            self._file.close()
+        return {"sink": self.name, "path": self.path, "items_stored": self.written}
+
+
+def result_sink_for(execution_id: int):
+    """Sink for an execution's streamed result, or None to buffer the body"""
+    mode = settings.N8N_RESULT_SINK
+    if mode == LinkedinResultSink.name:
+        return LinkedinResultSink(execution_id)
+    if mode == JsonLinesFileSink.name:
+        return JsonLinesFileSink(
+            os.path.join(settings.N8N_RESULT_FILE_DIR, f"execution_{execution_id}.jsonl")
+        )
+    return None
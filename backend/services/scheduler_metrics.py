@@ -0,0 +1,118 @@
+"""
+Scheduler tick metrics (duration, overruns, skipped and overlapping ticks)
+"""
+
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+from app.config import settings
+from utils.coordination import get_redis_client, use_redis
+
+logger = logging.getLogger(__name__)
+
+METRICS_KEY = "scheduler:tick_metrics"
+
+COUNTERS = (
+    "ticks_started",
+    "ticks_completed",
+    "ticks_skipped",
+    "ticks_overrun",
+    "ticks_overlapped",
+)
+
+_memory_metrics: Dict[str, Any] = {}
+_memory_guard = threading.Lock()
+
+# Compare-and-set in one step: concurrent ticks/chord callbacks cannot lose the max
+_SET_MAX_SCRIPT = """
+local current = tonumber(redis.call("hget", KEYS[1], ARGV[1]))
+if current == nil or tonumber(ARGV[2]) > current then
+    redis.call("hset", KEYS[1], ARGV[1], ARGV[2])
+end
+return 0
+"""
+
+
+def _incr(field: str, amount: int = 1) -> None:
+    if use_redis():
+        get_redis_client().hincrby(METRICS_KEY, field, amount)
+        return
+    with _memory_guard:
+        _memory_metrics[field] = int(_memory_metrics.get(field, 0)) + amount
+
+
+def _set(values: Dict[str, Any]) -> None:
+    if use_redis():
+        get_redis_client().hset(METRICS_KEY, mapping=values)
+        return
+    with _memory_guard:
+        _memory_metrics.update(values)
+
+
+def _set_max(field: str, value: float) -> None:
+    """Raise `field` to `value` unless it is already higher"""
+    if use_redis():
+        get_redis_client().eval(_SET_MAX_SCRIPT, 1, METRICS_KEY, field, value)
+        return
+    with _memory_guard:
+        _memory_metrics[field] = max(float(_memory_metrics.get(field, 0) or 0), value)
+
+
+def _get_all() -> Dict[str, Any]:
+    if use_redis():
+        return get_redis_client().hgetall(METRICS_KEY)
+    with _memory_guard:
+        return dict(_memory_metrics)
+
+
+def record_tick_started() -> None:
+    _incr("ticks_started")
+
+
+def record_tick_skipped() -> None:
+    """A tick found the previous one still holding the lock"""
+    _incr("ticks_skipped")
+    _set({"last_skipped_at": datetime.now(timezone.utc).isoformat()})
+    logger.warning("Scheduler tick skipped: previous tick is still running")
+
+
+def record_tick_finished(duration_seconds: float, lease_kept: bool = True) -> None:
+    """
+    Record a finished tick
+
+    A tick is an overrun when it took longer than the beat interval. When
+    its lock lease expired before it finished (lease_kept=False) another
+    tick may have run at the same time, which is counted as an overlap.
+    """
+    _incr("ticks_completed")
+    if duration_seconds > settings.SCHEDULER_TICK_INTERVAL_SECONDS:
+        _incr("ticks_overrun")
+        logger.warning(
+            f"Scheduler tick overran the beat interval: {duration_seconds:.1f}s "
+            f"> {settings.SCHEDULER_TICK_INTERVAL_SECONDS}s"
+        )
+    if not lease_kept:
+        _incr("ticks_overlapped")
+        logger.warning("Scheduler tick lock lease expired before the tick finished")
+
+    _set(
+        {
+            "last_tick_duration_seconds": round(duration_seconds, 3),
+            "last_tick_finished_at": datetime.now(timezone.utc).isoformat(),
+        }
+    )
+    _set_max("max_tick_duration_seconds", round(duration_seconds, 3))
+
+
+def get_tick_metrics() -> Dict[str, Any]:
+    """Snapshot of all tick metrics"""
+    raw = _get_all()
+    metrics: Dict[str, Any] = {counter: int(raw.get(counter, 0)) for counter in COUNTERS}
+    for field in ("last_tick_duration_seconds", "max_tick_duration_seconds"):
+        metrics[field] = float(raw[field]) if raw.get(field) is not None else None
+    for field in ("last_tick_finished_at", "last_skipped_at"):
+        metrics[field] = raw.get(field)
+    metrics["tick_interval_seconds"] = settings.SCHEDULER_TICK_INTERVAL_SECONDS
+    return metrics
@@ -0,0 +1,339 @@
+"""
+Scheduling helpers for periodic workflow triggers
+"""
+
+import hashlib
+import json
+import logging
+import math
+import queue
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from app.config import settings
+from models.workflow import WorkflowConfig
+from sqlalchemy import case, update
+from sqlalchemy.orm import Query, Session, defer
+from sqlalchemy.orm.attributes import set_committed_value
+from utils.coordination import get_redis_client, use_redis
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SCHEDULE_CHANGES_CHANNEL = "scheduler:workflow_changes"
+
+# Subscribers for COORDINATION_BACKEND=memory (same-process timer scheduler)
+_memory_subscribers: List["queue.Queue[Dict[str, Any]]"] = []
+
+
+def schedule_phase_seconds(workflow_id: int, interval_seconds: int) -> int:
+    """
+    Deterministic offset of a workflow's fire times within its interval
+
+    Derived from a hash of the workflow ID, so workflows with the same
+    interval are spread evenly instead of all firing at the same moment.
+    """
+    digest = hashlib.blake2b(str(workflow_id).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % max(interval_seconds, 1)
+
+
+def next_slot(
+    after: datetime, interval_seconds: int, phase_seconds: int, inclusive: bool
+) -> datetime:
+    """First fire time (epoch-aligned interval shifted by phase) at/after `after`"""
+    elapsed = after.timestamp() - phase_seconds
+    if inclusive:
+        slots = math.ceil(elapsed / interval_seconds)
+    else:
+        slots = math.floor(elapsed / interval_seconds) + 1
+    return datetime.fromtimestamp(
+        slots * interval_seconds + phase_seconds, tz=timezone.utc
+    )
+
+
+def compute_next_run_at(
+    workflow: WorkflowConfig, now: Optional[datetime] = None
+) -> Optional[datetime]:
+    """
+    Compute when the scheduler should trigger the workflow next
+
+    Inactive workflows are never due (None). Workflows that never ran
+    are due immediately, others one interval after their last run.
+    With SCHEDULER_JITTER_ENABLED each workflow instead fires on its own
+    phase within the interval: the first slot from now for workflows that
+    never ran, and the next slot after the last run otherwise.
+    """
+    if not workflow.is_active:
+        return None
+
+    now = now or datetime.now(timezone.utc)
+    interval_seconds = workflow.run_interval_minutes * 60
+
+    if settings.SCHEDULER_JITTER_ENABLED and workflow.id is not None:
+        phase = schedule_phase_seconds(workflow.id, interval_seconds)
+        if workflow.last_run_at is None:
+            return next_slot(now, interval_seconds, phase, inclusive=True)
+        return next_slot(
+            _as_utc(workflow.last_run_at), interval_seconds, phase, inclusive=False
+        )
+
+    if workflow.last_run_at is None:
+        return now
+
+    return workflow.last_run_at + timedelta(minutes=workflow.run_interval_minutes)
+
+
+def _as_utc(moment: datetime) -> datetime:
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def refresh_next_run_at(
+    workflow: WorkflowConfig, now: Optional[datetime] = None
+) -> None:
+    """Recompute and store next_run_at after a schedule-relevant change"""
+    workflow.next_run_at = compute_next_run_at(workflow, now)
+
+
+def mark_workflow_triggered(workflow: WorkflowConfig, now: datetime) -> None:
+    """Record a scheduled trigger and push next_run_at one interval ahead"""
+    workflow.last_run_at = now
+    refresh_next_run_at(workflow, now)
+
+
+def mark_workflows_triggered(
+    db: Session, workflows: Sequence[WorkflowConfig], now: datetime
+) -> None:
+    """
+    Bulk version of mark_workflow_triggered: one UPDATE for all workflows
+
+    The in-memory objects get the new values without being marked dirty,
+    so the session does not emit a second, per-row UPDATE on flush.
+    """
+    if not workflows:
+        return
+
+    next_runs: Dict[int, Optional[datetime]] = {}
+    for workflow in workflows:
+        set_committed_value(workflow, "last_run_at", now)
+        next_run_at = compute_next_run_at(workflow, now)
+        set_committed_value(workflow, "next_run_at", next_run_at)
+        next_runs[workflow.id] = next_run_at
+
+    db.execute(
+        update(WorkflowConfig)
+        .where(WorkflowConfig.id.in_(next_runs))
+        .values(
+            last_run_at=now,
+            next_run_at=case(
+                *[
+                    (WorkflowConfig.id == workflow_id, next_run_at)
+                    for workflow_id, next_run_at in next_runs.items()
+                ],
+                else_=WorkflowConfig.next_run_at,
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _due_query(query: Query, now: datetime) -> Query:
+    return query.filter(
+        WorkflowConfig.is_active == True,
+        WorkflowConfig.next_run_at <= now,
+    ).order_by(WorkflowConfig.next_run_at, WorkflowConfig.id)
+
+
+def get_due_workflows(
+    db: Session, now: datetime, limit: Optional[int] = None
+) -> List[WorkflowConfig]:
+    """
+    Get active workflows whose next_run_at has passed, oldest first
+
+    Served by the (is_active, next_run_at) index, so the cost depends on
+    the number of due rows rather than the number of configured workflows.
+    The large workflow JSON is deferred and only loaded if accessed.
+    """
+    query = _due_query(
+        db.query(WorkflowConfig).options(defer(WorkflowConfig.workflow_config_json)),
+        now,
+    )
+    if limit:
+        query = query.limit(limit)
+    return query.all()
+
+
+def get_due_workflow_rows(
+    db: Session, now: datetime, limit: Optional[int] = None
+) -> List[Tuple[int, int]]:
+    """Same as get_due_workflows, but only selects (id, user_id) pairs"""
+    query = _due_query(db.query(WorkflowConfig.id, WorkflowConfig.user_id), now)
+    if limit:
+        query = query.limit(limit)
+    return [(workflow_id, user_id) for workflow_id, user_id in query.all()]
+
+
+def get_workflows_by_ids(db: Session, workflow_ids: Sequence[int]) -> List[WorkflowConfig]:
+    """Load workflows for a dispatched chunk, keeping the large JSON deferred"""
+    if not workflow_ids:
+        return []
+    return (
+        db.query(WorkflowConfig)
+        .options(defer(WorkflowConfig.workflow_config_json))
+        .filter(WorkflowConfig.id.in_(workflow_ids))
+        .order_by(WorkflowConfig.next_run_at, WorkflowConfig.id)
+        .all()
+    )
+
+
+def load_workflow_json(db: Session, workflows: Sequence[WorkflowConfig]) -> None:
+    """
+    Load the deferred workflow JSON in one query for workflows that still
+    need it to be triggered (trigger metadata not compiled yet), instead of
+    one lazy load each
+    """
+    missing = [
+        workflow
+        for workflow in workflows
+        if not workflow.webhook_path and workflow.trigger_node_type is None
+    ]
+    if not missing:
+        return
+    rows = dict(
+        db.query(WorkflowConfig.id, WorkflowConfig.workflow_config_json)
+        .filter(WorkflowConfig.id.in_([workflow.id for workflow in missing]))
+        .all()
+    )
+    for workflow in missing:
+        set_committed_value(workflow, "workflow_config_json", rows.get(workflow.id))
+
+
+def claim_workflows(
+    db: Session, workflow_ids: Sequence[int], now: datetime, lease_until: datetime
+) -> List[int]:
+    """
+    Push next_run_at of dispatched workflows to the end of a lease
+
+    Keeps the next tick from dispatching them again while their chunk is
+    still queued or running. A successful trigger overwrites the lease with
+    the real next run; a failed one becomes due again once the lease ends.
+    Only rows that are still due are claimed; their IDs are returned, so
+    concurrent schedulers never dispatch the same workflow twice.
+    """
+    if not workflow_ids:
+        return []
+    claimed = db.execute(
+        update(WorkflowConfig)
+        .where(
+            WorkflowConfig.id.in_(workflow_ids),
+            WorkflowConfig.is_active == True,
+            WorkflowConfig.next_run_at <= now,
+        )
+        .values(next_run_at=lease_until)
+        .returning(WorkflowConfig.id)
+        .execution_options(synchronize_session=False)
+    )
+    claimed_ids = {workflow_id for (workflow_id,) in claimed}
+    db.commit()
+    return [workflow_id for workflow_id in workflow_ids if workflow_id in claimed_ids]
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[List[T]]:
+    """Split items into lists of at most `size` elements"""
+    size = max(size, 1)
+    for start in range(0, len(items), size):
+        yield list(items[start : start + size])
+
+
+def publish_schedule_change(workflow_id: int, next_run_at: Optional[datetime]) -> None:
+    """
+    Tell the timer scheduler (SCHEDULER_MODE=timer) that a workflow's
+    next_run_at changed. Call after the change is committed. Failures are
+    only logged: the beat/DB state stays authoritative.
+    """
+    publish_schedule_changes([(workflow_id, next_run_at)])
+
+
+def publish_schedule_changes(
+    changes: Sequence[Tuple[int, Optional[datetime]]]
+) -> None:
+    """Publish several (workflow_id, next_run_at) changes in one Redis round trip"""
+    if settings.SCHEDULER_MODE != "timer" or not changes:
+        return
+
+    messages = [
+        {
+            "workflow_id": workflow_id,
+            "next_run_at": next_run_at.isoformat() if next_run_at else None,
+        }
+        for workflow_id, next_run_at in changes
+    ]
+    try:
+        if use_redis():
+            pipeline = get_redis_client().pipeline(transaction=False)
+            for message in messages:
+                pipeline.publish(SCHEDULE_CHANGES_CHANNEL, json.dumps(message))
+            pipeline.execute()
+        else:
+            for subscriber in list(_memory_subscribers):
+                for message in messages:
+                    subscriber.put(message)
+    except Exception as e:
+        logger.warning(f"Failed to publish {len(messages)} schedule change(s): {str(e)}")
+
+
+class ScheduleChangeSubscriber:
+    """Receives messages published by publish_schedule_change"""
+
+    def __init__(self):
+        self._pubsub = None
+        self._queue: Optional["queue.Queue[Dict[str, Any]]"] = None
+        if use_redis():
+            self._pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(SCHEDULE_CHANGES_CHANNEL)
+        else:
+            self._queue = queue.Queue()
+            _memory_subscribers.append(self._queue)
+
+    def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Wait up to `timeout` seconds for the next change message"""
+        if self._pubsub is not None:
+            message = self._pubsub.get_message(timeout=timeout)
+            if not message or message.get("type") != "message":
+                return None
+            return json.loads(message["data"])
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        if self._pubsub is not None:
+            self._pubsub.close()
+        elif self._queue in _memory_subscribers:
+            _memory_subscribers.remove(self._queue)
+
+
+def get_trigger_histogram(
+    db: Session, start: datetime, minutes: int
+) -> List[Dict[str, Any]]:
+    """
+    Planned triggers per minute for the next `minutes` minutes
+
+    Reads only next_run_at through the (is_active, next_run_at) index; a flat
+    histogram means trigger load is spread evenly instead of spiking.
+    """
+    start = _as_utc(start).replace(second=0, microsecond=0)
+    end = start + timedelta(minutes=minutes)
+    counts = [0] * minutes
+    rows = db.query(WorkflowConfig.next_run_at).filter(
+        WorkflowConfig.is_active == True,
+        WorkflowConfig.next_run_at >= start,
+        WorkflowConfig.next_run_at < end,
+    )
+    for (next_run_at,) in rows:
+        counts[int((_as_utc(next_run_at) - start).total_seconds() // 60)] += 1
+    return [
+        {"minute": (start + timedelta(minutes=i)).isoformat(), "triggers": count}
+        for i, count in enumerate(counts)
+    ]
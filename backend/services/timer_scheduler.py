@@ -0,0 +1,212 @@
+"""
+In-process timer scheduler (SCHEDULER_MODE=timer)
+
+Keeps a min-heap of next fire times, loaded once from the DB and then
+kept current through schedule change notifications. Due workflows are
+claimed in the DB and handed to Celery within seconds of their due time,
+so run_interval_minutes is honoured exactly instead of being rounded up
+to the 15-minute beat.
+"""
+
+import heapq
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.database import SessionLocal
+from models.workflow import WorkflowConfig
+from services.scheduler_service import (
+    ScheduleChangeSubscriber,
+    chunked,
+    claim_workflows,
+)
+from services.trigger_limiter import refund_tokens, select_fair_share
+
+logger = logging.getLogger(__name__)
+
+RETRY_DELAY_SECONDS = 5
+
+
+def dispatch_to_celery(workflow_ids: List[int], scheduled_at: datetime) -> None:
+    """Default dispatcher: one trigger_workflow_chunk task per chunk"""
+    from tasks import trigger_workflow_chunk
+
+    for chunk in chunked(workflow_ids, settings.SCHEDULER_CHUNK_SIZE):
+        trigger_workflow_chunk.delay(chunk, scheduled_at.isoformat())
+
+
+class TimerScheduler:
+    """Min-heap of (fire_at, workflow_id) with lazy invalidation"""
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        dispatch: Callable[[List[int], datetime], None] = dispatch_to_celery,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.session_factory = session_factory
+        self.dispatch = dispatch
+        self.clock = clock
+        self._heap: List[Tuple[float, int]] = []
+        # Current fire time per workflow; heap entries that disagree are stale
+        self._fire_at: Dict[int, float] = {}
+        self._running = False
+
+    def __len__(self) -> int:
+        return len(self._fire_at)
+
+    def load(self) -> int:
+        """Load next fire times of all active workflows (startup only)"""
+        db = self.session_factory()
+        try:
+            rows = (
+                db.query(WorkflowConfig.id, WorkflowConfig.next_run_at)
+                .filter(
+                    WorkflowConfig.is_active == True,
+                    WorkflowConfig.next_run_at.isnot(None),
+                )
+                .all()
+            )
+        finally:
+            db.close()
+
+        self._heap = []
+        self._fire_at = {}
+        for workflow_id, next_run_at in rows:
+            self.schedule(workflow_id, next_run_at)
+        logger.info(f"Timer scheduler loaded {len(rows)} workflow(s)")
+        return len(rows)
+
+    def schedule(self, workflow_id: int, next_run_at: Optional[datetime]) -> None:
+        """Insert, move or (with None) remove a workflow's fire time"""
+        if next_run_at is None:
+            self._fire_at.pop(workflow_id, None)
+            return
+        if next_run_at.tzinfo is None:
+            next_run_at = next_run_at.replace(tzinfo=timezone.utc)
+        fire_at = next_run_at.timestamp()
+        if self._fire_at.get(workflow_id) == fire_at:
+            return
+        self._fire_at[workflow_id] = fire_at
+        heapq.heappush(self._heap, (fire_at, workflow_id))
+
+    def apply_change(self, message: Dict) -> None:
+        """Apply a message from publish_schedule_change"""
+        next_run_at = message.get("next_run_at")
+        self.schedule(
+            int(message["workflow_id"]),
+            datetime.fromisoformat(next_run_at) if next_run_at else None,
+        )
+
+    def seconds_until_next(self) -> Optional[float]:
+        """Seconds until the earliest fire time (None if nothing is scheduled)"""
+        self._drop_stale()
+        if not self._heap:
+            return None
+        return max(self._heap[0][0] - self.clock(), 0.0)
+
+    def pop_due(self) -> List[int]:
+        """Remove and return all workflows whose fire time has passed"""
+        now = self.clock()
+        due: List[int] = []
+        while self._heap and self._heap[0][0] <= now:
+            fire_at, workflow_id = heapq.heappop(self._heap)
+            if self._fire_at.get(workflow_id) != fire_at:
+                continue
+            del self._fire_at[workflow_id]
+            due.append(workflow_id)
+        return due
+
+    def fire_due(self) -> List[int]:
+        """Claim due workflows in the DB and dispatch them"""
+        due = self.pop_due()
+        if not due:
+            return []
+
+        now = datetime.fromtimestamp(self.clock(), tz=timezone.utc)
+        lease_until = now + timedelta(seconds=settings.SCHEDULER_CLAIM_LEASE_SECONDS)
+        db = self.session_factory()
+        try:
+            owners = dict(
+                db.query(WorkflowConfig.id, WorkflowConfig.user_id)
+                .filter(WorkflowConfig.id.in_(due))
+                .all()
+            )
+            selected = select_fair_share(
+                [workflow_id for workflow_id in due if workflow_id in owners],
+                user_of=owners.get,
+                now=now.timestamp(),
+            )
+            # Rate limited: try again shortly, keeping them ahead of later work
+            retry_at = now + timedelta(seconds=RETRY_DELAY_SECONDS)
+            for workflow_id in set(owners) - set(selected):
+                self.schedule(workflow_id, retry_at)
+
+            claimed = claim_workflows(db, selected, now, lease_until)
+            unclaimed = set(selected) - set(claimed)
+            if unclaimed:
+                refund_tokens(unclaimed, user_of=owners.get, now=now.timestamp())
+                # Moved or deactivated since we heard about it: resync those rows
+                rows = (
+                    db.query(
+                        WorkflowConfig.id,
+                        WorkflowConfig.is_active,
+                        WorkflowConfig.next_run_at,
+                    )
+                    .filter(WorkflowConfig.id.in_(unclaimed))
+                    .all()
+                )
+                for workflow_id, is_active, next_run_at in rows:
+                    self.schedule(workflow_id, next_run_at if is_active else None)
+        except Exception:
+            # Keep them in the heap and retry shortly
+            retry_at = now + timedelta(seconds=RETRY_DELAY_SECONDS)
+            for workflow_id in due:
+                self.schedule(workflow_id, retry_at)
+            raise
+        finally:
+            db.close()
+
+        # Fallback fire time in case the trigger's change notification is lost
+        for workflow_id in claimed:
+            self.schedule(workflow_id, lease_until)
+
+        if claimed:
+            self.dispatch(claimed, now)
+            logger.info(f"Timer scheduler dispatched {len(claimed)} workflow(s)")
+        return claimed
+
+    def run_forever(self) -> None:
+        """Main loop: wait for the next fire time or a change message"""
+        subscriber = ScheduleChangeSubscriber()
+        self.load()
+        self._running = True
+        try:
+            while self._running:
+                wait = self.seconds_until_next()
+                max_sleep = settings.SCHEDULER_TIMER_MAX_SLEEP_SECONDS
+                timeout = max_sleep if wait is None else min(wait, max_sleep)
+
+                message = subscriber.get(timeout)
+                while message is not None:
+                    self.apply_change(message)
+                    message = subscriber.get(0)
+
+                try:
+                    self.fire_due()
+                except Exception as e:
+                    logger.exception(f"Timer scheduler failed to fire workflows: {str(e)}")
+        finally:
+            subscriber.close()
+
+    def stop(self) -> None:
+        self._running = False
+
+    def _drop_stale(self) -> None:
+        while self._heap:
+            fire_at, workflow_id = self._heap[0]
+            if self._fire_at.get(workflow_id) == fire_at:
+                return
+            heapq.heappop(self._heap)
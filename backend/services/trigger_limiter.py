@@ -0,0 +1,227 @@
+"""
+Fair-share selection and token-bucket rate limiting for scheduled triggers
+
+Due workflows are interleaved round-robin across users and each pick has to
+take a token from the user's bucket and from the global bucket. Workflows
+that are not picked stay due and keep their place (oldest next_run_at) for
+the next tick. Picks that are then not triggered (another scheduler claimed
+them first, or the trigger failed) get their tokens back. Bucket state
+lives in Redis so it carries over between ticks that run on different
+workers.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from app.config import settings
+from utils.coordination import get_redis_client, use_redis
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+BUCKETS_KEY = "scheduler:trigger_buckets"
+GLOBAL_BUCKET = "global"
+
+_memory_buckets: Dict[str, str] = {}
+_memory_guard = threading.Lock()
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at `rate_per_minute`"""
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: float,
+        tokens: Optional[float] = None,
+        updated_at: Optional[float] = None,
+    ):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity
+        self.tokens = capacity if tokens is None else tokens
+        self.updated_at = updated_at
+
+    @property
+    def unlimited(self) -> bool:
+        return self.rate_per_second <= 0
+
+    def refill(self, now: float) -> None:
+        if self.updated_at is not None and now > self.updated_at:
+            self.tokens = min(
+                self.capacity,
+                self.tokens + (now - self.updated_at) * self.rate_per_second,
+            )
+        self.updated_at = now
+
+    def available(self) -> bool:
+        return self.unlimited or self.tokens >= 1
+
+    def take(self) -> None:
+        if not self.unlimited:
+            self.tokens -= 1
+
+    def give_back(self, count: int) -> None:
+        if not self.unlimited:
+            self.tokens = min(self.capacity, self.tokens + count)
+
+    def dump(self) -> str:
+        return f"{self.tokens}:{self.updated_at}"
+
+    @classmethod
+    def load(cls, raw: Optional[str], rate_per_minute: float, capacity: float):
+        if not raw:
+            return cls(rate_per_minute, capacity)
+        tokens, updated_at = raw.split(":")
+        return cls(rate_per_minute, capacity, float(tokens), float(updated_at))
+
+
+def _read_buckets(fields: List[str]) -> List[Optional[str]]:
+    if use_redis():
+        return get_redis_client().hmget(BUCKETS_KEY, fields)
+    with _memory_guard:
+        return [_memory_buckets.get(field) for field in fields]
+
+
+def _write_buckets(values: Dict[str, str]) -> None:
+    if not values:
+        return
+    if use_redis():
+        get_redis_client().hset(BUCKETS_KEY, mapping=values)
+        return
+    with _memory_guard:
+        _memory_buckets.update(values)
+
+
+def interleave_by_user(
+    items: Iterable[T], user_of: Callable[[T], Hashable]
+) -> "OrderedDict[Hashable, Deque[T]]":
+    """Group items per user, keeping first-seen user order and item order"""
+    by_user: "OrderedDict[Hashable, Deque[T]]" = OrderedDict()
+    for item in items:
+        by_user.setdefault(user_of(item), deque()).append(item)
+    return by_user
+
+
+def select_fair_share(
+    items: Iterable[T],
+    user_of: Callable[[T], Hashable],
+    limit: Optional[int] = None,
+    now: Optional[float] = None,
+) -> List[T]:
+    """
+    Pick up to `limit` items round-robin across users within rate limits
+
+    Rates come from SCHEDULER_USER_RATE_PER_MINUTE / SCHEDULER_USER_BURST
+    and SCHEDULER_GLOBAL_RATE_PER_MINUTE / SCHEDULER_GLOBAL_BURST; a rate of
+    0 disables that bucket. Consumed tokens are persisted.
+    """
+    by_user = interleave_by_user(items, user_of)
+    if not by_user:
+        return []
+
+    now = time.time() if now is None else now
+    user_rate = settings.SCHEDULER_USER_RATE_PER_MINUTE
+    global_rate = settings.SCHEDULER_GLOBAL_RATE_PER_MINUTE
+
+    fields = [GLOBAL_BUCKET] + [f"user:{user}" for user in by_user]
+    raw_buckets = dict(zip(fields, _read_buckets(fields)))
+    global_bucket = TokenBucket.load(
+        raw_buckets[GLOBAL_BUCKET], global_rate, settings.SCHEDULER_GLOBAL_BURST
+    )
+    global_bucket.refill(now)
+    user_buckets: Dict[Hashable, TokenBucket] = {}
+    for user in by_user:
+        bucket = TokenBucket.load(
+            raw_buckets[f"user:{user}"], user_rate, settings.SCHEDULER_USER_BURST
+        )
+        bucket.refill(now)
+        user_buckets[user] = bucket
+
+    selected: List[T] = []
+    while by_user and global_bucket.available():
+        for user in list(by_user):
+            if limit is not None and len(selected) >= limit:
+                break
+            if not global_bucket.available():
+                break
+            bucket = user_buckets[user]
+            if not bucket.available():
+                # Out of tokens: the rest of this user's items wait for later
+                del by_user[user]
+                continue
+            bucket.take()
+            global_bucket.take()
+            selected.append(by_user[user].popleft())
+            if not by_user[user]:
+                del by_user[user]
+        if limit is not None and len(selected) >= limit:
+            break
+
+    updates: Dict[str, str] = {}
+    if not global_bucket.unlimited:
+        updates[GLOBAL_BUCKET] = global_bucket.dump()
+    if user_rate > 0:
+        updates.update(
+            {f"user:{user}": bucket.dump() for user, bucket in user_buckets.items()}
+        )
+    _write_buckets(updates)
+    return selected
+
+
+
+def refund_tokens(
+    items: Iterable[T],
+    user_of: Callable[[T], Hashable],
+    now: Optional[float] = None,
+) -> None:
+    """
+    Give back the tokens select_fair_share took for items that were not
+    triggered after all. Best-effort: failures are only logged.
+    """
+    per_user = Counter(user_of(item) for item in items)
+    if not per_user:
+        return
+
+    # field -> (rate per minute, capacity, tokens to give back)
+    refunds: Dict[str, Tuple[float, float, int]] = {}
+    global_rate = settings.SCHEDULER_GLOBAL_RATE_PER_MINUTE
+    if global_rate > 0:
+        refunds[GLOBAL_BUCKET] = (
+            global_rate,
+            settings.SCHEDULER_GLOBAL_BURST,
+            sum(per_user.values()),
+        )
+    user_rate = settings.SCHEDULER_USER_RATE_PER_MINUTE
+    if user_rate > 0:
+        for user, count in per_user.items():
+            refunds[f"user:{user}"] = (user_rate, settings.SCHEDULER_USER_BURST, count)
+    if not refunds:
+        return
+
+    now = time.time() if now is None else now
+    fields = list(refunds)
+    try:
+        updates: Dict[str, str] = {}
+        for field, raw in zip(fields, _read_buckets(fields)):
+            rate, capacity, count = refunds[field]
+            bucket = TokenBucket.load(raw, rate, capacity)
+            bucket.refill(now)
+            bucket.give_back(count)
+            updates[field] = bucket.dump()
+        _write_buckets(updates)
+    except Exception as e:
+        logger.warning(f"Failed to refund {sum(per_user.values())} trigger token(s): {str(e)}")
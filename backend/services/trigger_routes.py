@@ -0,0 +1,153 @@
+"""
+Per-workflow memory of which n8n trigger route works
+
+Routes are "webhook" (production webhook URL) and "execute" (Public API
+execute endpoint). Each workflow keeps a score per route that goes up on
+success and down on failure and decays towards zero with
+N8N_ROUTE_HALF_LIFE_SECONDS, so old outcomes stop counting. Routes are
+tried best score first; with probability N8N_ROUTE_REPROBE_RATE the default
+order is used instead, so a demoted route gets re-probed once in a while.
+Global per-route success/failure/latency counters back the status endpoint.
+order_routes/record_route_result block on Redis: async code calls them
+through utils.coordination.run_coordination_call.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.config import settings
+from utils.coordination import get_redis_client, use_redis
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK = "webhook"
+EXECUTE = "execute"
+ROUTES = (WEBHOOK, EXECUTE)
+
+SCORES_KEY_PREFIX = "n8n:trigger_routes:"
+STATS_KEY = "n8n:trigger_route_stats"
+# Score memory of a workflow that is no longer triggered expires with it
+SCORES_TTL_SECONDS = 7 * 24 * 3600
+
+_memory_scores: Dict[str, Dict[str, str]] = {}
+_memory_stats: Dict[str, float] = {}
+_memory_guard = threading.Lock()
+
+
+def _decayed(raw: Optional[str], now: float) -> float:
+    if not raw:
+        return 0.0
+    score, updated_at = (float(value) for value in raw.split(":"))
+    half_life = settings.N8N_ROUTE_HALF_LIFE_SECONDS
+    if half_life <= 0:
+        return score
+    return score * 0.5 ** (max(now - updated_at, 0.0) / half_life)
+
+
+def _read_scores(workflow_id: str) -> Dict[str, str]:
+    if use_redis():
+        return get_redis_client().hgetall(SCORES_KEY_PREFIX + workflow_id)
+    with _memory_guard:
+        return dict(_memory_scores.get(workflow_id, {}))
+
+
+def _write_score(workflow_id: str, route: str, value: str) -> None:
+    if use_redis():
+        pipeline = get_redis_client().pipeline(transaction=False)
+        pipeline.hset(SCORES_KEY_PREFIX + workflow_id, route, value)
+        pipeline.expire(SCORES_KEY_PREFIX + workflow_id, SCORES_TTL_SECONDS)
+        pipeline.execute()
+        return
+    with _memory_guard:
+        _memory_scores.setdefault(workflow_id, {})[route] = value
+
+
+def order_routes(
+    workflow_id: str,
+    default_order: Sequence[str],
+    now: Optional[float] = None,
+    rng: Optional[random.Random] = None,
+) -> List[str]:
+    """Routes to try for a workflow, best remembered route first"""
+    if not settings.N8N_ROUTE_MEMORY_ENABLED:
+        return list(default_order)
+    if (rng or random).random() < settings.N8N_ROUTE_REPROBE_RATE:
+        return list(default_order)
+
+    now = time.time() if now is None else now
+    try:
+        raw_scores = _read_scores(workflow_id)
+    except Exception as e:
+        logger.warning(f"Failed to read trigger routes of workflow {workflow_id}: {str(e)}")
+        return list(default_order)
+
+    # sorted() is stable: equal scores keep the default order
+    return sorted(
+        default_order, key=lambda route: -_decayed(raw_scores.get(route), now)
+    )
+
+
+def record_route_result(
+    workflow_id: str,
+    route: str,
+    success: bool,
+    latency_seconds: float,
+    now: Optional[float] = None,
+) -> None:
+    """Update the workflow's route score and the global route counters"""
+    now = time.time() if now is None else now
+    outcome = "success" if success else "failure"
+    try:
+        if settings.N8N_ROUTE_MEMORY_ENABLED:
+            score = _decayed(_read_scores(workflow_id).get(route), now)
+            score += 1.0 if success else -1.0
+            _write_score(workflow_id, route, f"{score}:{now}")
+
+        latency_ms = int(latency_seconds * 1000)
+        if use_redis():
+            pipeline = get_redis_client().pipeline(transaction=False)
+            pipeline.hincrby(STATS_KEY, f"{route}:{outcome}", 1)
+            pipeline.hincrby(STATS_KEY, f"{route}:{outcome}_latency_ms", latency_ms)
+            pipeline.execute()
+        else:
+            with _memory_guard:
+                for field, amount in (
+                    (f"{route}:{outcome}", 1),
+                    (f"{route}:{outcome}_latency_ms", latency_ms),
+                ):
+                    _memory_stats[field] = _memory_stats.get(field, 0) + amount
+    except Exception as e:
+        logger.warning(f"Failed to record trigger route result for {workflow_id}: {str(e)}")
+
+
+def get_route_stats() -> Dict[str, Any]:
+    """Success/failure counts and average latency per trigger route"""
+    if use_redis():
+        raw = get_redis_client().hgetall(STATS_KEY)
+    else:
+        with _memory_guard:
+            raw = dict(_memory_stats)
+
+    stats: Dict[str, Any] = {}
+    for route in ROUTES:
+        route_stats: Dict[str, Any] = {}
+        for outcome in ("success", "failure"):
+            count = int(raw.get(f"{route}:{outcome}", 0))
+            latency_ms = int(raw.get(f"{route}:{outcome}_latency_ms", 0))
+            route_stats[outcome] = count
+            route_stats[f"avg_{outcome}_latency_ms"] = (
+                round(latency_ms / count, 1) if count else None
+            )
+        stats[route] = route_stats
+    return stats
+
+
+def get_workflow_routes(workflow_id: str, now: Optional[float] = None) -> List[Tuple[str, float]]:
+    """Current (decayed) route scores of one workflow, best first"""
+    now = time.time() if now is None else now
+    raw_scores = _read_scores(workflow_id)
+    scores = [(route, round(_decayed(raw_scores.get(route), now), 3)) for route in ROUTES]
+    return sorted(scores, key=lambda item: -item[1])
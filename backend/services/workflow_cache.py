@@ -0,0 +1,95 @@
+"""
+TTL cache for n8n workflow existence and metadata
+
+Lets trigger_workflow check that a workflow exists without an n8n API
+round trip (and without downloading the whole workflow body) on every
+trigger. Entries live in Redis so the API process and Celery workers share
+them and see each other's invalidations; with COORDINATION_BACKEND=memory a
+bounded in-process LRU is used instead. The functions block on Redis:
+async code calls them through utils.coordination.run_coordination_call.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import settings
+from utils.coordination import get_redis_client, use_redis
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "n8n:workflow_meta:"
+
+_memory_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_memory_guard = threading.Lock()
+
+
+def summarize_workflow(workflow_id: str, workflow: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Small cache entry for an n8n workflow body (None = workflow not found)"""
+    if workflow is None:
+        return {"id": workflow_id, "exists": False}
+    return {
+        "id": str(workflow.get("id", workflow_id)),
+        "exists": True,
+        "name": workflow.get("name"),
+        "active": workflow.get("active"),
+        "updated_at": workflow.get("updatedAt"),
+    }
+
+
+def get_cached_workflow(workflow_id: str) -> Optional[Dict[str, Any]]:
+    """Cached metadata, or None on a miss (a known-missing workflow has exists=False)"""
+    try:
+        if use_redis():
+            raw = get_redis_client().get(KEY_PREFIX + workflow_id)
+            return json.loads(raw) if raw else None
+        with _memory_guard:
+            entry = _memory_cache.get(workflow_id)
+            if entry is None:
+                return None
+            expires_at, metadata = entry
+            if expires_at <= time.monotonic():
+                del _memory_cache[workflow_id]
+                return None
+            _memory_cache.move_to_end(workflow_id)
+            return metadata
+    except Exception as e:
+        logger.warning(f"Workflow cache read failed for {workflow_id}: {str(e)}")
+        return None
+
+
+def cache_workflow(workflow_id: str, metadata: Dict[str, Any]) -> None:
+    """Store metadata; missing workflows get the shorter negative TTL"""
+    ttl = (
+        settings.N8N_WORKFLOW_CACHE_TTL_SECONDS
+        if metadata.get("exists")
+        else settings.N8N_WORKFLOW_CACHE_MISSING_TTL_SECONDS
+    )
+    if ttl <= 0:
+        return
+    try:
+        if use_redis():
+            get_redis_client().set(KEY_PREFIX + workflow_id, json.dumps(metadata), ex=int(ttl))
+            return
+        with _memory_guard:
+            _memory_cache[workflow_id] = (time.monotonic() + ttl, metadata)
+            _memory_cache.move_to_end(workflow_id)
+            while len(_memory_cache) > settings.N8N_WORKFLOW_CACHE_MAX_ENTRIES:
+                _memory_cache.popitem(last=False)
+    except Exception as e:
+        logger.warning(f"Workflow cache write failed for {workflow_id}: {str(e)}")
+
+
+def invalidate_workflow(workflow_id: str) -> None:
+    """Drop the entry after the workflow was created, changed or deleted"""
+    try:
+        if use_redis():
+            get_redis_client().delete(KEY_PREFIX + workflow_id)
+            return
+        with _memory_guard:
+            _memory_cache.pop(workflow_id, None)
+    except Exception as e:
+        logger.warning(f"Workflow cache invalidation failed for {workflow_id}: {str(e)}")
@@ -7,6 +7,7 @@ from models.workflow import SavedPreset, WorkflowConfig
 from models.user import User
 from schemas.workflow import SavedPresetCreate, WorkflowConfigCreate
 from services.file_service import read_json_from_static
+from services.scheduler_service import publish_schedule_change, refresh_next_run_at
 from sqlalchemy.orm import Session
 from utils.exceptions import (
     raise_resource_not_found_error,
@@ -22,6 +23,7 @@ from utils.exceptions import (
 from utils.workflow_validator import (
     InvalidWorkflowJsonError,
     WorkflowImportError,
+    compile_trigger_metadata,
     extract_workflow_metadata,
     sanitize_workflow_json,
     validate_workflow_for_import,
@@ -69,6 +71,12 @@ def get_workflow_config_by_id(
     )
 
 
+def compile_workflow_triggers(workflow: WorkflowConfig) -> None:
+    """Store trigger node type, webhook path and input fields from the workflow JSON"""
+    for field, value in compile_trigger_metadata(workflow.workflow_config_json).items():
+        setattr(workflow, field, value)
+
+
 def update_workflow_active_status(
     db: Session, workflow_id: int, user_id: int, is_active: bool
 ) -> Optional[WorkflowConfig]:
@@ -78,8 +86,10 @@ def update_workflow_active_status(
         return None
 
     workflow.is_active = is_active
+    refresh_next_run_at(workflow)
     db.commit()
     db.refresh(workflow)
+    publish_schedule_change(workflow.id, workflow.next_run_at)
     return workflow
 
 
@@ -101,6 +111,7 @@ def update_workflow_config(
         workflow.is_active = workflow_data.is_active
     if workflow_data.workflow_config_json is not None:
         workflow.workflow_config_json = workflow_data.workflow_config_json
+        compile_workflow_triggers(workflow)
     if workflow_data.workflow_version is not None:
         workflow.workflow_version = workflow_data.workflow_version
     if workflow_data.description is not None:
@@ -108,8 +119,10 @@ def update_workflow_config(
     if workflow_data.source_file is not None:
         workflow.source_file = workflow_data.source_file
 
+    refresh_next_run_at(workflow)
     db.commit()
     db.refresh(workflow)
+    publish_schedule_change(workflow.id, workflow.next_run_at)
     return workflow
 
 
@@ -121,6 +134,7 @@ def delete_workflow_config(db: Session, workflow_id: int, user_id: int) -> bool:
 
     db.delete(workflow)
     db.commit()
+    publish_schedule_change(workflow_id, None)
     return True
 
 
@@ -140,9 +154,13 @@ def create_workflow_config(
         description=workflow_data.description,
         source_file=workflow_data.source_file,
     )
+    compile_workflow_triggers(db_workflow)
     db.add(db_workflow)
+    db.flush()  # Assign the ID the schedule phase is derived from
+    refresh_next_run_at(db_workflow)
     db.commit()
     db.refresh(db_workflow)
+    publish_schedule_change(db_workflow.id, db_workflow.next_run_at)
     return db_workflow
 
 
@@ -258,6 +276,7 @@ def update_default_workflow_from_file(db: Session, user: User) -> WorkflowConfig
     existing.n8n_workflow_id = n8n_workflow_id
     existing.workflow_config_json = workflow_json
     existing.workflow_version = version_id
+    compile_workflow_triggers(existing)
     # Keep existing is_active status - don't override user's choice
 
     db.commit()
@@ -344,8 +363,11 @@ def create_default_workflow_for_user(db: Session, user: User) -> WorkflowConfig:
             run_interval_minutes=15,  # Default interval
             source_file="automation.json",
         )
+        compile_workflow_triggers(db_workflow)
         logger.info(f"Adding WorkflowConfig to session")
         db.add(db_workflow)
+        db.flush()  # Assign the ID the schedule phase is derived from
+        refresh_next_run_at(db_workflow)
         logger.info(f"Committing to database")
         db.commit()
         logger.info(f"Refreshing from database")
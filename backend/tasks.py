@@ -1,23 +1,203 @@
-import asyncio
 import logging
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence, Tuple
 
+from app.config import settings
 from app.database import SessionLocal
+from celery import chord
+from celery.signals import worker_process_init, worker_process_shutdown
 from celery_app import celery_app
 from models.execution import WorkflowExecution
 from models.user import User
 from models.workflow import WorkflowConfig
-from schemas.execution import WorkflowExecutionCreate
-from services.execution_service import create_execution
+from services.execution_events import execution_event, publish_execution_events
+from services.execution_service import (
+    apply_trigger_response,
+    mark_execution_failed,
+    new_pending_execution,
+    save_execution_outcomes,
+    trigger_executions_concurrently,
+)
+from services.n8n_service import n8n_service
+from services.reconciliation_service import reconcile_executions
+from services.scheduler_metrics import (
+    record_tick_finished,
+    record_tick_skipped,
+    record_tick_started,
+)
+from services.scheduler_service import (
+    chunked,
+    claim_workflows,
+    get_due_workflow_rows,
+    get_due_workflows,
+    get_workflows_by_ids,
+    load_workflow_json,
+    mark_workflows_triggered,
+    publish_schedule_changes,
+)
+from services.trigger_limiter import refund_tokens, select_fair_share
+from utils.async_runner import close_event_loop, run_async
+from utils.coordination import get_lock
 
 logging.basicConfig(level=logging.INFO)
 
 logger = logging.getLogger(__name__)
 
+SCHEDULER_TICK_LOCK = "scheduler:tick_lock"
+RECONCILE_LOCK = "executions:reconcile_lock"
+
+
+@worker_process_init.connect
+def open_n8n_client(**kwargs):
+    """Each worker process keeps one event loop and one n8n connection pool"""
+    run_async(n8n_service.start())
+
+
+@worker_process_shutdown.connect
+def close_n8n_client(**kwargs):
+    run_async(n8n_service.aclose())
+    close_event_loop()
+
 
 def get_db_session():
-    return SessionLocal()
+    # Objects stay loaded across commits, so a tick does not reload every row
+    return SessionLocal(expire_on_commit=False)
+
+
+def trigger_workflows(
+    db, workflows: Sequence[WorkflowConfig], now: datetime
+) -> List[Dict[str, Any]]:
+    """
+    Trigger the given workflows and record the outcome
+
+    Stores a pending execution per workflow, triggers all of them
+    concurrently (SCHEDULER_TRIGGER_CONCURRENCY at a time) and saves results.
+    DB round trips do not grow with the number of workflows: owners are
+    loaded in one query, pending rows inserted in one batch, execution
+    outcomes written as one bulk UPDATE by primary key and
+    last_run_at/next_run_at as one more UPDATE, in one commit. (SQLite is
+    the exception for the inserts: without batched RETURNING the ORM
+    inserts rows one by one to learn their IDs.)
+    Workflows that are not triggered get their rate limit tokens back.
+    Returns one summary entry per processed workflow.
+    """
+    results: List[Dict[str, Any]] = []
+    jobs: List[Tuple[WorkflowConfig, WorkflowExecution]] = []
+    not_triggered: List[WorkflowConfig] = []
+
+    user_ids = {workflow.user_id for workflow in workflows}
+    existing_user_ids = (
+        {user_id for (user_id,) in db.query(User.id).filter(User.id.in_(user_ids))}
+        if user_ids
+        else set()
+    )
+
+    for workflow in workflows:
+        if workflow.user_id not in existing_user_ids:
+            logger.warning(
+                f"User {workflow.user_id} not found for workflow {workflow.id}"
+            )
+            not_triggered.append(workflow)
+            continue
+
+        execution = new_pending_execution(workflow.user_id, workflow, "", "")
+        db.add(execution)
+        jobs.append((workflow, execution))
+
+        logger.info(
+            f"Celery: Triggering workflow {workflow.id} "
+            f"(n8n_id: {workflow.n8n_workflow_id}, webhook_path: {workflow.webhook_path or 'none'})"
+        )
+
+    if not jobs:
+        refund_tokens(not_triggered, user_of=lambda workflow: workflow.user_id)
+        return results
+
+    load_workflow_json(db, [workflow for workflow, _ in jobs])
+    try:
+        db.commit()
+    except Exception as e:
+        logger.exception(f"Failed to store pending executions: {str(e)}")
+        db.rollback()
+        refund_tokens(
+            not_triggered + [workflow for workflow, _ in jobs],
+            user_of=lambda workflow: workflow.user_id,
+        )
+        return results + [
+            {
+                "workflow_id": workflow.id,
+                "workflow_name": workflow.workflow_name,
+                "status": "error",
+                "error": str(e),
+            }
+            for workflow, _ in jobs
+        ]
+
+    # Scheduled workflows were checked at import: one request per trigger
+    responses = run_async(
+        trigger_executions_concurrently(
+            jobs, settings.SCHEDULER_TRIGGER_CONCURRENCY, check_workflow=False
+        )
+    )
+
+    triggered: List[WorkflowConfig] = []
+    for (workflow, execution), response in zip(jobs, responses):
+        if isinstance(response, Exception):
+            logger.error(
+                f"Failed to create execution for workflow {workflow.id}: {str(response)}"
+            )
+            mark_execution_failed(execution, response)
+            not_triggered.append(workflow)
+            results.append(
+                {
+                    "workflow_id": workflow.id,
+                    "workflow_name": workflow.workflow_name,
+                    "status": "error",
+                    "error": str(response),
+                }
+            )
+            continue
+
+        apply_trigger_response(execution, response)
+        triggered.append(workflow)
+        results.append(
+            {
+                "workflow_id": workflow.id,
+                "workflow_name": workflow.workflow_name,
+                "execution_id": execution.id,
+                "status": "success",
+            }
+        )
+
+    save_execution_outcomes(db, [execution for _, execution in jobs])
+    mark_workflows_triggered(db, triggered, now)
+    events = [execution_event(execution) for _, execution in jobs]
+    db.commit()
+    publish_execution_events(events)
+    publish_schedule_changes(
+        [(workflow.id, workflow.next_run_at) for workflow in triggered]
+    )
+    refund_tokens(not_triggered, user_of=lambda workflow: workflow.user_id)
+
+    for result in results:
+        if result["status"] == "success":
+            logger.info(
+                f"Celery: Successfully triggered workflow {result['workflow_id']} "
+                f"({result['workflow_name']}), execution_id: {result['execution_id']}"
+            )
+
+    return results
+
+
+def get_tick_lock():
+    return get_lock(SCHEDULER_TICK_LOCK, settings.SCHEDULER_LOCK_TTL_SECONDS)
+
+
+def finish_tick(lock_token: str, started_at: float) -> None:
+    """Release the single-flight tick lock and record tick metrics"""
+    lease_kept = get_tick_lock().release(lock_token)
+    record_tick_finished(time.time() - started_at, lease_kept=lease_kept)
 
 
 @celery_app.task(name="tasks.check_and_trigger_n8n_workflows", bind=True)
@@ -27,116 +207,179 @@ def check_and_trigger_n8n_workflows(self):
     Checks for workflows that need to be triggered and executes them
 
     Logic:
+    - With SCHEDULER_MODE=timer the timer scheduler owns triggering: do nothing
+    - Single-flight: if the previous tick still holds the lock lease, skip
+    - Due workflows are picked round-robin across users within the per-user
+      and global trigger rates (services.trigger_limiter)
     - If 0 workflows: do nothing
-    - If 1 workflow: trigger it
-    - If >1 workflows: process in loop
-    - All results saved to DB via create_execution
+    - If SCHEDULER_SHARDED: act as a dispatcher only. Claim the due workflow
+      IDs, cut them into SCHEDULER_CHUNK_SIZE chunks and run one
+      trigger_workflow_chunk subtask per chunk; summarize_scheduler_tick
+      gathers the results (chord) and ends the tick
+    - Otherwise: trigger every due workflow inside this task
+    - All results saved to DB as WorkflowExecution rows
     """
+    if settings.SCHEDULER_MODE == "timer":
+        # run_timer_scheduler.py fires workflows at their exact due time
+        return {"status": "skipped", "reason": "timer_scheduler_mode", "count": 0}
+
+    lock_token = get_tick_lock().acquire()
+    if lock_token is None:
+        record_tick_skipped()
+        return {"status": "skipped", "reason": "previous_tick_running", "count": 0}
+
+    record_tick_started()
+    started_at = time.time()
+    tick_handed_off = False
     db = None
     try:
         db = get_db_session()
         now = datetime.now(timezone.utc)
 
-        all_active_workflows = (
-            db.query(WorkflowConfig).filter(WorkflowConfig.is_active == True).all()
-        )
-
-        workflows_to_run = []
-        for workflow in all_active_workflows:
-            if workflow.last_run_at is None:
-                workflows_to_run.append(workflow)
-            else:
-                next_run_time = workflow.last_run_at + timedelta(
-                    minutes=workflow.run_interval_minutes
-                )
-                if next_run_time <= now:
-                    workflows_to_run.append(workflow)
+        if not settings.SCHEDULER_SHARDED:
+            workflows_to_run = select_fair_share(
+                get_due_workflows(db, now, limit=settings.SCHEDULER_FAIR_SCAN_LIMIT),
+                user_of=lambda workflow: workflow.user_id,
+                limit=settings.SCHEDULER_BATCH_SIZE,
+            )
+            count = len(workflows_to_run)
+            if count == 0:
+                logger.info("No due workflows found. Skipping execution")
+                return {"status": "skipped", "reason": "no_active_workflows", "count": 0}
 
-        count = len(workflows_to_run)
+            logger.info(f"Found {count} due workflow(s) to process")
+            results = trigger_workflows(db, workflows_to_run, now)
+            return {
+                "status": "completed",
+                "count": count,
+                "processed": len(results),
+                "results": results,
+            }
 
+        due_rows = select_fair_share(
+            get_due_workflow_rows(db, now, limit=settings.SCHEDULER_FAIR_SCAN_LIMIT),
+            user_of=lambda row: row[1],
+            limit=settings.SCHEDULER_BATCH_SIZE,
+        )
+        workflow_ids = [workflow_id for workflow_id, _ in due_rows]
+        count = len(workflow_ids)
         if count == 0:
-            logger.info("No active workflows found. Skipping execution")
+            logger.info("No due workflows found. Skipping execution")
             return {"status": "skipped", "reason": "no_active_workflows", "count": 0}
 
-        logger.info(f"Found {count} active workflow(s) to process")
-
-        results: List[Dict[str, Any]] = []
-
-        for workflow in workflows_to_run:
-            try:
-                user = db.query(User).filter(User.id == workflow.user_id).first()
-                if not user:
-                    logger.warning(
-                        f"User {workflow.user_id} not found for workflow {workflow.id}"
-                    )
-                    continue
-
-                execution_data = WorkflowExecutionCreate(
-                    workflow_config_id=workflow.id,
-                    keywords="",
-                    location="",
-                    save_as_preset=False,
-                    preset_name=None,
-                )
-
-                logger.info(
-                    f"Celery: Triggering workflow {workflow.id} "
-                    f"(n8n_id: {workflow.n8n_workflow_id}, webhook_path: {workflow.webhook_path or 'none'})"
-                )
-
-                try:
-                    execution = asyncio.run(create_execution(db, user, execution_data))
-
-                    workflow.last_run_at = now
-                    db.commit()
-
-                    results.append(
-                        {
-                            "workflow_id": workflow.id,
-                            "workflow_name": workflow.workflow_name,
-                            "execution_id": execution.id,
-                            "status": "success",
-                        }
-                    )
-                    logger.info(
-                        f"Celery: Successfully triggered workflow {workflow.id} "
-                        f"({workflow.workflow_name}), execution_id: {execution.id}, "
-                        f"next run in {workflow.run_interval_minutes} minutes"
-                    )
-                except Exception as exec_error:
-                    logger.exception(
-                        f"Failed to create execution for workflow {workflow.id}: {str(exec_error)}"
-                    )
-                    results.append(
-                        {
-                            "workflow_id": workflow.id,
-                            "workflow_name": workflow.workflow_name,
-                            "status": "error",
-                            "error": str(exec_error),
-                        }
-                    )
-
-            except Exception as e:
-                logger.exception(f"Failed to process workflow {workflow.id}: {str(e)}")
-                results.append(
-                    {
-                        "workflow_id": workflow.id,
-                        "workflow_name": getattr(workflow, "workflow_name", "unknown"),
-                        "status": "error",
-                        "error": str(e),
-                    }
-                )
+        workflow_ids = claim_workflows(
+            db,
+            workflow_ids,
+            now,
+            now + timedelta(seconds=settings.SCHEDULER_CLAIM_LEASE_SECONDS),
+        )
+        count = len(workflow_ids)
+        # Claimed by a concurrent scheduler first: this tick did not use their tokens
+        claimed_ids = set(workflow_ids)
+        refund_tokens(
+            [row for row in due_rows if row[0] not in claimed_ids],
+            user_of=lambda row: row[1],
+        )
 
+        chunks = list(chunked(workflow_ids, settings.SCHEDULER_CHUNK_SIZE))
+        scheduled_at = now.isoformat()
+        # The chord callback ends the tick (lock release + metrics)
+        tick_handed_off = True
+        result = chord(
+            trigger_workflow_chunk.s(chunk, scheduled_at) for chunk in chunks
+        )(summarize_scheduler_tick.s(count, lock_token, started_at))
+
+        logger.info(
+            f"Dispatched {count} due workflow(s) in {len(chunks)} chunk(s), "
+            f"summary task: {result.id}"
+        )
         return {
-            "status": "completed",
+            "status": "dispatched",
             "count": count,
-            "processed": len(results),
-            "results": results,
+            "chunks": len(chunks),
+            "summary_task_id": result.id,
         }
 
     except Exception as e:
         logger.exception(f"Error in check_and_trigger_n8n_workflows: {str(e)}")
+        tick_handed_off = False
+        return {"status": "error", "error": str(e)}
+    finally:
+        if db:
+            db.close()
+        if not tick_handed_off:
+            finish_tick(lock_token, started_at)
+
+
+@celery_app.task(name="tasks.trigger_workflow_chunk", bind=True)
+def trigger_workflow_chunk(self, workflow_ids: List[int], scheduled_at: str):
+    """Trigger one dispatched chunk of due workflows"""
+    db = None
+    try:
+        db = get_db_session()
+        now = datetime.fromisoformat(scheduled_at)
+        workflows = [
+            workflow
+            for workflow in get_workflows_by_ids(db, workflow_ids)
+            if workflow.is_active
+        ]
+        return trigger_workflows(db, workflows, now)
+    except Exception as e:
+        logger.exception(f"Error in trigger_workflow_chunk: {str(e)}")
+        return [
+            {"workflow_id": workflow_id, "status": "error", "error": str(e)}
+            for workflow_id in workflow_ids
+        ]
+    finally:
+        if db:
+            db.close()
+
+
+@celery_app.task(name="tasks.summarize_scheduler_tick")
+def summarize_scheduler_tick(
+    chunk_results: List[List[Dict[str, Any]]],
+    count: int,
+    lock_token: str,
+    started_at: float,
+):
+    """Chord callback: merge chunk results into the tick summary and end the tick"""
+    finish_tick(lock_token, started_at)
+
+    results = [result for chunk in chunk_results for result in chunk]
+    failed = sum(1 for result in results if result.get("status") == "error")
+    logger.info(
+        f"Scheduler tick finished: {len(results)} processed, {failed} failed"
+    )
+    return {
+        "status": "completed",
+        "count": count,
+        "processed": len(results),
+        "results": results,
+    }
+
+
+@celery_app.task(name="tasks.reconcile_pending_executions")
+def reconcile_pending_executions():
+    """
+    Bring unfinished executions up to date from n8n's executions listing
+    (services.reconciliation_service); single-flight like the scheduler tick
+    """
+    lock = get_lock(RECONCILE_LOCK, settings.RECONCILE_LOCK_TTL_SECONDS)
+    lock_token = lock.acquire()
+    if lock_token is None:
+        return {"status": "skipped", "reason": "previous_sweep_running"}
+
+    db = None
+    try:
+        db = get_db_session()
+        summary = run_async(reconcile_executions(db))
+        return {"status": "completed", **summary}
+    except Exception as e:
+        logger.exception(f"Error in reconcile_pending_executions: {str(e)}")
+        if db:
+            db.rollback()
         return {"status": "error", "error": str(e)}
     finally:
         if db:
             db.close()
+        lock.release(lock_token)
@@ -0,0 +1,45 @@
+import os
+import tempfile
+
+# Settings are read at import time: configure a throwaway SQLite DB first
+_DB_DIR = tempfile.mkdtemp(prefix="backend-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_DB_DIR}/test.db")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("N8N_API_URL", "http://n8n.test/api/v1")
+os.environ.setdefault("N8N_WEBHOOK_URL", "http://n8n.test/webhook")
+os.environ.setdefault("COORDINATION_BACKEND", "memory")
+
+import pytest  # noqa: E402
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from models.user import User  # noqa: E402
+from models.workflow import WorkflowConfig  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    Base.metadata.create_all(engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def user(db):
+    user = User(email="user@example.com", password_hash="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def workflow(db, user):
+    workflow = WorkflowConfig(
+        user_id=user.id, workflow_name="LinkedIn search", n8n_workflow_id="wf-1"
+    )
+    db.add(workflow)
+    db.commit()
+    return workflow
@@ -0,0 +1,111 @@
+import asyncio
+import json
+import time
+
+import httpx
+from app.config import settings
+from services import circuit_breaker, trigger_routes, workflow_cache
+from services.n8n_service import N8NService
+
+REDIS_DELAY = 0.2
+
+
+class SlowRedis:
+    """Blocking client with a fixed round trip, like redis-py over the network"""
+
+    def __init__(self, values=None):
+        self.values = dict(values or {})
+        self.hashes = {}
+
+    def get(self, key):
+        time.sleep(REDIS_DELAY)
+        return self.values.get(key)
+
+    def hgetall(self, key):
+        time.sleep(REDIS_DELAY)
+        return dict(self.hashes.get(key, {}))
+
+    def hset(self, key, field, value):
+        time.sleep(REDIS_DELAY)
+        self.hashes.setdefault(key, {})[field] = value
+
+    def pipeline(self, transaction=True):
+        return SlowPipeline()
+
+
+class SlowPipeline:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+    def execute(self):
+        time.sleep(REDIS_DELAY)
+
+
+def test_cached_workflow_lookups_do_not_block_the_loop(monkeypatch):
+    entry = json.dumps({"id": "wf", "exists": True})
+    redis = SlowRedis({f"{workflow_cache.KEY_PREFIX}wf-{i}": entry for i in range(8)})
+    monkeypatch.setattr(settings, "COORDINATION_BACKEND", "redis")
+    monkeypatch.setattr(workflow_cache, "get_redis_client", lambda: redis)
+    service = N8NService()
+
+    async def lookups():
+        return await asyncio.gather(
+            *(service.get_workflow_metadata(f"wf-{i}") for i in range(8))
+        )
+
+    started = time.perf_counter()
+    results = asyncio.run(lookups())
+    elapsed = time.perf_counter() - started
+
+    assert all(result["exists"] for result in results)
+    # Serialized on the loop this would take 8 round trips
+    assert elapsed < 8 * REDIS_DELAY / 2
+
+
+def test_route_memory_does_not_serialize_concurrent_triggers(monkeypatch):
+    redis = SlowRedis()
+    monkeypatch.setattr(settings, "COORDINATION_BACKEND", "redis")
+    monkeypatch.setattr(settings, "N8N_ROUTE_MEMORY_ENABLED", True)
+    monkeypatch.setattr(settings, "N8N_ROUTE_REPROBE_RATE", 0.0)
+    monkeypatch.setattr(trigger_routes, "get_redis_client", lambda: redis)
+    service = N8NService()
+
+    async def triggers():
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await asyncio.gather(
+                *(
+                    service.trigger_workflow(
+                        f"wf-{i}", {}, client=client, check_workflow=False
+                    )
+                    for i in range(8)
+                )
+            )
+
+    started = time.perf_counter()
+    results = asyncio.run(triggers())
+    elapsed = time.perf_counter() - started
+
+    assert results == [{}] * 8
+    # Each trigger makes 4 round trips (HGETALL, then HGETALL + 2 pipelines)
+    assert elapsed < 8 * 4 * REDIS_DELAY / 2
+
+
+def test_breaker_transitions_publish_without_waiting_for_redis(monkeypatch):
+    redis = SlowRedis()
+    monkeypatch.setattr(settings, "COORDINATION_BACKEND", "redis")
+    monkeypatch.setattr(settings, "N8N_BREAKER_MIN_CALLS", 2)
+    monkeypatch.setattr(circuit_breaker, "get_redis_client", lambda: redis)
+    breaker = circuit_breaker.CircuitBreaker("test-endpoint")
+
+    started = time.perf_counter()
+    breaker.record(False)
+    breaker.record(False)
+    elapsed = time.perf_counter() - started
+
+    assert breaker.state == circuit_breaker.OPEN
+    assert elapsed < REDIS_DELAY
+    circuit_breaker._publisher.submit(lambda: None).result()
+    published = redis.hashes[circuit_breaker.STATES_KEY]
+    state = json.loads(published[f"{circuit_breaker.PROCESS_NAME}:test-endpoint"])
+    assert state["state"] == circuit_breaker.OPEN
@@ -0,0 +1,46 @@
+import asyncio
+
+from app.database import engine
+from schemas.execution import WorkflowExecutionBatchCreate, WorkflowExecutionBatchResponse
+from services import execution_service
+from sqlalchemy import event
+
+
+def test_batch_does_not_reload_executions_one_by_one(db, user, workflow, monkeypatch):
+    async def trigger_workflow(workflow_id, data, **kwargs):
+        if data["keywords"] == "fails":
+            raise Exception("n8n unavailable")
+        return {"executionId": f"n8n-{data['execution_id']}"}
+
+    monkeypatch.setattr(execution_service.n8n_service, "trigger_workflow", trigger_workflow)
+    batch = WorkflowExecutionBatchCreate(
+        workflow_config_id=workflow.id,
+        keywords=["python", "go", "fails"],
+        locations=["Berlin", "Paris"],
+    )
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = asyncio.run(
+            execution_service.ExecutionService.create_executions_batch(db, batch, user)
+        )
+        response = WorkflowExecutionBatchResponse.model_validate(result)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    reloads = [
+        statement
+        for statement in statements
+        if statement.lstrip().upper().startswith("SELECT")
+        and "FROM workflow_executions" in statement
+    ]
+    assert reloads == []
+    assert response.total == 6
+    assert response.failed == 2
+    assert [item.n8n_execution_id for item in response.executions[:2]] == [
+        f"n8n-{execution_id}" for execution_id in response.execution_ids[:2]
+    ]
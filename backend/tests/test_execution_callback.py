@@ -0,0 +1,70 @@
+import asyncio
+import logging
+
+import httpx
+import pytest
+from api import executions
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from models.execution import WorkflowExecution
+from services.n8n_service import N8NService
+from utils.security import create_execution_callback_token
+
+
+@pytest.fixture
+def execution(db, user, workflow):
+    execution = WorkflowExecution(
+        user_id=user.id, workflow_config_id=workflow.id, keywords="python", location="Berlin"
+    )
+    db.add(execution)
+    db.commit()
+    return execution
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(executions.router, prefix="/api")
+    return TestClient(app)
+
+
+def test_callback_accepts_the_token_header(client, execution):
+    response = client.post(
+        f"/api/executions/{execution.id}/callback",
+        json={"status": "success", "result": {"items": []}},
+        headers={"X-Execution-Token": create_execution_callback_token(execution.id)},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"execution_id": execution.id, "applied": True}
+
+
+def test_callback_rejects_the_token_in_the_url(client, execution):
+    response = client.post(
+        f"/api/executions/{execution.id}/callback",
+        params={"token": create_execution_callback_token(execution.id)},
+        json={"status": "success"},
+    )
+
+    assert response.status_code == 403
+
+
+def test_trigger_logs_mask_the_callback_token(caplog):
+    token = create_execution_callback_token(1)
+
+    async def trigger():
+        transport = httpx.MockTransport(lambda request: httpx.Response(404))
+        async with httpx.AsyncClient(transport=transport) as client:
+            await N8NService().trigger_workflow(
+                "wf-1",
+                {"execution_id": 1, "callback_token": token},
+                client=client,
+                check_workflow=False,
+            )
+
+    with caplog.at_level(logging.INFO, logger="services.n8n_service"):
+        with pytest.raises(Exception):
+            asyncio.run(trigger())
+
+    assert "callback_token" in caplog.text
+    assert token not in caplog.text
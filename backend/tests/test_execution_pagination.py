@@ -0,0 +1,39 @@
+from services.execution_service import get_executions_page
+
+
+def _insert_executions(db, user, workflow, count, created_at_sql):
+    # Plain SQL so created_at is stored the way the database writes it
+    # (SQLite's CURRENT_TIMESTAMP has no fractional seconds)
+    db.connection().exec_driver_sql(
+        "INSERT INTO workflow_executions "
+        "(user_id, workflow_config_id, keywords, location, status, has_result, created_at) "
+        f"VALUES {', '.join([f'(?, ?, ?, ?, ?, 0, {created_at_sql})'] * count)}",
+        tuple(
+            value
+            for i in range(count)
+            for value in (user.id, workflow.id, f"k{i}", "l", "pending")
+        ),
+    )
+    db.commit()
+
+
+def _walk(db, user, limit):
+    pages, cursor = [], None
+    while True:
+        executions, cursor = get_executions_page(db, user.id, limit, cursor=cursor)
+        pages.append([execution.id for execution in executions])
+        if cursor is None or len(pages) > 10:
+            return pages
+
+
+def test_pages_advance_over_rows_sharing_a_second(db, user, workflow):
+    _insert_executions(db, user, workflow, 7, "CURRENT_TIMESTAMP")
+
+    assert _walk(db, user, limit=2) == [[7, 6], [5, 4], [3, 2], [1]]
+
+
+def test_pages_cover_every_row_once_across_timestamps(db, user, workflow):
+    _insert_executions(db, user, workflow, 3, "'2026-01-01 10:00:00'")
+    _insert_executions(db, user, workflow, 4, "'2026-01-01 09:00:00'")
+
+    assert _walk(db, user, limit=3) == [[3, 2, 1], [7, 6, 5], [4]]
@@ -0,0 +1,76 @@
+import io
+import json
+from datetime import datetime, timezone
+
+import pytest
+from models.execution import WorkflowExecution
+from services.export_service import (
+    DATASETS,
+    EXECUTION_EXPORT_COLUMNS,
+    execution_rows_query,
+    stream_columnar,
+)
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+COLUMNS = DATASETS["executions"][2]
+
+
+@pytest.fixture
+def executions(db, user, workflow):
+    executions = [
+        WorkflowExecution(
+            user_id=user.id,
+            workflow_config_id=workflow.id,
+            keywords=f"keyword {i}",
+            location="Berlin",
+            status="success",
+            result={"items": [{"title": f"Job {i}"}]} if i % 2 else None,
+            created_at=datetime(2026, 1, 1, 10, i, tzinfo=timezone.utc),
+        )
+        for i in range(5)
+    ]
+    db.add_all(executions)
+    db.commit()
+    return executions
+
+
+def _export(fmt, user, batch_size):
+    return b"".join(
+        stream_columnar(fmt, execution_rows_query, user.id, COLUMNS, batch_size)
+    )
+
+
+def test_parquet_round_trip_writes_one_row_group_per_batch(user, executions):
+    parquet = pq.ParquetFile(io.BytesIO(_export("parquet", user, batch_size=2)))
+    table = parquet.read()
+
+    assert parquet.metadata.num_row_groups == 3
+    assert table.column_names == [column.key for column in COLUMNS]
+    assert table.column("id").to_pylist() == [5, 4, 3, 2, 1]
+    assert table.column("keywords").to_pylist()[0] == "keyword 4"
+    assert table.column("created_at").to_pylist()[0] == datetime(
+        2026, 1, 1, 10, 4, tzinfo=timezone.utc
+    )
+    results = table.column("result").to_pylist()
+    assert json.loads(results[1]) == {"items": [{"title": "Job 3"}]}
+    assert results[0] is None
+
+
+def test_arrow_stream_round_trip(user, executions):
+    reader = pa.ipc.open_stream(_export("arrow", user, batch_size=2))
+    batches = list(reader)
+    table = pa.Table.from_batches(batches)
+
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+    assert table.schema == reader.schema
+    assert table.column("id").to_pylist() == [5, 4, 3, 2, 1]
+    assert table.num_columns == len(EXECUTION_EXPORT_COLUMNS) + 1
+
+
+def test_empty_export_is_still_a_readable_file(user):
+    table = pq.read_table(io.BytesIO(_export("parquet", user, batch_size=2)))
+
+    assert table.num_rows == 0
+    assert table.column_names == [column.key for column in COLUMNS]
@@ -0,0 +1,38 @@
+import asyncio
+import threading
+
+from services.n8n_service import N8NService
+
+
+def test_each_loop_keeps_its_client_and_aclose_closes_them_all():
+    service = N8NService()
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+    try:
+
+        async def get_client():
+            return service.get_client()
+
+        other_client = asyncio.run_coroutine_threadsafe(get_client(), other_loop).result()
+
+        async def main():
+            client = service.get_client()
+            assert service.get_client() is client
+            assert client is not other_client
+            # Switching loops does not replace the other loop's client
+            still_other = await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(get_client(), other_loop)
+            )
+            assert still_other is other_client
+            await service.aclose()
+            return client
+
+        client = asyncio.run(main())
+
+        assert client.is_closed
+        assert other_client.is_closed
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
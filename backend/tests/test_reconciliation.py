@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta, timezone
+
+from models.execution import WorkflowExecution
+from services.reconciliation_service import apply_reconciliation, build_updates
+
+
+def test_only_unfinished_executions_are_counted_as_updated(db, user, workflow):
+    now = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    executions = [
+        WorkflowExecution(
+            user_id=user.id,
+            workflow_config_id=workflow.id,
+            keywords="python",
+            location="Berlin",
+            status=status,
+            n8n_execution_id=f"n8n-{index}",
+            created_at=now - timedelta(hours=1),
+        )
+        for index, status in enumerate(["pending", "running", "success", "error"])
+    ]
+    db.add_all(executions)
+    db.commit()
+    rows = [(execution.id, execution.n8n_execution_id, "wf-1") for execution in executions]
+    outcomes = {
+        "n8n-0": {"status": "success", "stoppedAt": "2026-01-01T23:30:00.000Z"},
+        "n8n-1": {"status": "crashed"},
+        # Finished here already (e.g. cancelled): must stay as it is
+        "n8n-2": {"status": "error"},
+        "n8n-3": {"status": "success"},
+    }
+
+    updated, stale = apply_reconciliation(
+        db, build_updates(rows, outcomes, now), now - timedelta(days=1), now
+    )
+
+    assert (updated, stale) == (2, 0)
+    db.expire_all()
+    assert [execution.status for execution in executions] == [
+        "success",
+        "error",
+        "success",
+        "error",
+    ]
+    assert executions[1].result == {"error": "n8n execution crashed"}
+    assert executions[1].has_result
+    assert executions[2].result is None
@@ -0,0 +1,42 @@
+import threading
+
+import pytest
+from services import scheduler_metrics
+from services.scheduler_metrics import get_tick_metrics, record_tick_finished
+
+
+@pytest.fixture(autouse=True)
+def metrics(monkeypatch):
+    monkeypatch.setattr(scheduler_metrics, "_memory_metrics", {})
+
+
+def test_max_tick_duration_keeps_the_longest_tick():
+    record_tick_finished(12.5)
+    record_tick_finished(3.0)
+
+    metrics = get_tick_metrics()
+    assert metrics["max_tick_duration_seconds"] == 12.5
+    assert metrics["last_tick_duration_seconds"] == 3.0
+    assert metrics["ticks_completed"] == 2
+
+
+def test_concurrent_ticks_do_not_lose_the_max():
+    durations = [float(value) for value in range(1, 201)]
+    start = threading.Barrier(8)
+
+    def finish(share):
+        start.wait()
+        for duration in share:
+            record_tick_finished(duration)
+
+    threads = [
+        threading.Thread(target=finish, args=(durations[index::8],)) for index in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    metrics = get_tick_metrics()
+    assert metrics["max_tick_duration_seconds"] == 200.0
+    assert metrics["ticks_completed"] == 200
@@ -0,0 +1,38 @@
+import pytest
+from app.config import settings
+from services import trigger_limiter
+from services.trigger_limiter import refund_tokens, select_fair_share
+
+NOW = 1_000_000.0
+
+
+@pytest.fixture(autouse=True)
+def limits(monkeypatch):
+    monkeypatch.setattr(trigger_limiter, "_memory_buckets", {})
+    monkeypatch.setattr(settings, "SCHEDULER_USER_RATE_PER_MINUTE", 1)
+    monkeypatch.setattr(settings, "SCHEDULER_USER_BURST", 2)
+    monkeypatch.setattr(settings, "SCHEDULER_GLOBAL_RATE_PER_MINUTE", 1)
+    monkeypatch.setattr(settings, "SCHEDULER_GLOBAL_BURST", 3)
+
+
+def _owner(item):
+    return item[0]
+
+
+def test_refunded_tokens_can_be_used_again():
+    due = [("a", 1), ("a", 2), ("b", 3)]
+    assert select_fair_share(due, _owner, now=NOW) == [("a", 1), ("b", 3), ("a", 2)]
+    assert select_fair_share(due, _owner, now=NOW) == []
+
+    # ("a", 2) lost the claim, ("b", 3) failed to trigger
+    refund_tokens([("a", 2), ("b", 3)], _owner, now=NOW)
+
+    assert select_fair_share(due, _owner, now=NOW) == [("a", 1), ("b", 3)]
+
+
+def test_refunds_do_not_exceed_the_burst():
+    refund_tokens([("a", 1)] * 5, _owner, now=NOW)
+
+    selected = select_fair_share([("a", i) for i in range(5)], _owner, now=NOW)
+
+    assert len(selected) == settings.SCHEDULER_USER_BURST
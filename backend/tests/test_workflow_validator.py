@@ -0,0 +1,37 @@
+from utils.workflow_validator import WEBHOOK_NODE_TYPE, compile_trigger_metadata
+
+
+def test_first_webhook_with_a_path_is_the_trigger():
+    workflow = {
+        "nodes": [
+            {"name": "Draft hook", "type": WEBHOOK_NODE_TYPE, "parameters": {}},
+            {"name": "Search hook", "type": WEBHOOK_NODE_TYPE, "parameters": {"path": "search"}},
+            {
+                "name": "LinkedIn",
+                "type": "n8n-nodes-base.httpRequest",
+                "parameters": {"query": "={{ $json.body.keywords }} {{ $json['location'] }}"},
+            },
+        ],
+        "connections": {"Search hook": {"main": [[{"node": "LinkedIn"}]]}},
+    }
+
+    assert compile_trigger_metadata(workflow) == {
+        "trigger_node_type": WEBHOOK_NODE_TYPE,
+        "trigger_webhook_path": "search",
+        "trigger_input_fields": ["keywords", "location"],
+    }
+
+
+def test_webhook_without_a_path_still_wins_over_other_triggers():
+    workflow = {
+        "nodes": [
+            {"name": "Schedule", "type": "n8n-nodes-base.scheduleTrigger"},
+            {"name": "Hook", "type": WEBHOOK_NODE_TYPE, "parameters": {"path": ""}},
+        ],
+    }
+
+    assert compile_trigger_metadata(workflow) == {
+        "trigger_node_type": WEBHOOK_NODE_TYPE,
+        "trigger_webhook_path": None,
+        "trigger_input_fields": [],
+    }
@@ -0,0 +1,34 @@
+"""
+Persistent event loop for running coroutines from sync code (Celery tasks).
+asyncio.run() creates and closes a loop per call, which would throw away
+the shared n8n connection pool every time; this loop lives as long as the
+worker process (one per thread).
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable
+
+_local = threading.local()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """This thread's long-lived event loop (created on first use)"""
+    loop = getattr(_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _local.loop = loop
+    return loop
+
+
+def run_async(coro: Awaitable[Any]) -> Any:
+    """Run a coroutine to completion on this thread's persistent loop"""
+    return get_event_loop().run_until_complete(coro)
+
+
+def close_event_loop() -> None:
+    loop = getattr(_local, "loop", None)
+    if loop is not None and not loop.is_closed():
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+    _local.loop = None
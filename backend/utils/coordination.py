@@ -0,0 +1,119 @@
+"""
+Cross-process coordination primitives (Redis with in-memory stand-ins).
+The in-memory variants only coordinate within one process and are meant
+for tests and single-process setups (COORDINATION_BACKEND=memory).
+"""
+
+import asyncio
+import os
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import redis
+from app.config import settings
+
+_redis_client: Optional[redis.Redis] = None
+
+
+def get_redis_url() -> str:
+    """Redis URL for coordination data (same default as the Celery broker)"""
+    return settings.REDIS_URL or os.getenv("CELERY_BROKER_URL", "redis://redis:6379/0")
+
+
+def get_redis_client() -> redis.Redis:
+    """Shared Redis client (connection pool) for this process"""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(get_redis_url(), decode_responses=True)
+    return _redis_client
+
+
+def use_redis() -> bool:
+    return settings.COORDINATION_BACKEND == "redis"
+
+
+async def run_coordination_call(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Call a (blocking) coordination function from async code. With Redis it
+    runs in a worker thread, so concurrent coroutines on the loop do not
+    queue up behind Redis round trips; in-memory calls run inline.
+    """
+    if use_redis():
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return func(*args, **kwargs)
+
+
+class InMemoryLock:
+    """Lease lock kept in process memory"""
+
+    _leases: Dict[str, Tuple[str, float]] = {}
+    _guard = threading.Lock()
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+
+    def acquire(self) -> Optional[str]:
+        """Take the lease; returns the owner token or None if it is held"""
+        with self._guard:
+            now = self.clock()
+            lease = self._leases.get(self.name)
+            if lease and lease[1] > now:
+                return None
+            token = uuid.uuid4().hex
+            self._leases[self.name] = (token, now + self.ttl_seconds)
+            return token
+
+    def release(self, token: str) -> bool:
+        """Release the lease; False if it already expired or changed owner"""
+        with self._guard:
+            lease = self._leases.get(self.name)
+            if not lease or lease[0] != token or lease[1] <= self.clock():
+                return False
+            del self._leases[self.name]
+            return True
+
+
+class RedisLock:
+    """Lease lock stored in Redis (SET NX PX + compare-and-delete)"""
+
+    _RELEASE_SCRIPT = """
+    if redis.call("get", KEYS[1]) == ARGV[1] then
+        return redis.call("del", KEYS[1])
+    end
+    return 0
+    """
+
+    def __init__(
+        self, name: str, ttl_seconds: float, client: Optional[redis.Redis] = None
+    ):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.client = client or get_redis_client()
+
+    def acquire(self) -> Optional[str]:
+        """Take the lease; returns the owner token or None if it is held"""
+        token = uuid.uuid4().hex
+        acquired = self.client.set(
+            self.name, token, nx=True, px=int(self.ttl_seconds * 1000)
+        )
+        return token if acquired else None
+
+    def release(self, token: str) -> bool:
+        """Release the lease; False if it already expired or changed owner"""
+        return bool(self.client.eval(self._RELEASE_SCRIPT, 1, self.name, token))
+
+
+def get_lock(name: str, ttl_seconds: float):
+    """Lease lock for the configured coordination backend"""
+    if use_redis():
+        return RedisLock(name, ttl_seconds)
+    return InMemoryLock(name, ttl_seconds)
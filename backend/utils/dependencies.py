@@ -1,27 +1,31 @@
 from typing import Optional
 
-from app.database import get_db
-from fastapi import Depends, HTTPException, status
+from app.database import SessionLocal, get_db
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from models.user import User
 from sqlalchemy.orm import Session
-from utils.security import decode_access_token
+from utils.security import EXECUTION_EVENTS_SCOPE, decode_access_token
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
+def get_user_from_token(
+    token: Optional[str], db: Session, scope: Optional[str] = None
 ) -> User:
-    """Get current authenticated user from JWT token"""
+    """
+    Resolve a JWT to its user or raise 401. Scoped tokens (e.g. execution
+    events stream tokens) are only accepted where that scope is asked for.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    payload = decode_access_token(token)
-    if payload is None:
+    payload = decode_access_token(token) if token else None
+    if payload is None or payload.get("scope") != scope:
         raise credentials_exception
 
     sub_claim = payload.get("sub")
@@ -38,3 +42,32 @@ def get_current_user(
         raise credentials_exception
 
     return user
+
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
+) -> User:
+    """Get current authenticated user from JWT token"""
+    return get_user_from_token(token, db)
+
+
+def get_stream_user(
+    token: Optional[str] = Depends(optional_oauth2_scheme),
+    stream_token: Optional[str] = Query(None),
+) -> User:
+    """
+    Current user for the execution events stream
+
+    EventSource cannot send headers, so it passes a short-lived, stream-only
+    ?stream_token= (POST /api/executions/events/token) instead of the access
+    token, which must never end up in URLs. The lookup uses its own short
+    session: a get_db session would hold a pooled connection for as long as
+    the stream is open.
+    """
+    db = SessionLocal()
+    try:
+        if token:
+            return get_user_from_token(token, db)
+        return get_user_from_token(stream_token, db, scope=EXECUTION_EVENTS_SCOPE)
+    finally:
+        db.close()
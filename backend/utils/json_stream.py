@@ -0,0 +1,196 @@
+"""
+Incremental JSON parsing of large n8n responses
+
+n8n result payloads are either an array of items or an object with one
+array of items in it ({"data": [...], "executionId": ...}). The parser is
+fed raw bytes as they arrive and hands out the array's items one by one,
+so only the item being decoded is ever buffered. Everything outside the
+array (the "envelope") is kept as a small dict.
+"""
+
+import codecs
+import json
+from typing import Any, AsyncIterable, Dict, List, Optional
+
+_WHITESPACE = " \t\r\n"
+_NUMBER_END = _WHITESPACE + ",]}"
+_decoder = json.JSONDecoder()
+
+# Parser states
+_START = "start"
+_KEY = "key"
+_COLON = "colon"
+_VALUE = "value"
+_ITEMS = "items"
+_SCALAR = "scalar"
+_DONE = "done"
+
+
+class JsonStreamError(ValueError):
+    """The streamed body is not valid JSON (or an item is too large)"""
+
+
+class JsonItemStream:
+    """
+    Push parser: feed() bytes, get back the array items completed so far.
+    Call close() at the end of the body to validate it and get the envelope.
+    """
+
+    def __init__(self, max_item_chars: int = 16 * 2**20):
+        self.max_item_chars = max_item_chars
+        self.envelope: Dict[str, Any] = {}
+        self.items_key: Optional[str] = None
+        self.root_is_array = False
+        self._decode = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._key: Optional[str] = None
+        self._closed = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        # Drop what was consumed once per chunk, not once per item
+        self._buffer = self._buffer[self._pos :] + self._decode.decode(chunk)
+        self._pos = 0
+        items = self._parse()
+        if len(self._buffer) - self._pos > self.max_item_chars:
+            raise JsonStreamError(
+                f"JSON value larger than {self.max_item_chars} characters"
+            )
+        return items
+
+    def close(self) -> Dict[str, Any]:
+        self._buffer += self._decode.decode(b"", final=True)
+        self._closed = True
+        self._parse()
+        if self._state != _DONE or self._buffer[self._pos :].strip(_WHITESPACE):
+            raise JsonStreamError("Truncated or invalid JSON body")
+        return self.envelope
+
+    def _skip(self, chars: str = _WHITESPACE) -> Optional[str]:
+        """Drop leading `chars`; return the next character (None if none yet)"""
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in chars:
+            pos += 1
+        self._pos = pos
+        return buffer[pos] if pos < len(buffer) else None
+
+    def _take_value(self) -> Any:
+        """
+        Decode one complete JSON value at the start of the buffer. Raises
+        _Incomplete when more data is needed.
+        """
+        try:
+            value, end = _decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError as e:
+            if self._closed:
+                raise JsonStreamError(str(e)) from e
+            raise _Incomplete() from e
+        # A number cut by the chunk boundary ("12" of "123", "2." of "2.5")
+        # still decodes: only accept it once a delimiter follows
+        if (
+            isinstance(value, (int, float))
+            and not self._closed
+            and (end == len(self._buffer) or self._buffer[end] not in _NUMBER_END)
+        ):
+            raise _Incomplete()
+        self._pos = end
+        return value
+
+    def _parse(self) -> List[Any]:
+        items: List[Any] = []
+        try:
+            while self._state != _DONE:
+                if self._state == _START:
+                    char = self._skip()
+                    if char is None:
+                        break
+                    if char == "[":
+                        self.root_is_array = True
+                        self._pos += 1
+                        self._state = _ITEMS
+                    elif char == "{":
+                        self._pos += 1
+                        self._state = _KEY
+                    else:
+                        self._state = _SCALAR
+
+                elif self._state == _SCALAR:
+                    self.envelope = {"value": self._take_value()}
+                    self._state = _DONE
+
+                elif self._state == _KEY:
+                    char = self._skip(_WHITESPACE + ",")
+                    if char is None:
+                        break
+                    if char == "}":
+                        self._pos += 1
+                        self._state = _DONE
+                        continue
+                    self._key = self._take_value()
+                    if not isinstance(self._key, str):
+                        raise JsonStreamError("Object key is not a string")
+                    self._state = _COLON
+
+                elif self._state == _COLON:
+                    char = self._skip()
+                    if char is None:
+                        break
+                    if char != ":":
+                        raise JsonStreamError(f"Expected ':' after key {self._key!r}")
+                    self._pos += 1
+                    self._state = _VALUE
+
+                elif self._state == _VALUE:
+                    char = self._skip()
+                    if char is None:
+                        break
+                    if char == "[" and self.items_key is None:
+                        # The first array in the envelope holds the items
+                        self.items_key = self._key
+                        self._pos += 1
+                        self._state = _ITEMS
+                    else:
+                        self.envelope[self._key] = self._take_value()
+                        self._state = _KEY
+
+                elif self._state == _ITEMS:
+                    char = self._skip(_WHITESPACE + ",")
+                    if char is None:
+                        break
+                    if char == "]":
+                        self._pos += 1
+                        self._state = _DONE if self.root_is_array else _KEY
+                        continue
+                    items.append(self._take_value())
+        except _Incomplete:
+            pass
+        return items
+
+
+class _Incomplete(Exception):
+    pass
+
+
+async def stream_json_items(chunks: AsyncIterable[bytes], sink) -> Any:
+    """
+    Parse a JSON body chunk by chunk and add every item to `sink`
+    (see services.result_sinks). Returns the envelope; when items were
+    streamed it also carries the item count and the sink's summary.
+    """
+    parser = JsonItemStream()
+    count = 0
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            sink.add(item)
+            count += 1
+    envelope = parser.close()
+    summary = sink.close()
+    if not count:
+        # Nothing streamed: same value a buffered response.json() would give
+        if parser.root_is_array:
+            return []
+        if parser.items_key is not None:
+            return {**envelope, parser.items_key: []}
+        return envelope
+    return {**envelope, "items_streamed": count, **summary}
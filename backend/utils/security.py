@@ -1,3 +1,5 @@
+import hashlib
+import hmac
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -62,3 +64,31 @@ def decode_access_token(token: str) -> Optional[dict]:
         return payload
     except JWTError:
         return None
+
+
+EXECUTION_EVENTS_SCOPE = "execution_events"
+
+
+def create_execution_events_token(user_id: int) -> str:
+    """
+    Short-lived JWT that only opens the execution events stream. EventSource
+    puts it in the URL, where access logs and history keep it, so the
+    regular access token must not go there
+    """
+    return create_access_token(
+        {"sub": str(user_id), "scope": EXECUTION_EVENTS_SCOPE},
+        expires_delta=timedelta(seconds=settings.EXECUTION_EVENTS_TOKEN_TTL_SECONDS),
+    )
+
+
+def create_execution_callback_token(execution_id: int) -> str:
+    """HMAC token n8n presents when it reports the result of one execution"""
+    message = f"execution-callback:{execution_id}".encode("utf-8")
+    return hmac.new(settings.SECRET_KEY.encode("utf-8"), message, hashlib.sha256).hexdigest()
+
+
+def verify_execution_callback_token(execution_id: int, token: Optional[str]) -> bool:
+    """Check a callback token in constant time"""
+    if not token:
+        return False
+    return hmac.compare_digest(create_execution_callback_token(execution_id), token)
@@ -152,6 +152,98 @@ def extract_workflow_metadata(json_data: Dict[str, Any]) -> Dict[str, Any]:
     return metadata
 
 
+WEBHOOK_NODE_TYPE = "n8n-nodes-base.webhook"
+
+# $json.keywords, $json.body.keywords, $json["keywords"], $json.body['keywords']
+_INPUT_FIELD_PATTERNS = (
+    re.compile(r"\$json(?:\.body)?\.([A-Za-z_]\w*)"),
+    re.compile(r"\$json(?:\.body)?\[[\"']([^\"']+)[\"']\]"),
+)
+
+
+def _webhook_path(node: Dict[str, Any]) -> Optional[str]:
+    params = node.get("parameters") or {}
+    return params.get("path") or params.get("webhookId") or None
+
+
+def _find_trigger_node(nodes: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    First webhook node with a path, else the first webhook node, else the
+    first *Trigger node
+    """
+    webhooks = [node for node in nodes if node.get("type") == WEBHOOK_NODE_TYPE]
+    for node in webhooks:
+        if _webhook_path(node):
+            return node
+    if webhooks:
+        return webhooks[0]
+    for node in nodes:
+        if str(node.get("type", "")).lower().endswith("trigger"):
+            return node
+    return None
+
+
+def _collect_strings(value: Any) -> List[str]:
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        return [text for item in value.values() for text in _collect_strings(item)]
+    if isinstance(value, list):
+        return [text for item in value for text in _collect_strings(item)]
+    return []
+
+
+def compile_trigger_metadata(json_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Extract what triggering needs from workflow JSON, once at import time
+
+    Args:
+        json_data: Workflow JSON (may be None)
+
+    Returns:
+        Dictionary with trigger_node_type, trigger_webhook_path and
+        trigger_input_fields (fields the nodes right after the trigger read
+        from its output, e.g. keywords/location)
+    """
+    nodes = (json_data or {}).get("nodes") or []
+    trigger = _find_trigger_node([node for node in nodes if isinstance(node, dict)])
+    if trigger is None:
+        return {
+            "trigger_node_type": None,
+            "trigger_webhook_path": None,
+            "trigger_input_fields": [],
+        }
+
+    webhook_path = None
+    if trigger.get("type") == WEBHOOK_NODE_TYPE:
+        webhook_path = _webhook_path(trigger)
+
+    # Nodes fed directly by the trigger read the trigger input via $json
+    connections = (json_data.get("connections") or {}).get(trigger.get("name"), {})
+    next_names = {
+        link.get("node")
+        for outputs in connections.values()
+        for output in outputs or []
+        for link in output or []
+        if isinstance(link, dict)
+    }
+    fields: List[str] = []
+    for node in nodes:
+        if not isinstance(node, dict) or node.get("name") not in next_names:
+            continue
+        for text in _collect_strings(node.get("parameters")):
+            for pattern in _INPUT_FIELD_PATTERNS:
+                for field in pattern.findall(text):
+                    if field not in fields:
+                        fields.append(field)
+
+    return {
+        "trigger_node_type": trigger.get("type"),
+        "trigger_webhook_path": webhook_path,
+        "trigger_input_fields": fields,
+    }
+
+
 def sanitize_workflow_json(json_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Remove sensitive credentials from workflow JSON
@@ -1,20 +1,23 @@
 import { useState, useEffect, useRef, useCallback } from 'react';
-import type { Execution } from '../types';
+import type { Execution, ExecutionStatusEvent } from '../types';
 import { workflowService } from '../services/workflow.service';
 
 interface UseExecutionStatusOptions {
   executionId: number;
-  pollInterval?: number; // milliseconds
+  pollInterval?: number; // milliseconds, only used if the event stream is unavailable
   onComplete?: (execution: Execution) => void;
   onError?: (error: Error) => void;
 }
 
+const isFinished = (status: string) => status === 'success' || status === 'error';
+
 export const useExecutionStatus = (options: UseExecutionStatusOptions) => {
   const { executionId, pollInterval = 2000, onComplete, onError } = options;
   const [execution, setExecution] = useState<Execution | null>(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const intervalRef = useRef<ReturnType<typeof setInterval> | null>(null);
+  const unsubscribeRef = useRef<(() => void) | null>(null);
   const onCompleteRef = useRef(onComplete);
   const onErrorRef = useRef(onError);
 
@@ -24,6 +27,18 @@ export const useExecutionStatus = (options: UseExecutionStatusOptions) => {
     onErrorRef.current = onError;
   }, [onComplete, onError]);
 
+  // Stops both the event stream and the polling fallback
+  const stopPolling = useCallback(() => {
+    if (unsubscribeRef.current) {
+      unsubscribeRef.current();
+      unsubscribeRef.current = null;
+    }
+    if (intervalRef.current) {
+      clearInterval(intervalRef.current);
+      intervalRef.current = null;
+    }
+  }, []);
+
   const fetchExecution = useCallback(async () => {
     if (!executionId) return;
 
@@ -34,36 +49,45 @@ export const useExecutionStatus = (options: UseExecutionStatusOptions) => {
       setExecution(data);
 
       // Check if execution is complete
-      if (data.status === 'success' || data.status === 'error') {
-        if (intervalRef.current) {
-          clearInterval(intervalRef.current);
-          intervalRef.current = null;
-        }
+      if (isFinished(data.status)) {
+        stopPolling();
         if (onCompleteRef.current) {
           onCompleteRef.current(data);
         }
       }
+      return data;
     } catch (err: any) {
       const errorMessage = err.message || 'Failed to fetch execution status';
       setError(errorMessage);
-      if (intervalRef.current) {
-        clearInterval(intervalRef.current);
-        intervalRef.current = null;
-      }
+      stopPolling();
       if (onErrorRef.current) {
         onErrorRef.current(err);
       }
     } finally {
       setLoading(false);
     }
-  }, [executionId]);
+  }, [executionId, stopPolling]);
 
-  const stopPolling = useCallback(() => {
-    if (intervalRef.current) {
-      clearInterval(intervalRef.current);
-      intervalRef.current = null;
-    }
-  }, []);
+  const handleEvent = useCallback(
+    (event: ExecutionStatusEvent) => {
+      if (event.id !== executionId) return;
+      setExecution((current) =>
+        current
+          ? {
+              ...current,
+              status: event.status,
+              n8n_execution_id: event.n8n_execution_id,
+              completed_at: event.completed_at,
+            }
+          : current
+      );
+      if (isFinished(event.status)) {
+        // Events carry no result: load the finished execution once
+        fetchExecution();
+      }
+    },
+    [executionId, fetchExecution]
+  );
 
   useEffect(() => {
     if (!executionId) {
@@ -71,19 +95,30 @@ export const useExecutionStatus = (options: UseExecutionStatusOptions) => {
       return;
     }
 
-    // Clean up previous interval
+    // Clean up previous subscription
     stopPolling();
 
-    // Initial fetch
-    fetchExecution();
-
-    // Set up polling
-    intervalRef.current = setInterval(fetchExecution, pollInterval);
+    let cancelled = false;
+    fetchExecution().then((data) => {
+      if (cancelled || !data || isFinished(data.status)) return;
+      unsubscribeRef.current = workflowService.subscribeExecutionEvents(
+        [executionId],
+        handleEvent,
+        () => {
+          // Stream unavailable: fall back to polling
+          unsubscribeRef.current = null;
+          if (!cancelled && !intervalRef.current) {
+            intervalRef.current = setInterval(fetchExecution, pollInterval);
+          }
+        }
+      );
+    });
 
     return () => {
+      cancelled = true;
       stopPolling();
     };
-  }, [executionId, pollInterval, fetchExecution, stopPolling]);
+  }, [executionId, pollInterval, fetchExecution, handleEvent, stopPolling]);
 
   const cancelExecution = useCallback(async () => {
     if (!executionId) return;
@@ -22,7 +22,7 @@ import { ActiveWorkflowsList } from '../components/workflow/ActiveWorkflowsList'
 import { Link as RouterLink, useParams, useNavigate } from 'react-router-dom';
 import { useExecutionStatus } from '../hooks/useExecutionStatus';
 import { workflowService } from '../services/workflow.service';
-import type { WorkflowConfig, WorkflowPreset, Execution, ExecutionCreate } from '../types';
+import type { WorkflowConfig, WorkflowPreset, Execution, ExecutionCreate, ExecutionSummary } from '../types';
 
 export const DashboardPage: React.FC = () => {
   const { workflowId } = useParams<{ workflowId: string }>();
@@ -34,7 +34,7 @@ export const DashboardPage: React.FC = () => {
   const [showPresets, setShowPresets] = useState(false);
   const [executionLoading, setExecutionLoading] = useState(false);
   const [selectedPreset, setSelectedPreset] = useState<WorkflowPreset | null>(null);
-  const [recentExecutions, setRecentExecutions] = useState<Execution[]>([]);
+  const [recentExecutions, setRecentExecutions] = useState<ExecutionSummary[]>([]);
   const [executionsLoading, setExecutionsLoading] = useState(false);
   const [activeWorkflows, setActiveWorkflows] = useState<WorkflowConfig[]>([]);
   const [activeWorkflowsLoading, setActiveWorkflowsLoading] = useState(false);
@@ -128,9 +128,9 @@ export const DashboardPage: React.FC = () => {
   const fetchRecentExecutions = useCallback(async () => {
     setExecutionsLoading(true);
     try {
-      const data = await workflowService.getExecutions();
       // Показуємо тільки останні 5
-      setRecentExecutions(data.slice(0, 5));
+      const page = await workflowService.getExecutions({ limit: 5 });
+      setRecentExecutions(page.items);
     } catch (error) {
       console.error('Failed to fetch executions:', error);
     } finally {
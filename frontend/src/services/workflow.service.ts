@@ -6,6 +6,11 @@ import type {
   WorkflowPresetCreate, 
   Execution, 
   ExecutionCreate,
+  ExecutionStatusEvent,
+  ExecutionListParams,
+  ExecutionPage,
+  ExecutionBatchCreate,
+  ExecutionBatchResponse,
   WorkflowJsonExport,
   LinkedinResult,
 } from '../types';
@@ -62,8 +67,8 @@ export const workflowService = {
   },
 
   // Executions
-  async getExecutions(): Promise<Execution[]> {
-    const response = await api.get<Execution[]>('/executions');
+  async getExecutions(params: ExecutionListParams = {}): Promise<ExecutionPage> {
+    const response = await api.get<ExecutionPage>('/executions', { params });
     return response.data;
   },
 
@@ -85,11 +90,66 @@ export const workflowService = {
     return response.data;
   },
 
+  // Status changes pushed by the server; returns a function that closes the stream
+  subscribeExecutionEvents(
+    ids: number[],
+    onEvent: (event: ExecutionStatusEvent) => void,
+    onError: () => void
+  ): () => void {
+    let source: EventSource | null = null;
+    let closed = false;
+
+    const open = async () => {
+      let streamToken: string;
+      try {
+        // Short-lived, stream-only token: the access token never goes into the URL
+        const response = await api.post<{ stream_token: string }>('/executions/events/token');
+        streamToken = response.data.stream_token;
+      } catch {
+        if (!closed) onError();
+        return;
+      }
+      if (closed) return;
+
+      const params = new URLSearchParams({ ids: ids.join(','), stream_token: streamToken });
+      const current = new EventSource(`${api.defaults.baseURL}/executions/events?${params}`);
+      let opened = false;
+      source = current;
+      current.onopen = () => {
+        opened = true;
+      };
+      current.addEventListener('execution', (message) => {
+        onEvent(JSON.parse((message as MessageEvent).data));
+      });
+      current.onerror = () => {
+        // Network errors are retried by EventSource itself; CLOSED means it gave up,
+        // e.g. because the stream token expired before a reconnect
+        if (current.readyState !== EventSource.CLOSED || closed) return;
+        if (opened) {
+          open();
+        } else {
+          onError();
+        }
+      };
+    };
+
+    open();
+    return () => {
+      closed = true;
+      source?.close();
+    };
+  },
+
   async createExecution(data: ExecutionCreate): Promise<Execution> {
     const response = await api.post<Execution>('/executions', data);
     return response.data;
   },
 
+  async createExecutionsBatch(data: ExecutionBatchCreate): Promise<ExecutionBatchResponse> {
+    const response = await api.post<ExecutionBatchResponse>('/executions/batch', data);
+    return response.data;
+  },
+
   async cancelExecution(id: number): Promise<void> {
     await api.post(`/executions/${id}/cancel`);
   },
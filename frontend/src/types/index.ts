@@ -97,6 +97,32 @@ export interface Execution {
 
 export type ExecutionStatus = 'pending' | 'running' | 'success' | 'error';
 
+// "execution" event of GET /executions/events (Server-Sent Events)
+export interface ExecutionStatusEvent {
+  id: number;
+  user_id: number;
+  status: ExecutionStatus;
+  n8n_execution_id: string | null;
+  completed_at: string | null;
+}
+
+// List views: everything except the result JSON (fetch one execution for that)
+export type ExecutionSummary = Omit<Execution, 'result'>;
+
+export interface ExecutionListParams {
+  limit?: number;
+  cursor?: string;
+  status?: ExecutionStatus;
+  workflow_config_id?: number;
+  created_from?: string; // ISO datetime, inclusive
+  created_to?: string; // ISO datetime, exclusive
+}
+
+export interface ExecutionPage {
+  items: ExecutionSummary[];
+  next_cursor: string | null;
+}
+
 export interface ExecutionCreate {
   workflow_config_id?: number; // Optional - will use default if not provided
   keywords: string;
@@ -105,6 +131,30 @@ export interface ExecutionCreate {
   preset_name?: string; // Name for the preset if saving
 }
 
+// Batch of executions: explicit pairs and/or every keyword x every location
+export interface ExecutionBatchCreate {
+  workflow_config_id?: number;
+  pairs?: { keywords: string; location: string }[];
+  keywords?: string[];
+  locations?: string[];
+}
+
+export interface ExecutionBatchItem {
+  id: number;
+  keywords: string;
+  location: string;
+  n8n_execution_id?: string;
+  status: ExecutionStatus;
+}
+
+export interface ExecutionBatchResponse {
+  workflow_config_id: number;
+  execution_ids: number[];
+  total: number;
+  failed: number;
+  executions: ExecutionBatchItem[];
+}
+
 // Linkedin results (business data rows) returned from /linkedin-results
 export interface LinkedinResult {
   id: number;